@@ -3,10 +3,11 @@
 Предоставляет бизнес-логику для работы с контактами Bitrix24.
 """
 
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, cast
 
-
 from src.domain.entities.contact import Contact
+from src.domain.entities.lazy_entity import LazyEntity
 from src.infrastructure.bitrix.repository_factory import BitrixRepositoryFactory
 
 if TYPE_CHECKING:
@@ -48,10 +49,12 @@ class ContactService:
         """Поиск контактов по различным критериям.
 
         :param query: Поисковый запрос
-        :param search_type: Тип поиска (name, phone, email)
+        :param search_type: Тип поиска (name, phone, email, fuzzy)
         :param limit: Максимальное количество результатов
         :return: Список объектов контактов
         """
+        if search_type == "fuzzy":
+            return await self._contact_repository.search_fuzzy(query, limit)
         if search_type == "phone":
             return await self._contact_repository.search_by_phone(
                 query,
@@ -71,22 +74,56 @@ class ContactService:
         self,
         limit: int = 50,
         company_id: int | None = None,
+        extra_fields: list[str] | None = None,
     ) -> list[Contact]:
         """Получение списка контактов с возможностью фильтрации.
 
         :param limit: Максимальное количество результатов
         :param company_id: Идентификатор компании для фильтрации (опционально)
+        :param extra_fields: Дополнительные поля контакта (например, UF_CRM_*)
         :return: Список объектов контактов
         """
+        return await self._contact_repository.list_entities(
+            filter_params=self._build_contact_filter(company_id),
+            limit=limit,
+            extra_fields=extra_fields,
+        )
+
+    def iter_contact_rows(
+        self,
+        limit: int = -1,
+        company_id: int | None = None,
+        extra_fields: list[str] | None = None,
+    ) -> AsyncIterator[LazyEntity[Contact]]:
+        """Потоковое получение контактов в виде ленивых оберток.
+
+        Поля контакта, в том числе мультиполя EMAIL и PHONE,
+        преобразуются только при обращении к ним.
+
+        :param limit: Максимальное количество результатов (-1 - все контакты)
+        :param company_id: Идентификатор компании для фильтрации (опционально)
+        :param extra_fields: Дополнительные поля контакта (например, UF_CRM_*)
+        :return: Асинхронный итератор по ленивым контактам
+        """
+        return self._contact_repository.iter_entity_rows(
+            filter_params=self._build_contact_filter(company_id),
+            limit=limit,
+            extra_fields=extra_fields,
+        )
+
+    @staticmethod
+    def _build_contact_filter(company_id: int | None = None) -> dict[str, int]:
+        """Формирование фильтра для списка контактов.
+
+        :param company_id: Идентификатор компании для фильтрации (опционально)
+        :return: Параметры фильтрации
+        """
         filter_params = {}
 
         if company_id:
             filter_params["COMPANY_ID"] = company_id
 
-        return await self._contact_repository.list_entities(
-            filter_params=filter_params,
-            limit=limit,
-        )
+        return filter_params
 
     async def get_deal_contacts(self, deal_id: int) -> list[Contact]:
         """Получение контактов, связанных со сделкой.
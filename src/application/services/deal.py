@@ -3,10 +3,11 @@
 Предоставляет бизнес-логику для работы со сделками Bitrix24.
 """
 
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Any, cast
 
-
 from src.domain.entities.deal import Deal
+from src.domain.entities.lazy_entity import LazyEntity
 from src.infrastructure.bitrix.repository_factory import BitrixRepositoryFactory
 
 if TYPE_CHECKING:
@@ -47,12 +48,14 @@ class DealService:
         """
         return await self._deal_repository.get_by_id(deal_id)
 
-    async def list_deals(
+    async def list_deals(  # noqa: PLR0913, PLR0917
         self,
         active_only: bool = False,
         contact_id: int | None = None,
         company_id: int | None = None,
         limit: int = 50,
+        with_contacts: bool = True,
+        extra_fields: list[str] | None = None,
     ) -> list[Deal]:
         """Получение списка сделок с возможностью фильтрации.
 
@@ -60,8 +63,69 @@ class DealService:
         :param contact_id: Идентификатор контакта для фильтрации (опционально)
         :param company_id: Идентификатор компании для фильтрации (опционально)
         :param limit: Максимальное количество результатов
+        :param with_contacts: Загружать идентификаторы связанных контактов
+        :param extra_fields: Дополнительные поля сделки (например, UF_CRM_*)
         :return: Список объектов сделок
         """
+        return await self._deal_repository.list_entities(
+            filter_params=self._build_deal_filter(
+                active_only,
+                contact_id,
+                company_id,
+            ),
+            order={"DATE_CREATE": "DESC"},
+            limit=limit,
+            with_contacts=with_contacts,
+            extra_fields=extra_fields,
+        )
+
+    def iter_deal_rows(  # noqa: PLR0913, PLR0917
+        self,
+        active_only: bool = False,
+        contact_id: int | None = None,
+        company_id: int | None = None,
+        limit: int = -1,
+        with_contacts: bool = True,
+        extra_fields: list[str] | None = None,
+    ) -> AsyncIterator[LazyEntity[Deal]]:
+        """Потоковое получение сделок в виде ленивых оберток.
+
+        Подходит для выгрузок, которые в основном сериализуются
+        в JSON: поля сделки преобразуются только при обращении к ним.
+
+        :param active_only: Только активные сделки
+        :param contact_id: Идентификатор контакта для фильтрации (опционально)
+        :param company_id: Идентификатор компании для фильтрации (опционально)
+        :param limit: Максимальное количество результатов (-1 - все сделки)
+        :param with_contacts: Загружать идентификаторы связанных контактов
+        :param extra_fields: Дополнительные поля сделки (например, UF_CRM_*)
+        :return: Асинхронный итератор по ленивым сделкам
+        """
+        return self._deal_repository.iter_deal_rows(
+            filter_params=self._build_deal_filter(
+                active_only,
+                contact_id,
+                company_id,
+            ),
+            order={"DATE_CREATE": "DESC"},
+            limit=limit,
+            with_contacts=with_contacts,
+            extra_fields=extra_fields,
+        )
+
+    @staticmethod
+    def _build_deal_filter(
+        active_only: bool = False,
+        contact_id: int | None = None,
+        company_id: int | None = None,
+    ) -> dict[str, Any]:
+        """Формирование фильтра для списка сделок.
+
+        :param active_only: Только активные сделки
+        :param contact_id: Идентификатор контакта для фильтрации (опционально)
+        :param company_id: Идентификатор компании для фильтрации (опционально)
+        :return: Параметры фильтрации
+        """
         filter_params: dict[str, Any] = {}
 
         if active_only:
@@ -77,11 +141,16 @@ class DealService:
         if company_id:
             filter_params["COMPANY_ID"] = company_id
 
-        return await self._deal_repository.list_entities(
-            filter_params=filter_params,
-            order={"DATE_CREATE": "DESC"},
-            limit=limit,
-        )
+        return filter_params
+
+    async def search_deals(self, query: str, limit: int = 10) -> list[Deal]:
+        """Нечеткий поиск сделок по названию.
+
+        :param query: Поисковый запрос
+        :param limit: Максимальное количество результатов
+        :return: Список объектов сделок по убыванию сходства
+        """
+        return await self._deal_repository.search_fuzzy(query, limit)
 
     async def update_deal_stage(self, deal_id: int, stage_id: str) -> bool:
         """Обновление стадии сделки.
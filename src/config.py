@@ -4,7 +4,7 @@
 """
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import ClassVar
 
 
@@ -14,10 +14,56 @@ class Settings:
 
     :param bitrix_webhook_url: URL вебхука Bitrix24.
     :param log_level: Уровень логирования (DEBUG, INFO, WARNING, ERROR, CRITICAL).
+    :param bitrix_rate_limit: Максимальная частота запросов к Bitrix24
+                              в секунду.
+    :param bitrix_rate_burst: Количество запросов к Bitrix24, которое можно
+                              выполнить подряд без ожидания.
+    :param bitrix_circuit_failure_threshold: Доля неудачных запросов
+                                             к Bitrix24, после которой
+                                             запросы приостанавливаются.
+    :param bitrix_circuit_open_timeout: Время в секундах, на которое
+                                        приостанавливаются запросы
+                                        к недоступному Bitrix24.
+    :param entity_cache_size: Максимальное количество сущностей в кэше
+                              (0 - кэш отключен).
+    :param entity_cache_ttl: Время жизни сущностей в кэше в секундах.
+    :param metadata_cache_ttl: Время в секундах, после которого кэшированные
+                               метаданные (категории, стадии, поля)
+                               обновляются в фоне.
+    :param replica_path: Путь к файлу SQLite локальной реплики
+                         (пустая строка - реплика отключена).
+    :param replica_sync_interval: Интервал синхронизации реплики в секундах.
+    :param replica_reconcile_interval: Интервал сверки идентификаторов реплики
+                                       с Bitrix24 для обнаружения удалений
+                                       в секундах.
+    :param tool_deadline: Время на выполнение вызова инструмента MCP
+                          в секундах (0 - без ограничения).
+    :param tool_deadlines: Время на выполнение отдельных инструментов
+                           в секундах по их именам.
     """
 
     BITRIX_WEBHOOK_URL: str
     LOG_LEVEL: str = "INFO"
+    BITRIX_RATE_LIMIT: float = 2.0
+    BITRIX_RATE_BURST: int = 50
+    BITRIX_CIRCUIT_FAILURE_THRESHOLD: float = 0.5
+    BITRIX_CIRCUIT_OPEN_TIMEOUT: float = 30.0
+    ENTITY_CACHE_SIZE: int = 1024
+    ENTITY_CACHE_TTL: float = 120.0
+    METADATA_CACHE_TTL: float = 3600.0
+    REPLICA_PATH: str = ""
+    REPLICA_SYNC_INTERVAL: float = 300.0
+    REPLICA_RECONCILE_INTERVAL: float = 900.0
+    TOOL_DEADLINE: float = 50.0
+    TOOL_DEADLINES: dict[str, float] = field(default_factory=dict)
+
+    def get_tool_deadline(self, tool_name: str) -> float:
+        """Время на выполнение вызова инструмента.
+
+        :param tool_name: Имя инструмента
+        :return: Время в секундах (0 - без ограничения)
+        """
+        return self.TOOL_DEADLINES.get(tool_name, self.TOOL_DEADLINE)
 
 
 class SettingsManager:
@@ -37,6 +83,36 @@ class SettingsManager:
         if cls._instance is None:
             webhook_url = os.getenv("BITRIX_WEBHOOK_URL")
             log_level = os.getenv("LOG_LEVEL", "INFO")
+            bitrix_rate_limit = float(os.getenv("BITRIX_RATE_LIMIT", "2"))
+            bitrix_rate_burst = int(os.getenv("BITRIX_RATE_BURST", "50"))
+            bitrix_circuit_failure_threshold = float(
+                os.getenv("BITRIX_CIRCUIT_FAILURE_THRESHOLD", "0.5"),
+            )
+            bitrix_circuit_open_timeout = float(
+                os.getenv("BITRIX_CIRCUIT_OPEN_TIMEOUT", "30"),
+            )
+            entity_cache_size = int(os.getenv("ENTITY_CACHE_SIZE", "1024"))
+            entity_cache_ttl = float(os.getenv("ENTITY_CACHE_TTL", "120"))
+            metadata_cache_ttl = float(
+                os.getenv("METADATA_CACHE_TTL", "3600"),
+            )
+            replica_path = os.getenv("REPLICA_PATH", "")
+            replica_sync_interval = float(
+                os.getenv("REPLICA_SYNC_INTERVAL", "300"),
+            )
+            replica_reconcile_interval = float(
+                os.getenv("REPLICA_RECONCILE_INTERVAL", "900"),
+            )
+            tool_deadline = float(os.getenv("TOOL_DEADLINE", "50"))
+            # Значения по инструментам через запятую, например list_deals=120
+            tool_deadlines = {
+                name.strip(): float(value)
+                for name, _, value in (
+                    item.partition("=")
+                    for item in os.getenv("TOOL_DEADLINES", "").split(",")
+                )
+                if name.strip() and value.strip()
+            }
 
             if not webhook_url:
                 msg = (
@@ -48,6 +124,18 @@ class SettingsManager:
             cls._instance = Settings(
                 BITRIX_WEBHOOK_URL=webhook_url,
                 LOG_LEVEL=log_level,
+                BITRIX_RATE_LIMIT=bitrix_rate_limit,
+                BITRIX_RATE_BURST=bitrix_rate_burst,
+                BITRIX_CIRCUIT_FAILURE_THRESHOLD=bitrix_circuit_failure_threshold,
+                BITRIX_CIRCUIT_OPEN_TIMEOUT=bitrix_circuit_open_timeout,
+                ENTITY_CACHE_SIZE=entity_cache_size,
+                ENTITY_CACHE_TTL=entity_cache_ttl,
+                METADATA_CACHE_TTL=metadata_cache_ttl,
+                REPLICA_PATH=replica_path,
+                REPLICA_SYNC_INTERVAL=replica_sync_interval,
+                REPLICA_RECONCILE_INTERVAL=replica_reconcile_interval,
+                TOOL_DEADLINE=tool_deadline,
+                TOOL_DEADLINES=tool_deadlines,
             )
         return cls._instance
 
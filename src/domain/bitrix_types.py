@@ -13,7 +13,7 @@ type BitrixStageID = str
 type BitrixCategoryID = int
 
 
-@dataclass
+@dataclass(slots=True)
 class BitrixMultiField:
     """Представление мультиполей Bitrix24 (EMAIL, PHONE, WEB и т.д.).
 
@@ -38,12 +38,22 @@ class BitrixMultiField:
         :param data: Словарь с данными из API Bitrix24
         :return: Объект мультиполя
         """
-        return cls(
-            value=data.get("VALUE", ""),
-            value_type=data.get("VALUE_TYPE", ""),
-            type_id=data.get("TYPE_ID", ""),
-            id=int(data.get("ID")) if data.get("ID") else None,  # type: ignore[arg-type]
-        )
+        return cls(**cls.fields_from_bitrix(data))
+
+    @staticmethod
+    def fields_from_bitrix(data: dict[str, Any]) -> dict[str, Any]:
+        """Значения полей мультиполя из данных Bitrix24 без создания объекта.
+
+        :param data: Словарь с данными из API Bitrix24
+        :return: Словарь значений полей в порядке их объявления
+        """
+        field_id = data.get("ID")
+        return {
+            "value": data.get("VALUE", ""),
+            "value_type": data.get("VALUE_TYPE", ""),
+            "type_id": data.get("TYPE_ID", ""),
+            "id": int(field_id) if field_id else None,
+        }
 
     def to_bitrix(self) -> dict[str, Any]:
         """Преобразование в формат для API Bitrix24.
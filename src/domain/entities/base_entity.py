@@ -1,18 +1,104 @@
 """Модуль с базовыми классами сущностей Bitrix24.
 
-Содержит абстрактный базовый класс для всех сущностей Bitrix24.
+Содержит абстрактный базовый класс для всех сущностей Bitrix24
+и функции преобразования строковых значений API в типы полей.
 """
 
 import json
+from collections.abc import Callable
 from dataclasses import asdict, dataclass, field
+from functools import cache
 from typing import Any, ClassVar, Self
 
+from src.domain.bitrix_types import BitrixMultiField
 
-@dataclass
+type FieldConverter = Callable[[Any], Any]
+
+
+def parse_id(value: Any) -> Any:
+    """Преобразование строкового идентификатора в число.
+
+    :param value: Значение из API Bitrix24
+    :return: Число, если значение - строка из цифр, иначе исходное значение
+    """
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return value
+
+
+def parse_optional_id(value: Any) -> Any:
+    """Преобразование необязательного идентификатора в число.
+
+    :param value: Значение из API Bitrix24
+    :return: Число для строки из цифр, None для остальных строк,
+             иначе исходное значение
+    """
+    if isinstance(value, str):
+        return int(value) if value.isdigit() else None
+    return value
+
+
+def parse_float(value: Any) -> Any:
+    """Преобразование строковой суммы в число.
+
+    :param value: Значение из API Bitrix24
+    :return: Число (0.0 для некорректной строки) или исходное значение
+    """
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return 0.0
+    return value
+
+
+@cache
+def _compile_from_bitrix(
+    entity_cls: type["BitrixEntity"],
+) -> tuple[tuple[str, str, FieldConverter | None], ...]:
+    """Подготовка преобразования данных Bitrix24 в поля сущности.
+
+    Выполняется один раз для класса сущности.
+
+    :param entity_cls: Класс сущности
+    :return: Поля Bitrix24, поля сущности и функции преобразования значений
+    """
+    mapping = entity_cls._bitrix_field_mapping  # noqa: SLF001
+    converters = entity_cls._bitrix_field_converters  # noqa: SLF001
+    return tuple(
+        (bitrix_field, entity_field, converters.get(entity_field))
+        for bitrix_field, entity_field in mapping.items()
+    )
+
+
+@cache
+def _compile_to_bitrix(
+    entity_cls: type["BitrixEntity"],
+) -> tuple[tuple[str, str], ...]:
+    """Подготовка преобразования полей сущности в поля Bitrix24.
+
+    Выполняется один раз для класса сущности.
+
+    :param entity_cls: Класс сущности
+    :return: Пары из поля сущности и поля Bitrix24
+    """
+    mapping = entity_cls._bitrix_field_mapping  # noqa: SLF001
+    reverse_mapping = {
+        entity_field: bitrix_field
+        for bitrix_field, entity_field in mapping.items()
+    }
+    return tuple(reverse_mapping.items())
+
+
+@dataclass(slots=True)
 class BitrixEntity:
     """Базовый класс для всех сущностей Bitrix24.
 
     Содержит общие атрибуты и методы для всех сущностей Bitrix24.
+    Сущности объявляются со `slots=True`: без `__dict__` у каждого
+    экземпляра реплика и большие выгрузки занимают меньше памяти.
+    В переопределенных методах класса нужен `super(Класс, cls)`,
+    так как `super()` без аргументов не работает в классах со слотами.
     """
 
     id: int
@@ -21,31 +107,86 @@ class BitrixEntity:
     _bitrix_field_mapping: ClassVar[dict[str, str]] = {
         "ID": "id",
     }
+    # Преобразование строковых значений API в типы полей сущности
+    _bitrix_field_converters: ClassVar[dict[str, FieldConverter]] = {
+        "id": parse_id,
+    }
+    # Мультиполя Bitrix24 (EMAIL, PHONE и т.д.) и соответствующие поля сущности
+    _bitrix_multi_fields: ClassVar[dict[str, str]] = {}
+    # Поля Bitrix24, которые обрабатываются вне маппинга (например, мультиполя)
+    _bitrix_extra_select_fields: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def get_select_fields(
+        cls,
+        extra_fields: list[str] | None = None,
+    ) -> list[str]:
+        """Минимальный список полей для выборки из API Bitrix24.
+
+        Содержит только поля, которые используются при создании сущности,
+        вместо всех полей (`*`, `UF_*`).
+
+        :param extra_fields: Дополнительные поля, запрошенные явно
+        :return: Список полей для параметра select
+        """
+        select = [*cls._bitrix_field_mapping, *cls._bitrix_extra_select_fields]
+        for extra_field in extra_fields or []:
+            if extra_field not in select:
+                select.append(extra_field)
+        return select
+
+    @classmethod
+    def pick_additional_fields(
+        cls,
+        data: dict[str, Any],
+        fields: list[str],
+    ) -> dict[str, Any]:
+        """Выбор явно запрошенных дополнительных полей из данных Bitrix24.
+
+        Поддерживает шаблоны с `*` на конце (например, `UF_CRM_*`).
+
+        :param data: Словарь с данными из API Bitrix24
+        :param fields: Запрошенные дополнительные поля
+        :return: Словарь значений дополнительных полей
+        """
+        prefixes = tuple(f[:-1] for f in fields if f.endswith("*"))
+        names = {f for f in fields if not f.endswith("*")}
+        return {
+            key: value
+            for key, value in data.items()
+            if key not in cls._bitrix_field_mapping
+            and key not in cls._bitrix_extra_select_fields
+            and (key in names or (prefixes and key.startswith(prefixes)))
+        }
 
     @classmethod
     def from_bitrix(cls, data: dict[str, Any]) -> Self:
         """Создание объекта из данных Bitrix24.
 
+        Поля выбираются и преобразуются по подготовленному для класса
+        списку (см. `_bitrix_field_mapping` и `_bitrix_field_converters`),
+        так как при загрузке списков метод вызывается для каждой записи.
+
         :param data: Словарь с данными из API Bitrix24
         :return: Объект сущности
         """
         if order_data := data.get("order0000000000"):
             data = order_data
         entity_data = {}
-        additional_fields: dict[str, Any] = {}
 
-        for bitrix_field, entity_field in cls._bitrix_field_mapping.items():
+        for bitrix_field, entity_field, convert in _compile_from_bitrix(cls):
             if bitrix_field in data:
-                entity_data[entity_field] = data[bitrix_field]
-
-        additional_fields = {
-            **additional_fields,
-            **{
-                k: v
-                for k, v in data.items()
-                if k not in cls._bitrix_field_mapping
-            },
-        }
+                value = data[bitrix_field]
+                entity_data[entity_field] = (
+                    value if convert is None else convert(value)
+                )
+
+        for bitrix_field, entity_field in cls._bitrix_multi_fields.items():
+            if bitrix_field in data:
+                entity_data[entity_field] = [
+                    BitrixMultiField.from_bitrix(item)
+                    for item in data[bitrix_field]
+                ]
 
         return cls(**entity_data)
 
@@ -54,15 +195,13 @@ class BitrixEntity:
 
         :return: Словарь для отправки в API
         """
-        data = {}
-
-        reverse_mapping = {v: k for k, v in self._bitrix_field_mapping.items()}
-
-        for entity_field, bitrix_field in reverse_mapping.items():
-            if hasattr(self, entity_field):
-                data[bitrix_field] = getattr(self, entity_field)
+        data = {
+            bitrix_field: getattr(self, entity_field)
+            for entity_field, bitrix_field in _compile_to_bitrix(type(self))
+            if hasattr(self, entity_field)
+        }
 
-        return {**data, **dict(self.additional_fields.items())}
+        return {**data, **self.additional_fields}
 
     def to_str_json(self) -> str:
         """Преобразует объект в json строку.
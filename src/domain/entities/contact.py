@@ -4,13 +4,18 @@
 """
 
 from dataclasses import dataclass, field
-from typing import Any, ClassVar, Self
+from typing import ClassVar
 
 from src.domain.bitrix_types import BitrixDateTime, BitrixID, BitrixMultiField
-from src.domain.entities.base_entity import BitrixEntity
+from src.domain.entities.base_entity import (
+    BitrixEntity,
+    FieldConverter,
+    parse_id,
+    parse_optional_id,
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class Contact(BitrixEntity):
     """Сущность контакта в CRM Bitrix24.
 
@@ -41,61 +46,18 @@ class Contact(BitrixEntity):
         "DATE_CREATE": "date_create",
         "DATE_MODIFY": "date_modify",
     }
-
-    @classmethod
-    def from_bitrix(cls, data: dict[str, Any]) -> Self:
-        """Создание контакта из данных Bitrix24.
-
-        :param data: Словарь с данными из API Bitrix24
-        :return: Объект контакта
-        """
-        contact = super().from_bitrix(data)
-
-        if "EMAIL" in data:
-            contact.email = [
-                BitrixMultiField.from_bitrix(email_data)
-                for email_data in data["EMAIL"]
-            ]
-
-        if "PHONE" in data:
-            contact.phone = [
-                BitrixMultiField.from_bitrix(phone_data)
-                for phone_data in data["PHONE"]
-            ]
-
-        contact._convert_types()  # noqa: SLF001
-
-        return contact
-
-    def _convert_types(self) -> None:
-        """Преобразование строковых значений в соответствующие типы.
-
-        API Битрикса возвращает все в виде строк,
-        поэтому нужно провести корректное преобразование.
-        """
-        if isinstance(self.id, str) and self.id.isdigit():
-            self.id = int(self.id)
-
-        if isinstance(self.company_id, str):
-            if self.company_id.isdigit():
-                self.company_id = int(self.company_id)
-            else:
-                self.company_id = None
-
-        if (
-            isinstance(self.assigned_by_id, str)
-            and self.assigned_by_id.isdigit()
-        ):
-            self.assigned_by_id = int(self.assigned_by_id)
-
-        if isinstance(self.created_by_id, str) and self.created_by_id.isdigit():
-            self.created_by_id = int(self.created_by_id)
-
-        if (
-            isinstance(self.modified_by_id, str)
-            and self.modified_by_id.isdigit()
-        ):
-            self.modified_by_id = int(self.modified_by_id)
+    _bitrix_field_converters: ClassVar[dict[str, FieldConverter]] = {
+        "id": parse_id,
+        "company_id": parse_optional_id,
+        "assigned_by_id": parse_id,
+        "created_by_id": parse_id,
+        "modified_by_id": parse_id,
+    }
+    _bitrix_multi_fields: ClassVar[dict[str, str]] = {
+        "EMAIL": "email",
+        "PHONE": "phone",
+    }
+    _bitrix_extra_select_fields: ClassVar[tuple[str, ...]] = ("EMAIL", "PHONE")
 
     def get_primary_email(self) -> str | None:
         """Получение основного email-адреса контакта.
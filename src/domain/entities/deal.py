@@ -13,10 +13,16 @@ from src.domain.bitrix_types import (
     BitrixID,
     BitrixStageID,
 )
-from src.domain.entities.base_entity import BitrixEntity
+from src.domain.entities.base_entity import (
+    BitrixEntity,
+    FieldConverter,
+    parse_float,
+    parse_id,
+    parse_optional_id,
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class Deal(BitrixEntity):
     """Сущность сделки в CRM Bitrix24.
 
@@ -50,6 +56,15 @@ class Deal(BitrixEntity):
         "DATE_MODIFY": "date_modify",
         "CATEGORY_ID": "category_id",
     }
+    _bitrix_field_converters: ClassVar[dict[str, FieldConverter]] = {
+        "id": parse_id,
+        "company_id": parse_optional_id,
+        "assigned_by_id": parse_id,
+        "created_by_id": parse_id,
+        "modified_by_id": parse_id,
+        "opportunity": parse_float,
+        "category_id": parse_id,
+    }
 
     @classmethod
     def from_bitrix(
@@ -63,59 +78,13 @@ class Deal(BitrixEntity):
         :param contact_ids: Список идентификаторов контактов
         :return: Объект сделки
         """
-        deal = super().from_bitrix(data)
+        deal = super(Deal, cls).from_bitrix(data)
 
         if contact_ids is not None:
             deal.contact_ids = contact_ids
 
-        deal._convert_types()  # noqa: SLF001
-
         return deal
 
-    def _convert_types(self) -> None:
-        """Преобразование строковых значений в соответствующие типы.
-
-        API Битрикса возвращает все в виде строк,
-        поэтому нужно провести корректное преобразование.
-        """
-        if isinstance(self.id, str) and self.id.isdigit():
-            self.id = int(self.id)
-
-        if isinstance(self.company_id, str):
-            if self.company_id.isdigit():
-                self.company_id = int(self.company_id)
-            else:
-                self.company_id = None
-
-        if isinstance(self.opportunity, str):
-            try:
-                self.opportunity = float(self.opportunity)
-            except ValueError:
-                self.opportunity = 0.0
-
-        if (
-            isinstance(self.assigned_by_id, str)
-            and self.assigned_by_id.isdigit()
-        ):
-            self.assigned_by_id = int(self.assigned_by_id)
-
-        if isinstance(self.created_by_id, str) and self.created_by_id.isdigit():
-            self.created_by_id = int(self.created_by_id)
-
-        if (
-            isinstance(self.modified_by_id, str)
-            and self.modified_by_id.isdigit()
-        ):
-            self.modified_by_id = int(self.modified_by_id)
-
-        if isinstance(self.category_id, str) and self.category_id.isdigit():
-            self.category_id = int(self.category_id)
-
-        if isinstance(self.contact_ids, str):
-            self.contact_ids = [
-                int(iid) for iid in self.contact_ids.split(",") if iid.isdigit()
-            ]
-
     def is_active(self) -> bool:
         """Проверка, является ли сделка активной.
 
@@ -0,0 +1,275 @@
+"""Модуль с ленивым представлением сущностей Bitrix24.
+
+Содержит обертку над записью из API Bitrix24, которая преобразует
+поля сущности только при обращении к ним.
+"""
+
+from collections.abc import Callable
+from dataclasses import MISSING, dataclass, fields
+from functools import cache
+from inspect import isfunction
+from types import MethodType
+from typing import Any
+
+from src.domain.bitrix_types import BitrixMultiField
+from src.domain.entities.base_entity import BitrixEntity, FieldConverter
+
+
+@dataclass(frozen=True, slots=True)
+class _FieldSpec:
+    """Способ получения значения поля сущности из записи Bitrix24.
+
+    :param bitrix_field: Поле Bitrix24 (None, если поле не загружается из API)
+    :param convert: Функция преобразования значения
+    :param multi: Поле Bitrix24 является мультиполем
+    :param required: У поля нет значения по умолчанию
+    :param default: Значение по умолчанию
+    :param default_factory: Функция создания значения по умолчанию
+    """
+
+    bitrix_field: str | None
+    convert: FieldConverter | None = None
+    multi: bool = False
+    required: bool = False
+    default: Any = None
+    default_factory: Callable[[], Any] | None = None
+
+    def get_default(self) -> Any:
+        """Значение по умолчанию для отсутствующего в записи поля.
+
+        :return: Значение по умолчанию
+        """
+        if self.default_factory is not None:
+            return self.default_factory()
+        return self.default
+
+
+@cache
+def _get_field_specs(
+    entity_cls: type[BitrixEntity],
+) -> dict[str, _FieldSpec]:
+    """Подготовка описаний полей класса сущности.
+
+    Выполняется один раз для класса сущности.
+
+    :param entity_cls: Класс сущности
+    :return: Описания полей в порядке их объявления
+    """
+    mapping = entity_cls._bitrix_field_mapping  # noqa: SLF001
+    multi_mapping = entity_cls._bitrix_multi_fields  # noqa: SLF001
+    bitrix_fields = {
+        entity_field: bitrix_field
+        for bitrix_field, entity_field in mapping.items()
+    }
+    multi_fields = {
+        entity_field: bitrix_field
+        for bitrix_field, entity_field in multi_mapping.items()
+    }
+    converters = entity_cls._bitrix_field_converters  # noqa: SLF001
+
+    specs = {}
+    for entity_field in fields(entity_cls):
+        name = entity_field.name
+        default = entity_field.default
+        default_factory = entity_field.default_factory
+        defaults: dict[str, Any] = {
+            "required": default is MISSING and default_factory is MISSING,
+            "default": None if default is MISSING else default,
+            "default_factory": (
+                None if default_factory is MISSING else default_factory
+            ),
+        }
+        if name in multi_fields:
+            specs[name] = _FieldSpec(multi_fields[name], multi=True, **defaults)
+        else:
+            specs[name] = _FieldSpec(
+                bitrix_fields.get(name),
+                converters.get(name),
+                **defaults,
+            )
+    return specs
+
+
+@cache
+def _get_required_fields(
+    entity_cls: type[BitrixEntity],
+) -> tuple[tuple[str, str | None], ...]:
+    """Поля сущности без значений по умолчанию.
+
+    :param entity_cls: Класс сущности
+    :return: Пары из поля сущности и поля Bitrix24
+    """
+    return tuple(
+        (name, spec.bitrix_field)
+        for name, spec in _get_field_specs(entity_cls).items()
+        if spec.required
+    )
+
+
+def _multi_fields_to_dicts(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Значения полей мультиполей из данных Bitrix24.
+
+    :param items: Значения мультиполя из API Bitrix24
+    :return: Словари значений полей `BitrixMultiField`
+    """
+    return [BitrixMultiField.fields_from_bitrix(item) for item in items]
+
+
+def _fields_to_dict(
+    entity_cls: type[BitrixEntity],
+    data: dict[str, Any],
+    values: dict[str, Any],
+) -> dict[str, Any]:
+    """Получение значений полей сущности из записи.
+
+    :param entity_cls: Класс сущности
+    :param data: Запись из API Bitrix24
+    :param values: Уже известные значения полей
+    :return: Словарь значений полей в порядке их объявления
+    """
+    result = {}
+    for name, spec in _get_field_specs(entity_cls).items():
+        # Мультиполя берутся из записи: среди известных значений
+        # они могут быть уже преобразованы в объекты
+        if spec.multi and spec.bitrix_field in data:
+            result[name] = _multi_fields_to_dicts(data[spec.bitrix_field])
+        elif name in values:
+            result[name] = values[name]
+        elif spec.bitrix_field is None or spec.bitrix_field not in data:
+            result[name] = spec.get_default()
+        elif spec.convert is not None:
+            result[name] = spec.convert(data[spec.bitrix_field])
+        else:
+            result[name] = data[spec.bitrix_field]
+    return result
+
+
+class LazyEntity[T: BitrixEntity]:
+    """Сущность Bitrix24, поля которой преобразуются при обращении.
+
+    Обертка хранит исходную запись API и предоставляет те же поля
+    и методы, что и сущность `T`, но преобразует значение поля
+    (типы, мультиполя) только при первом обращении к нему. Для списков,
+    из которых большинство записей только подсчитываются или
+    сериализуются обратно в JSON, это позволяет не создавать объект
+    сущности на каждую запись: `to_dict` передает значения, не
+    требующие преобразования, без изменений.
+
+    Обертка предназначена только для чтения; исходная запись
+    не изменяется. Объект сущности создается методом `materialize`.
+    """
+
+    __slots__ = ("_data", "_entity_cls", "_values")
+
+    def __init__(
+        self,
+        entity_cls: type[T],
+        data: dict[str, Any],
+        **values: Any,
+    ):
+        """Инициализация обертки.
+
+        :param entity_cls: Класс сущности
+        :param data: Запись из API Bitrix24
+        :param values: Значения полей, полученные не из записи
+                       (например, `contact_ids` или `additional_fields`)
+        :raises ValueError: Если в записи нет обязательного поля сущности
+        """
+        if order_data := data.get("order0000000000"):
+            data = order_data
+
+        for name, bitrix_field in _get_required_fields(entity_cls):
+            if name not in values and bitrix_field not in data:
+                msg = f"В записи нет обязательного поля {bitrix_field}"
+                raise ValueError(msg)
+
+        self._entity_cls = entity_cls
+        self._data = data
+        self._values: dict[str, Any] = values
+
+    def __getattr__(self, name: str) -> Any:
+        """Получение поля сущности с преобразованием при первом обращении.
+
+        Методы сущности вызываются для обертки, поэтому тоже
+        преобразуют только используемые ими поля.
+
+        :param name: Имя поля или метода
+        :return: Значение поля или метод
+        :raises AttributeError: Если у сущности нет такого атрибута
+        """
+        spec = _get_field_specs(self._entity_cls).get(name)
+        if spec is None:
+            attribute = getattr(self._entity_cls, name)
+            if isfunction(attribute):
+                return MethodType(attribute, self)
+            return attribute
+
+        if name in self._values:
+            return self._values[name]
+        value = self._values[name] = self._decode(spec)
+        return value
+
+    def __repr__(self) -> str:
+        """Строковое представление обертки."""
+        return f"LazyEntity({self._entity_cls.__name__}, id={self.id!r})"
+
+    @property
+    def entity_cls(self) -> type[T]:
+        """Класс сущности."""
+        return self._entity_cls
+
+    def materialize(self) -> T:
+        """Создание объекта сущности со всеми преобразованными полями.
+
+        :return: Новый объект сущности
+        """
+        return self._entity_cls(
+            **{
+                name: getattr(self, name)
+                for name in _get_field_specs(self._entity_cls)
+            },
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Значения полей сущности для сериализации.
+
+        Значения, не требующие преобразования, передаются из записи
+        без изменений, мультиполя - словарями без создания объектов.
+        Результат совпадает со словарем полей объекта сущности.
+
+        :return: Словарь значений полей в порядке их объявления
+        """
+        return _fields_to_dict(self._entity_cls, self._data, self._values)
+
+    def to_bitrix(self) -> dict[str, Any]:
+        """Преобразование в формат для API Bitrix24.
+
+        Выполняется через объект сущности, так как значения полей
+        передаются в API в преобразованном виде.
+
+        :return: Словарь для отправки в API
+        """
+        return self.materialize().to_bitrix()
+
+    def to_str_json(self) -> str:
+        """Преобразование в json строку.
+
+        :return: Строка, совпадающая со строкой объекта сущности
+        """
+        return self.materialize().to_str_json()
+
+    def _decode(self, spec: _FieldSpec) -> Any:
+        """Преобразование значения поля из записи.
+
+        :param spec: Описание поля
+        :return: Значение поля
+        """
+        if spec.bitrix_field not in self._data:
+            return spec.get_default()
+
+        value = self._data[spec.bitrix_field]
+        if spec.multi:
+            return [BitrixMultiField.from_bitrix(item) for item in value]
+        if spec.convert is None:
+            return value
+        return spec.convert(value)
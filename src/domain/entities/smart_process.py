@@ -7,10 +7,15 @@ from dataclasses import dataclass, field
 from typing import Any, ClassVar, Self
 
 from src.domain.bitrix_types import BitrixDateTime, BitrixID, BitrixStageID
-from src.domain.entities.base_entity import BitrixEntity
+from src.domain.entities.base_entity import (
+    BitrixEntity,
+    FieldConverter,
+    parse_id,
+    parse_optional_id,
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class SmartProcess(BitrixEntity):
     """Сущность смарт-процесса в CRM Bitrix24.
 
@@ -41,6 +46,14 @@ class SmartProcess(BitrixEntity):
         "DATE_MODIFY": "date_modify",
         "TYPE_ID": "type_id",
     }
+    _bitrix_field_converters: ClassVar[dict[str, FieldConverter]] = {
+        "id": parse_id,
+        "type_id": parse_id,
+        "company_id": parse_optional_id,
+        "assigned_by_id": parse_id,
+        "created_by_id": parse_id,
+        "modified_by_id": parse_id,
+    }
 
     @classmethod
     def from_bitrix(
@@ -54,53 +67,13 @@ class SmartProcess(BitrixEntity):
         :param contact_ids: Список идентификаторов контактов
         :return: Объект смарт-процесса
         """
-        smart_process = super().from_bitrix(data)
+        smart_process = super(SmartProcess, cls).from_bitrix(data)
 
         if contact_ids is not None:
             smart_process.contact_ids = contact_ids
 
-        smart_process._convert_types()  # noqa: SLF001
-
         return smart_process
 
-    def _convert_types(self) -> None:
-        """Преобразование строковых значений в соответствующие типы.
-
-        API Битрикса возвращает все в виде строк,
-        поэтому нужно провести корректное преобразование.
-        """
-        if isinstance(self.id, str) and self.id.isdigit():
-            self.id = int(self.id)
-
-        if isinstance(self.type_id, str) and self.type_id.isdigit():
-            self.type_id = int(self.type_id)
-
-        if isinstance(self.company_id, str):
-            if self.company_id.isdigit():
-                self.company_id = int(self.company_id)
-            else:
-                self.company_id = None
-
-        if (
-            isinstance(self.assigned_by_id, str)
-            and self.assigned_by_id.isdigit()
-        ):
-            self.assigned_by_id = int(self.assigned_by_id)
-
-        if isinstance(self.created_by_id, str) and self.created_by_id.isdigit():
-            self.created_by_id = int(self.created_by_id)
-
-        if (
-            isinstance(self.modified_by_id, str)
-            and self.modified_by_id.isdigit()
-        ):
-            self.modified_by_id = int(self.modified_by_id)
-
-        if isinstance(self.contact_ids, str):
-            self.contact_ids = [
-                int(iid) for iid in self.contact_ids.split(",") if iid.isdigit()
-            ]
-
     def is_active(self) -> bool:
         """Проверка, является ли смарт-процесс активным.
 
@@ -49,6 +49,13 @@ class BitrixRepository[T: BitrixEntity](ABC):
         :return: Словарь с описанием полей сущности
         """
 
+    async def warm_up_metadata(self) -> None:
+        """Предварительная загрузка метаданных сущности в кэш.
+
+        По умолчанию загружается описание полей сущности.
+        """
+        await self.get_fields()
+
     def supports_entity_type(self, entity_type: str) -> bool:
         """Проверяет, поддерживает ли репозиторий указанный тип сущности.
 
@@ -10,7 +10,11 @@ from fast_bitrix24 import Bitrix
 
 from src.domain.entities.contact import Contact
 from src.domain.interfaces.base_repository import BitrixRepository
+from src.infrastructure.bitrix.cache import EntityCache, MetadataCache
+from src.infrastructure.bitrix.circuit_breaker import CircuitBreaker
+from src.infrastructure.bitrix.rate_limiter import AdaptiveRateLimiter
 from src.infrastructure.logging.logger import logger
+from src.infrastructure.replica.storage import ReplicaStorage
 
 from .mixins import (
     BitrixBatchOperationsMixin,
@@ -25,9 +29,9 @@ from .mixins import (
 class BitrixContactRepository(
     BitrixReadMixin[Contact],
     BitrixWriteMixin[Contact],
+    BitrixPaginationMixin,
     BitrixBatchOperationsMixin,
     BitrixFilterBuilderMixin,
-    BitrixPaginationMixin,
     BitrixRelationshipMixin,
     BitrixRepository,
 ):
@@ -48,17 +52,42 @@ class BitrixContactRepository(
     _entity_factory: type[Contact] = Contact
 
     _company_items_method: ClassVar[str] = "crm.contact.company.items.get"
+    _deal_contact_items_method: ClassVar[str] = "crm.deal.contact.items.get"
 
-    def __init__(self, bitrix: Bitrix):
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        bitrix: Bitrix,
+        entity_cache: EntityCache | None = None,
+        metadata_cache: MetadataCache | None = None,
+        replica: ReplicaStorage | None = None,
+        rate_limiter: AdaptiveRateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+    ):
         """Инициализация репозитория.
 
         :param bitrix: Клиент для работы с API Bitrix24
+        :param entity_cache: Кэш сущностей (опционально)
+        :param metadata_cache: Кэш метаданных (опционально)
+        :param replica: Локальная реплика (опционально)
+        :param rate_limiter: Общий ограничитель частоты запросов (опционально)
+        :param circuit_breaker: Общий выключатель запросов (опционально)
         """
-        super().__init__(bitrix=bitrix)
+        super().__init__(
+            bitrix=bitrix,
+            entity_cache=entity_cache,
+            metadata_cache=metadata_cache,
+            replica=replica,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+        )
 
     async def search_by_name(self, name: str, limit: int = 10) -> list[Contact]:
         """Поиск контактов по имени.
 
+        Если загружена локальная реплика, поиск выполняется по индексу
+        слов имени, фамилии и отчества (с поиском по началу слова),
+        иначе через `$SEARCH` в API.
+
         :param name: Строка для поиска
         :param limit: Максимальное количество результатов
         :return: Список объектов контактов
@@ -66,6 +95,10 @@ class BitrixContactRepository(
         error_message = f"Ошибка при поиске контактов по имени '{name}'"
 
         try:
+            contacts = await self._search_replica("name", name, limit)
+            if contacts is not None:
+                return contacts
+
             filter_params = {
                 "$SEARCH": name,
                 "CHECK_PERMISSIONS": "N",
@@ -79,6 +112,29 @@ class BitrixContactRepository(
             logger.error(f"{error_message}: {e}")
             return []
 
+    async def search_fuzzy(self, query: str, limit: int = 10) -> list[Contact]:
+        """Нечеткий поиск контактов по полному имени.
+
+        Выполняется по триграммному индексу локальной реплики и находит
+        имена с опечатками и неполные имена. Если реплика не загружена,
+        выполняется обычный поиск по имени через API.
+
+        :param query: Строка для поиска
+        :param limit: Максимальное количество результатов
+        :return: Список объектов контактов по убыванию сходства
+        """
+        error_message = f"Ошибка при нечетком поиске контактов '{query}'"
+
+        try:
+            contacts = await self._search_replica("fuzzy", query, limit)
+        except Exception as e:
+            logger.error(f"{error_message}: {e}")
+            return []
+
+        if contacts is not None:
+            return contacts
+        return await self.search_by_name(query, limit)
+
     async def search_by_phone(
         self,
         phone: str,
@@ -86,6 +142,11 @@ class BitrixContactRepository(
     ) -> list[Contact]:
         """Поиск контактов по номеру телефона.
 
+        Если загружена локальная реплика, номер ищется по индексу
+        номеров в формате E.164, поэтому формат записи номера не важен.
+        Если в индексе номер не найден (например, контакт еще
+        не синхронизирован), поиск выполняется через API.
+
         :param phone: Номер телефона для поиска
         :param limit: Максимальное количество результатов
         :return: Список объектов контактов
@@ -93,6 +154,10 @@ class BitrixContactRepository(
         error_message = f"Ошибка при поиске контактов по телефону '{phone}'"
 
         try:
+            contacts = await self._search_replica("phone", phone, limit)
+            if contacts:
+                return contacts
+
             filter_params = {
                 "PHONE": phone,
                 "CHECK_PERMISSIONS": "N",
@@ -101,6 +166,7 @@ class BitrixContactRepository(
             return await self.list_entities(
                 filter_params=filter_params,
                 limit=limit,
+                use_replica=False,
             )
         except Exception as e:
             logger.error(f"{error_message}: {e}")
@@ -113,6 +179,10 @@ class BitrixContactRepository(
     ) -> list[Contact]:
         """Поиск контактов по email.
 
+        Если загружена локальная реплика, email ищется по индексу
+        без учета регистра. Если в индексе email не найден, поиск
+        выполняется через API.
+
         :param email: Email для поиска
         :param limit: Максимальное количество результатов
         :return: Список объектов контактов
@@ -120,6 +190,10 @@ class BitrixContactRepository(
         error_message = f"Ошибка при поиске контактов по email '{email}'"
 
         try:
+            contacts = await self._search_replica("email", email, limit)
+            if contacts:
+                return contacts
+
             filter_params = {
                 "EMAIL": email,
                 "CHECK_PERMISSIONS": "N",
@@ -128,6 +202,7 @@ class BitrixContactRepository(
             return await self.list_entities(
                 filter_params=filter_params,
                 limit=limit,
+                use_replica=False,
             )
         except Exception as e:
             logger.error(f"{error_message}: {e}")
@@ -141,25 +216,109 @@ class BitrixContactRepository(
         """
         error_message = f"Ошибка при получении контактов сделки ID={deal_id}"
 
+        try:
+            contact_ids = await self.get_deal_contact_ids(deal_id)
+
+            return await self._load_contacts_by_ids(contact_ids)
+        except Exception as e:
+            logger.error(f"{error_message}: {e}")
+            return []
+
+    async def get_deal_contact_ids(self, deal_id: int) -> list[int]:
+        """Получение идентификаторов контактов, связанных со сделкой.
+
+        В отличие от `get_deal_contacts` не загружает сами контакты.
+
+        :param deal_id: Идентификатор сделки
+        :return: Список идентификаторов контактов
+        """
+        if self._replica is not None and self._replica_ready("deal"):
+            contact_ids = await self._replica.get_deal_contact_ids([deal_id])
+            return contact_ids[deal_id]
+
+        error_message = (
+            f"Ошибка при получении идентификаторов контактов сделки ID={deal_id}"
+        )
+
         try:
             contacts_result = await self.get_related_items(
-                "crm.deal.contact.items.get",
+                self._deal_contact_items_method,
                 deal_id,
                 error_message,
             )
 
-            if not contacts_result:
-                return []
-
-            contact_ids = [
-                int(contact["CONTACT_ID"]) for contact in contacts_result
-            ]
-
-            return await self._load_contacts_by_ids(contact_ids)
+            return self._extract_contact_ids(contacts_result)
         except Exception as e:
             logger.error(f"{error_message}: {e}")
             return []
 
+    async def get_deals_contact_ids(
+        self,
+        deal_ids: list[int],
+    ) -> dict[int, list[int]]:
+        """Пакетное получение идентификаторов контактов для списка сделок.
+
+        Связи читаются из локальной реплики, если она загружена, иначе
+        запрашиваются одним пакетным запросом вместо отдельных запросов
+        на каждую сделку.
+
+        :param deal_ids: Список идентификаторов сделок
+        :return: Словарь со списками идентификаторов контактов по ID сделки
+        """
+        if self._replica is not None and self._replica_ready("deal"):
+            return await self._replica.get_deal_contact_ids(deal_ids)
+
+        return await self.fetch_deals_contact_ids(deal_ids)
+
+    async def fetch_deals_contact_ids(
+        self,
+        deal_ids: list[int],
+    ) -> dict[int, list[int]]:
+        """Пакетная загрузка идентификаторов контактов сделок из API.
+
+        Сделки, для которых команда пакета завершилась ошибкой,
+        в результат не попадают: пустой список означает, что у сделки
+        нет контактов, а не то, что их не удалось загрузить.
+
+        :param deal_ids: Список идентификаторов сделок
+        :return: Словарь со списками идентификаторов контактов по ID сделки
+        """
+        commands = {
+            f"deal{deal_id}": (
+                self._deal_contact_items_method,
+                {self._id_param_name: deal_id},
+            )
+            for deal_id in dict.fromkeys(deal_ids)
+        }
+        if not commands:
+            return {}
+
+        response = await self.execute_batch_detailed(
+            commands,
+            error_message="Ошибка при пакетном получении контактов сделок",
+        )
+
+        return {
+            int(name.removeprefix("deal")): self._extract_contact_ids(
+                response.result[name] or [],
+            )
+            for name in commands
+            if name in response.result and name not in response.errors
+        }
+
+    @staticmethod
+    def _extract_contact_ids(items: list[dict[str, Any]]) -> list[int]:
+        """Извлечение идентификаторов контактов из ответа items.get.
+
+        :param items: Элементы связи сделки с контактами
+        :return: Список идентификаторов контактов
+        """
+        return [
+            int(item["CONTACT_ID"])
+            for item in items
+            if str(item.get("CONTACT_ID", "")).isdigit()
+        ]
+
     async def _load_contacts_by_ids(
         self,
         contact_ids: list[int],
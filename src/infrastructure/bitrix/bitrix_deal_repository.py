@@ -4,16 +4,23 @@
 а также для работы со связями между сделками и другими сущностями.
 """
 
+import asyncio
+from collections.abc import AsyncIterator
 from typing import Any, ClassVar
 
 from fast_bitrix24 import Bitrix
 
 from src.domain.entities.deal import Deal
+from src.domain.entities.lazy_entity import LazyEntity
 from src.domain.interfaces.base_repository import BitrixRepository
 from src.infrastructure.bitrix.bitrix_contact_repository import (
     BitrixContactRepository,
 )
+from src.infrastructure.bitrix.cache import EntityCache, MetadataCache
+from src.infrastructure.bitrix.circuit_breaker import CircuitBreaker
+from src.infrastructure.bitrix.rate_limiter import AdaptiveRateLimiter
 from src.infrastructure.logging.logger import logger
+from src.infrastructure.replica.storage import ReplicaStorage
 
 from .mixins import (
     BitrixBatchOperationsMixin,
@@ -28,9 +35,9 @@ from .mixins import (
 class BitrixDealRepository(
     BitrixReadMixin[Deal],
     BitrixWriteMixin[Deal],
+    BitrixPaginationMixin,
     BitrixBatchOperationsMixin,
     BitrixFilterBuilderMixin,
-    BitrixPaginationMixin,
     BitrixRelationshipMixin,
     BitrixRepository,
 ):
@@ -58,31 +65,58 @@ class BitrixDealRepository(
         "crm.dealcategory.stage.list"
     )
 
-    def __init__(
+    _default_order: ClassVar[dict[str, str]] = {"DATE_CREATE": "DESC"}
+
+    # Стадии сделок меняются чаще данных контактов
+    _cache_ttl: ClassVar[float | None] = 30.0
+
+    def __init__(  # noqa: PLR0913, PLR0917
         self,
         bitrix: Bitrix,
         contact_repository: BitrixContactRepository,
+        entity_cache: EntityCache | None = None,
+        metadata_cache: MetadataCache | None = None,
+        replica: ReplicaStorage | None = None,
+        rate_limiter: AdaptiveRateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
     ):
         """Инициализация репозитория.
 
         :param bitrix: Клиент для работы с API Bitrix24
         :param contact_repository: Репозиторий для работы с контактами
+        :param entity_cache: Кэш сущностей (опционально)
+        :param metadata_cache: Кэш метаданных (опционально)
+        :param replica: Локальная реплика (опционально)
+        :param rate_limiter: Общий ограничитель частоты запросов (опционально)
+        :param circuit_breaker: Общий выключатель запросов (опционально)
         """
-        super().__init__(bitrix=bitrix)
+        super().__init__(
+            bitrix=bitrix,
+            entity_cache=entity_cache,
+            metadata_cache=metadata_cache,
+            replica=replica,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+        )
 
         self.contact_repository = contact_repository
 
     async def get_by_id(self, entity_id: int) -> Deal | None:
         """Получение сделки по её идентификатору.
 
+        Найденная сделка вместе с контактами сохраняется в кэш.
+
         :param entity_id: Идентификатор сделки
         :return: Объект сделки или None, если сделка не найдена
         """
+        if cached := self._get_cached_entity(entity_id):
+            return cached
+
         error_message = f"Ошибка при получении сделки с ID={entity_id}"
 
         try:
             b_response: dict[str, dict[str, Any]] = await self._safe_call(
-                self._bitrix.call,
+                self._call,
                 error_message,
                 {},
                 self._bitrix_get_method,
@@ -93,23 +127,27 @@ class BitrixDealRepository(
             if not deal_data:
                 return None
 
-            contacts = await self.contact_repository.get_deal_contacts(
+            contact_ids = await self.contact_repository.get_deal_contact_ids(
                 entity_id,
             )
-            contact_ids = [contact.id for contact in contacts]
 
-            return self._entity_factory.from_bitrix(deal_data, contact_ids)
+            deal = self._entity_factory.from_bitrix(deal_data, contact_ids)
+            self._cache_entity(entity_id, deal)
         except Exception as e:
             logger.error(f"{error_message}: {e}")
             return None
+        else:
+            return deal
 
-    async def list_entities(
+    async def list_entities(  # noqa: PLR0913, PLR0917
         self,
         filter_params: dict[str, Any] | None = None,
         select_fields: list[str] | None = None,
         order: dict[str, str] | None = None,
         start: int = 0,
         limit: int = 50,
+        with_contacts: bool = True,
+        extra_fields: list[str] | None = None,
     ) -> list[Deal]:
         """Получение списка сделок с возможностью фильтрации.
 
@@ -118,78 +156,257 @@ class BitrixDealRepository(
         :param order: Параметры сортировки
         :param start: Начальная позиция выборки
         :param limit: Максимальное количество возвращаемых сделок
+        :param with_contacts: Загружать идентификаторы связанных контактов
+        :param extra_fields: Дополнительные поля для `additional_fields`
         :return: Список объектов сделок
         """
         error_message = "Ошибка при получении списка сделок"
 
         try:
-            params: dict[str, Any] = {
-                self._start_param_name: start,
-            }
-
-            if filter_params:
-                params[self._filter_param_name] = filter_params
-
-            if select_fields:
-                params[self._select_param_name] = select_fields
-            else:
-                params[self._select_param_name] = ["*", "UF_*"]
-
-            if order:
-                params[self._order_param_name] = order
-            else:
-                params[self._order_param_name] = {"DATE_CREATE": "DESC"}
-
-            if limit > 50 or limit == -1:
-                results: list[dict[str, Any]] = await self._safe_call(
-                    self.batch_list,
-                    error_message,
-                    [],
-                    method=self._bitrix_list_method,
-                    params={
-                        self._select_param_name: ["*", "UF_*"]
-                    }
+            params = self._build_list_params(
+                filter_params,
+                select_fields,
+                order,
+                start,
+                extra_fields,
+            )
+
+            results = await self._fetch_list_items(
+                params,
+                limit,
+                error_message,
+            )
+
+            deals = await self._process_deal_page(
+                results,
+                with_contacts,
+                extra_fields,
+            )
+        except Exception as e:
+            logger.error(f"{error_message}: {e}")
+            return []
+        else:
+            return deals
+
+    async def iter_entities(  # noqa: PLR0913, PLR0917
+        self,
+        filter_params: dict[str, Any] | None = None,
+        select_fields: list[str] | None = None,
+        order: dict[str, str] | None = None,
+        limit: int = -1,
+        with_contacts: bool = True,
+        extra_fields: list[str] | None = None,
+    ) -> AsyncIterator[Deal]:
+        """Потоковое получение сделок по мере загрузки страниц.
+
+        Контакты сделок загружаются пакетно для каждой страницы.
+
+        :param filter_params: Параметры фильтрации сделок
+        :param select_fields: Список полей для выбора
+        :param order: Параметры сортировки
+        :param limit: Максимальное количество сделок (-1 - все сделки)
+        :param with_contacts: Загружать идентификаторы связанных контактов
+        :param extra_fields: Дополнительные поля для `additional_fields`
+        :return: Асинхронный итератор по сделкам
+        """
+        async for page in self.iter_entity_pages(
+            filter_params,
+            select_fields,
+            order,
+            limit,
+            process_page=lambda items: self._process_deal_page(
+                items,
+                with_contacts,
+                extra_fields,
+            ),
+            extra_fields=extra_fields,
+        ):
+            for deal in page:
+                yield deal
+
+    async def iter_deal_rows(  # noqa: PLR0913, PLR0917
+        self,
+        filter_params: dict[str, Any] | None = None,
+        select_fields: list[str] | None = None,
+        order: dict[str, str] | None = None,
+        limit: int = -1,
+        with_contacts: bool = True,
+        extra_fields: list[str] | None = None,
+    ) -> AsyncIterator[LazyEntity[Deal]]:
+        """Потоковое получение сделок в виде ленивых оберток.
+
+        Контакты сделок загружаются пакетно для каждой страницы,
+        остальные поля преобразуются только при обращении к ним.
+
+        :param filter_params: Параметры фильтрации сделок
+        :param select_fields: Список полей для выбора
+        :param order: Параметры сортировки
+        :param limit: Максимальное количество сделок (-1 - все сделки)
+        :param with_contacts: Загружать идентификаторы связанных контактов
+        :param extra_fields: Дополнительные поля для `additional_fields`
+        :return: Асинхронный итератор по ленивым сделкам
+        """
+        async for page in self.iter_entity_pages(
+            filter_params,
+            select_fields,
+            order,
+            limit,
+            process_page=lambda items: self._process_lazy_deal_page(
+                items,
+                with_contacts,
+                extra_fields,
+            ),
+            extra_fields=extra_fields,
+        ):
+            for row in page:
+                yield row
+
+    async def _process_page(
+        self,
+        items: list[dict[str, Any]],
+        extra_fields: list[str] | None = None,
+    ) -> list[Deal]:
+        """Преобразование страницы данных из API в сделки с контактами.
+
+        :param items: Необработанные записи страницы
+        :param extra_fields: Дополнительные поля для `additional_fields`
+        :return: Список сделок
+        """
+        return await self._process_deal_page(items, extra_fields=extra_fields)
+
+    async def _process_deal_page(
+        self,
+        items: list[dict[str, Any]],
+        with_contacts: bool = True,
+        extra_fields: list[str] | None = None,
+    ) -> list[Deal]:
+        """Преобразование страницы данных из API в сделки.
+
+        :param items: Необработанные записи страницы
+        :param with_contacts: Загружать идентификаторы связанных контактов
+        :param extra_fields: Дополнительные поля для `additional_fields`
+        :return: Список сделок
+        """
+        contact_ids_by_deal = await self._load_page_contact_ids(
+            items,
+            with_contacts,
+        )
+
+        deals = []
+        for deal_data in items:
+            try:
+                deal_id = int(deal_data["ID"])
+
+                deal = self._entity_factory.from_bitrix(
+                    deal_data,
+                    contact_ids_by_deal.get(deal_id),
                 )
-                results = results[:limit] if limit != -1 else results
-            else:
-                b_results: dict[str, list] = await self._safe_call(
-                    self._bitrix.call,
-                    error_message,
-                    {},
-                    self._bitrix_list_method,
-                    items=params,
-                    raw=True,
+                if extra_fields:
+                    deal.additional_fields = (
+                        self._entity_factory.pick_additional_fields(
+                            deal_data,
+                            extra_fields,
+                        )
+                    )
+                deals.append(deal)
+            except Exception as e:
+                logger.error(
+                    f'Ошибка при обработке сделки ID={deal_data.get("ID")}: {e}',
                 )
-                results = b_results.get("result", [])
-                results = results[:limit]
+                continue
 
-            deals = []
-            for deal_data in results:
-                try:
-                    deal_id = int(deal_data["ID"])
+        return deals
 
-                    contacts = await self.contact_repository.get_deal_contacts(
-                        deal_id,
-                    )
-                    contact_ids = [contact.id for contact in contacts]
+    async def _process_lazy_deal_page(
+        self,
+        items: list[dict[str, Any]],
+        with_contacts: bool = True,
+        extra_fields: list[str] | None = None,
+    ) -> list[LazyEntity[Deal]]:
+        """Преобразование страницы данных из API в ленивые сделки.
+
+        :param items: Необработанные записи страницы
+        :param with_contacts: Загружать идентификаторы связанных контактов
+        :param extra_fields: Дополнительные поля для `additional_fields`
+        :return: Список ленивых сделок
+        """
+        contact_ids_by_deal = await self._load_page_contact_ids(
+            items,
+            with_contacts,
+        )
 
-                    deals.append(
-                        self._entity_factory.from_bitrix(
+        rows = []
+        for deal_data in items:
+            try:
+                values: dict[str, Any] = {}
+                contact_ids = contact_ids_by_deal.get(int(deal_data["ID"]))
+                if contact_ids is not None:
+                    values["contact_ids"] = contact_ids
+                if extra_fields:
+                    values["additional_fields"] = (
+                        self._entity_factory.pick_additional_fields(
                             deal_data,
-                            contact_ids,
-                        ),
-                    )
-                except Exception as e:
-                    logger.error(
-                        f'Ошибка при обработке сделки ID={deal_data.get("ID")}: {e}',
+                            extra_fields,
+                        )
                     )
-                    continue
+                rows.append(
+                    LazyEntity(self._entity_factory, deal_data, **values),
+                )
+            except Exception as e:
+                logger.error(
+                    f'Ошибка при обработке сделки ID={deal_data.get("ID")}: {e}',
+                )
+                continue
+
+        return rows
+
+    async def _load_page_contact_ids(
+        self,
+        items: list[dict[str, Any]],
+        with_contacts: bool,
+    ) -> dict[int, list[int]]:
+        """Пакетная загрузка идентификаторов контактов сделок страницы.
+
+        :param items: Необработанные записи страницы
+        :param with_contacts: Загружать идентификаторы связанных контактов
+        :return: Идентификаторы контактов по идентификаторам сделок
+        """
+        if not with_contacts:
+            return {}
+
+        return await self.contact_repository.get_deals_contact_ids(
+            [
+                int(deal_data["ID"])
+                for deal_data in items
+                if str(deal_data.get("ID", "")).isdigit()
+            ],
+        )
+
+    async def search_fuzzy(self, query: str, limit: int = 10) -> list[Deal]:
+        """Нечеткий поиск сделок по названию.
+
+        Выполняется по триграммному индексу локальной реплики и находит
+        названия с опечатками и по части названия. Если реплика
+        не загружена, выполняется поиск по вхождению в название через API.
+
+        :param query: Строка для поиска
+        :param limit: Максимальное количество результатов
+        :return: Список объектов сделок по убыванию сходства
+        """
+        error_message = f"Ошибка при нечетком поиске сделок '{query}'"
 
+        try:
+            deals = await self._search_replica("fuzzy", query, limit)
         except Exception as e:
             logger.error(f"{error_message}: {e}")
             return []
-        else:
+
+        if deals is not None:
             return deals
+        return await self.list_entities(
+            filter_params={"%TITLE": query},
+            limit=limit,
+        )
 
     async def update_stage(self, deal_id: int, stage_id: str) -> bool:
         """Обновление стадии сделки.
@@ -223,6 +440,9 @@ class BitrixDealRepository(
         except Exception as e:
             logger.error(f"{error_message}: {e}")
             return False
+        finally:
+            self._invalidate_cached_entity(deal_id)
+            await self._sync_replica_deal_contacts(deal_id)
 
     async def remove_contact(self, deal_id: int, contact_id: int) -> bool:
         """Удаление контакта из сделки.
@@ -247,20 +467,72 @@ class BitrixDealRepository(
         except Exception as e:
             logger.error(f"{error_message}: {e}")
             return False
+        finally:
+            self._invalidate_cached_entity(deal_id)
+            await self._sync_replica_deal_contacts(deal_id)
+
+    async def warm_up_metadata(self) -> None:
+        """Предварительная загрузка полей, категорий и стадий сделок в кэш."""
+        categories, *_ = await asyncio.gather(
+            self.get_categories(),
+            self.get_fields(),
+            self.get_stages(0),
+        )
+
+        category_ids = {
+            int(category["ID"])
+            for category in categories
+            if isinstance(category, dict) and str(category.get("ID")).isdigit()
+        } - {0}
+        await asyncio.gather(
+            *(self.get_stages(category_id) for category_id in category_ids),
+        )
+
+    async def _sync_replica_deal_contacts(self, deal_id: int) -> None:
+        """Обновление связей сделки с контактами в локальной реплике.
+
+        :param deal_id: Идентификатор сделки
+        """
+        if self._replica is None or not self._replica_ready():
+            return
+
+        try:
+            await self._replica.set_deal_contacts(
+                await self.contact_repository.fetch_deals_contact_ids(
+                    [deal_id],
+                ),
+            )
+        except Exception as e:
+            logger.warning(
+                f"Не удалось обновить контакты сделки ID={deal_id} "
+                f"в локальной реплике: {e}",
+            )
 
     async def get_categories(self) -> dict[str, Any]:
         """Получение списка категорий сделок.
 
+        Список берется из кэша метаданных, если он подключен.
+
+        :return: Словарь с категориями сделок
+        """
+        return (
+            await self._get_metadata("categories", self._load_categories) or {}
+        )
+
+    async def _load_categories(self) -> dict[str, Any]:
+        """Загрузка списка категорий сделок из API.
+
         :return: Словарь с категориями сделок
         """
         error_message = "Ошибка при получении списка категорий сделок"
 
         try:
             response = await self._safe_call(
-                self._bitrix.call,
+                self._call,
                 error_message,
                 None,
                 self._deal_category_list_method,
+                raw=True,
             )
 
             if not response or "result" not in response:
@@ -275,6 +547,22 @@ class BitrixDealRepository(
     async def get_stages(self, category_id: int = 0) -> dict[str, Any]:
         """Получение списка стадий сделок для указанной категории.
 
+        Список берется из кэша метаданных, если он подключен.
+
+        :param category_id: Идентификатор категории
+        :return: Словарь со стадиями сделок
+        """
+        return (
+            await self._get_metadata(
+                f"stages.{category_id}",
+                lambda: self._load_stages(category_id),
+            )
+            or {}
+        )
+
+    async def _load_stages(self, category_id: int) -> dict[str, Any]:
+        """Загрузка списка стадий сделок категории из API.
+
         :param category_id: Идентификатор категории
         :return: Словарь со стадиями сделок
         """
@@ -284,11 +572,12 @@ class BitrixDealRepository(
 
         try:
             response = await self._safe_call(
-                self._bitrix.call,
+                self._call,
                 error_message,
                 None,
                 self._deal_category_stage_list_method,
                 {"ID": category_id},
+                raw=True,
             )
 
             if not response or "result" not in response:
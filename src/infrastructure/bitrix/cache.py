@@ -0,0 +1,248 @@
+"""Модуль с кэшами данных Bitrix24.
+
+Содержит ограниченный по размеру кэш сущностей в памяти процесса
+с временем жизни записей и вытеснением давно не используемых (LRU),
+а также кэш метаданных (категории, стадии, описания полей),
+который отдает сохраненное значение сразу и обновляет его в фоне.
+"""
+
+import asyncio
+import contextvars
+import copy
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from src.infrastructure.bitrix.rate_limiter import CallPriority, call_priority
+from src.infrastructure.logging.logger import logger
+
+
+class EntityCache:
+    """Кэш сущностей Bitrix24 по типу сущности и идентификатору.
+
+    Записи считаются актуальными в течение TTL своего типа сущности.
+    Устаревшие записи остаются в кэше до вытеснения или замены, чтобы
+    их можно было отдать, пока Bitrix24 недоступен. При превышении
+    размера вытесняются записи, к которым дольше всего не обращались.
+    Из кэша возвращаются копии, чтобы изменения объекта вызывающим кодом
+    не влияли на сохраненное значение.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        default_ttl: float = 60.0,
+        ttl_by_type: dict[str, float] | None = None,
+    ):
+        """Инициализация кэша.
+
+        :param max_size: Максимальное количество записей
+        :param default_ttl: Время жизни записи в секундах по умолчанию
+        :param ttl_by_type: Время жизни записей по типам сущностей
+        """
+        self._max_size = max_size
+        self._default_ttl = default_ttl
+        self._ttl_by_type = dict(ttl_by_type or {})
+        self._entries: OrderedDict[tuple[str, int], tuple[float, Any]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        """Количество записей в кэше (включая еще не удаленные устаревшие)."""
+        return len(self._entries)
+
+    def get_ttl(self, entity_type: str) -> float:
+        """Время жизни записей для типа сущности.
+
+        :param entity_type: Тип сущности
+        :return: Время жизни в секундах
+        """
+        return self._ttl_by_type.get(entity_type, self._default_ttl)
+
+    def set_ttl(self, entity_type: str, ttl: float) -> None:
+        """Установка времени жизни записей для типа сущности.
+
+        :param entity_type: Тип сущности
+        :param ttl: Время жизни в секундах
+        """
+        self._ttl_by_type[entity_type] = ttl
+
+    def get(
+        self,
+        entity_type: str,
+        entity_id: int,
+        *,
+        allow_stale: bool = False,
+    ) -> Any | None:
+        """Получение сущности из кэша.
+
+        :param entity_type: Тип сущности
+        :param entity_id: Идентификатор сущности
+        :param allow_stale: Вернуть запись, даже если ее TTL истек
+        :return: Копия сохраненной сущности или None, если ее нет или она устарела
+        """
+        key = (entity_type, int(entity_id))
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic() and not allow_stale:
+            return None
+
+        self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def set(self, entity_type: str, entity_id: int, value: Any) -> None:
+        """Сохранение сущности в кэш.
+
+        :param entity_type: Тип сущности
+        :param entity_id: Идентификатор сущности
+        :param value: Сущность для сохранения
+        """
+        ttl = self.get_ttl(entity_type)
+        if self._max_size <= 0 or ttl <= 0:
+            return
+
+        key = (entity_type, int(entity_id))
+        self._entries[key] = (time.monotonic() + ttl, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, entity_type: str, entity_id: int) -> None:
+        """Удаление сущности из кэша.
+
+        :param entity_type: Тип сущности
+        :param entity_id: Идентификатор сущности
+        """
+        self._entries.pop((entity_type, int(entity_id)), None)
+
+    def clear(self, entity_type: str | None = None) -> None:
+        """Очистка кэша.
+
+        :param entity_type: Тип сущности (если не указан - очищается весь кэш)
+        """
+        if entity_type is None:
+            self._entries.clear()
+            return
+
+        for key in [key for key in self._entries if key[0] == entity_type]:
+            del self._entries[key]
+
+
+class MetadataCache:
+    """Кэш редко меняющихся метаданных Bitrix24.
+
+    Работает по схеме stale-while-revalidate: значение из кэша
+    возвращается сразу, а после истечения TTL обновляется фоновой задачей.
+    Пустые ответы не кэшируются, при ошибке обновления остается
+    прежнее значение.
+
+    Загрузка общая для всех ожидающих и может пережить вызвавший ее
+    запрос, поэтому не наследует его срок выполнения и приоритет:
+    первая загрузка выполняется как точечный запрос, фоновое
+    обновление - с приоритетом массовой выгрузки.
+    """
+
+    def __init__(self, ttl: float = 3600.0):
+        """Инициализация кэша.
+
+        :param ttl: Время в секундах, после которого значение обновляется
+        """
+        self._ttl = ttl
+        self._entries: dict[str, tuple[float, Any]] = {}
+        self._loading: dict[str, asyncio.Task[Any]] = {}
+
+    async def get[T](
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[T]],
+    ) -> T | None:
+        """Получение значения из кэша.
+
+        При отсутствии значения оно загружается и ожидается, устаревшее
+        значение возвращается без ожидания с запуском фонового обновления.
+        Одновременные загрузки одного ключа объединяются.
+
+        :param key: Ключ метаданных
+        :param loader: Функция загрузки значения из API
+        :return: Значение метаданных или None, если загрузить не удалось
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            value = await asyncio.shield(
+                self._refresh(key, loader, CallPriority.INTERACTIVE),
+            )
+            return copy.deepcopy(value)
+
+        loaded_at, value = entry
+        if self._ttl <= 0 or time.monotonic() - loaded_at >= self._ttl:
+            self._refresh(key, loader, CallPriority.BULK)
+
+        return copy.deepcopy(value)
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Удаление значения из кэша.
+
+        :param key: Ключ метаданных (если не указан - очищается весь кэш)
+        """
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def _refresh[T](
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[T]],
+        priority: CallPriority,
+    ) -> asyncio.Task[T | None]:
+        """Запуск загрузки значения, если она еще не выполняется.
+
+        Задача создается в пустом контексте, без срока выполнения
+        и приоритета вызывающего кода.
+
+        :param key: Ключ метаданных
+        :param loader: Функция загрузки значения из API
+        :param priority: Приоритет запросов загрузки
+        :return: Задача загрузки
+        """
+        task = self._loading.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._load(key, loader, priority),
+                context=contextvars.Context(),
+            )
+            self._loading[key] = task
+            task.add_done_callback(lambda _: self._loading.pop(key, None))
+        return task
+
+    async def _load[T](
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[T]],
+        priority: CallPriority,
+    ) -> T | None:
+        """Загрузка значения и сохранение его в кэш.
+
+        :param key: Ключ метаданных
+        :param loader: Функция загрузки значения из API
+        :param priority: Приоритет запросов загрузки
+        :return: Загруженное значение или прежнее при ошибке
+        """
+        try:
+            with call_priority(priority):
+                value = await loader()
+        except Exception as e:
+            logger.error(f"Ошибка при обновлении метаданных {key}: {e}")
+            value = None
+
+        if value:
+            self._entries[key] = (time.monotonic(), value)
+            return value
+
+        entry = self._entries.get(key)
+        return entry[1] if entry else value
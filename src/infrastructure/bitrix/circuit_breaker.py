@@ -0,0 +1,190 @@
+"""Модуль с автоматическим выключателем (circuit breaker) для API Bitrix24.
+
+Когда портал Bitrix24 недоступен или деградировал, каждый запрос ждет
+таймаута HTTP, и одновременные вызовы инструментов накапливаются.
+Выключатель по доле неудачных запросов переходит в открытое состояние,
+в котором запросы завершаются сразу, а через заданное время пропускает
+пробный запрос, чтобы проверить, восстановился ли портал.
+"""
+
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from enum import StrEnum
+from http import HTTPStatus
+
+from aiohttp import ClientResponseError
+from fast_bitrix24.server_response import ErrorInServerResponseException
+
+from src.infrastructure.bitrix.rate_limiter import is_query_limit_exceeded
+from src.infrastructure.bitrix.retry import iter_error_chain
+from src.infrastructure.logging.logger import logger
+
+
+class CircuitState(StrEnum):
+    """Состояние выключателя."""
+
+    # Запросы выполняются, результаты учитываются
+    CLOSED = "closed"
+    # Запросы отклоняются без обращения к API
+    OPEN = "open"
+    # Выполняются только пробные запросы
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Запрос отклонен, так как Bitrix24 признан недоступным."""
+
+
+class CircuitBreaker:
+    """Автоматический выключатель запросов к API Bitrix24.
+
+    Успешными считаются запросы, на которые портал ответил, в том числе
+    ошибкой API (ответ 4XX, ошибка в теле ответа, QUERY_LIMIT_EXCEEDED).
+    Остальные исключения - сетевые ошибки, таймауты, ответы 5XX
+    и исчерпание попыток клиентом, в том числе по неизвестной причине, -
+    означают, что ответа нет, и считаются неудачными.
+
+    Выключатель размыкается, когда среди последних `window_size` запросов
+    (но не менее `min_calls`) доля неудачных достигает `failure_threshold`.
+    Через `open_timeout` секунд он переходит в полуоткрытое состояние
+    и пропускает до `half_open_max_calls` пробных запросов: успешный
+    пробный запрос замыкает выключатель, неудачный - размыкает снова.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: float = 0.5,
+        window_size: int = 20,
+        min_calls: int = 5,
+        open_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ):
+        """Инициализация выключателя.
+
+        :param failure_threshold: Доля неудачных запросов для размыкания
+        :param window_size: Количество последних запросов, по которым
+                            считается доля неудачных
+        :param min_calls: Минимальное количество запросов для размыкания
+        :param open_timeout: Время в открытом состоянии в секундах
+        :param half_open_max_calls: Количество одновременных пробных запросов
+        """
+        self._failure_threshold = failure_threshold
+        self._min_calls = max(min_calls, 1)
+        self._open_timeout = open_timeout
+        self._half_open_max_calls = max(half_open_max_calls, 1)
+        self._outcomes: deque[bool] = deque(maxlen=max(window_size, 1))
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Текущее состояние выключателя."""
+        if (
+            self._state is CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self._open_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probes = 0
+        return self._state
+
+    @property
+    def is_open(self) -> bool:
+        """Признак того, что запросы к API сейчас отклоняются."""
+        return self.state is CircuitState.OPEN
+
+    @contextmanager
+    def guard(self, method: str) -> Iterator[None]:
+        """Выполнение запроса под контролем выключателя.
+
+        :param method: Метод API (для сообщения об ошибке)
+        :raises CircuitOpenError: Если выключатель разомкнут или все
+                                  пробные запросы уже выполняются
+        """
+        state = self.state
+        if state is CircuitState.OPEN or (
+            state is CircuitState.HALF_OPEN
+            and self._probes >= self._half_open_max_calls
+        ):
+            msg = f"Bitrix24 временно недоступен, вызов {method} не выполнен"
+            raise CircuitOpenError(msg)
+
+        probe = state is CircuitState.HALF_OPEN
+        if probe:
+            self._probes += 1
+
+        try:
+            yield
+        except Exception as e:
+            self._record(success=self.is_api_response(e), probe=probe)
+            raise
+        except BaseException:
+            # Отмена запроса не характеризует доступность портала
+            if probe:
+                self._probes -= 1
+            raise
+        else:
+            self._record(success=True, probe=probe)
+
+    @staticmethod
+    def is_api_response(error: BaseException) -> bool:
+        """Проверка, получен ли ответ портала, несмотря на исключение.
+
+        :param error: Исключение запроса
+        :return: True, если исключение или одна из его причин - ответ
+                 API с ошибкой
+        """
+        if is_query_limit_exceeded(error):
+            return True
+        return any(
+            isinstance(cause, ErrorInServerResponseException)
+            or (
+                isinstance(cause, ClientResponseError)
+                and cause.status < HTTPStatus.INTERNAL_SERVER_ERROR
+            )
+            for cause in iter_error_chain(error)
+        )
+
+    def _record(self, *, success: bool, probe: bool) -> None:
+        """Учет результата запроса.
+
+        :param success: Запрос получил ответ от API
+        :param probe: Запрос был пробным
+        """
+        if probe:
+            self._probes -= 1
+            if self._state is not CircuitState.HALF_OPEN:
+                return
+            if success:
+                self._close()
+            else:
+                self._open()
+            return
+
+        if self._state is not CircuitState.CLOSED:
+            return
+
+        self._outcomes.append(success)
+        if len(self._outcomes) < self._min_calls:
+            return
+        failures = self._outcomes.count(False)
+        if failures / len(self._outcomes) >= self._failure_threshold:
+            self._open()
+
+    def _open(self) -> None:
+        """Размыкание выключателя."""
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        logger.warning(
+            f"Bitrix24 недоступен, запросы приостановлены "
+            f"на {self._open_timeout:.0f} с",
+        )
+
+    def _close(self) -> None:
+        """Замыкание выключателя после успешного пробного запроса."""
+        self._state = CircuitState.CLOSED
+        self._outcomes.clear()
+        logger.info("Bitrix24 снова доступен, запросы возобновлены")
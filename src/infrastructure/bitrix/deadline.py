@@ -0,0 +1,87 @@
+"""Модуль со сроками выполнения вызовов инструментов.
+
+Срок задается обработчиком инструмента MCP и передается через
+контекстную переменную сервисам и репозиториям без изменения их
+сигнатур. Запросы к API Bitrix24, не успевшие до срока, отменяются,
+постраничные загрузки останавливаются, а срок помечается как
+сокративший результат, чтобы обработчик мог сообщить об этом клиенту.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+
+class DeadlineExceededError(Exception):
+    """Запрос к API не выполнен, так как истек срок вызова инструмента."""
+
+
+@dataclass(slots=True)
+class Deadline:
+    """Срок выполнения вызова.
+
+    :param expires_at: Момент истечения срока по `time.monotonic`
+    :param truncated: Часть данных не была загружена из-за истечения срока
+    :param parent: Внешний срок, которому передается отметка о сокращении
+    """
+
+    expires_at: float
+    truncated: bool = False
+    parent: "Deadline | None" = None
+
+    @property
+    def remaining(self) -> float:
+        """Оставшееся время в секундах (бесконечность, если срок не задан)."""
+        return self.expires_at - time.monotonic()
+
+    @property
+    def expired(self) -> bool:
+        """Признак истечения срока."""
+        return self.remaining <= 0
+
+    def mark_truncated(self) -> None:
+        """Отметка о том, что результат неполон из-за истечения срока."""
+        deadline: Deadline | None = self
+        while deadline is not None:
+            deadline.truncated = True
+            deadline = deadline.parent
+
+
+_current_deadline: ContextVar[Deadline | None] = ContextVar(
+    "bitrix_deadline",
+    default=None,
+)
+
+
+def get_deadline() -> Deadline | None:
+    """Получение срока текущего вызова.
+
+    :return: Срок или None, если вызов выполняется без срока
+    """
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline(timeout: float | None) -> Iterator[Deadline]:
+    """Установка срока для всех запросов внутри блока.
+
+    Вложенный срок не может быть позже внешнего.
+
+    :param timeout: Время на выполнение в секундах (None или 0 - без
+                    собственного срока, действует внешний, если он есть)
+    :return: Срок, по которому после выхода из блока можно проверить,
+             был ли результат сокращен
+    """
+    parent = _current_deadline.get()
+    expires_at = time.monotonic() + timeout if timeout else float("inf")
+    if parent is not None:
+        expires_at = min(expires_at, parent.expires_at)
+
+    current = Deadline(expires_at=expires_at, parent=parent)
+    token = _current_deadline.set(current)
+    try:
+        yield current
+    finally:
+        _current_deadline.reset(token)
@@ -4,13 +4,44 @@
 с обработкой исключений и логированием.
 """
 
+import asyncio
+import json
+import time
 import typing
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 
 from fast_bitrix24 import Bitrix
 
 from src.domain.entities.base_entity import BitrixEntity
+from src.infrastructure.bitrix.cache import EntityCache, MetadataCache
+from src.infrastructure.bitrix.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+)
+from src.infrastructure.bitrix.deadline import DeadlineExceededError, get_deadline
+from src.infrastructure.bitrix.rate_limiter import (
+    QUERY_LIMIT_EXCEEDED,
+    AdaptiveRateLimiter,
+    CallPriority,
+    is_query_limit_exceeded,
+    resolve_call_priority,
+)
+from src.infrastructure.bitrix.retry import RetryPolicy, is_retryable_error
 from src.infrastructure.logging.logger import logger
+from src.infrastructure.replica.storage import ReplicaStorage
+
+
+@dataclass(slots=True)
+class _SharedCall:
+    """Выполняющийся вызов метода чтения, общий для одинаковых вызовов.
+
+    :param task: Задача запроса
+    :param waiters: Количество вызывающих, ожидающих результат
+    """
+
+    task: asyncio.Future[typing.Any]
+    waiters: int = 0
 
 
 class BaseMixin[T_Result]:
@@ -20,12 +51,442 @@ class BaseMixin[T_Result]:
     с логированием и обработкой распространенных исключений.
     """
 
-    def __init__(self, bitrix: Bitrix):
+    _entity_type: typing.ClassVar[str]
+    # Время жизни записей кэша для типа сущности (None - время жизни
+    # по умолчанию из настроек кэша)
+    _cache_ttl: typing.ClassVar[float | None] = None
+
+    # Методы чтения, одинаковые одновременные вызовы которых объединяются
+    _coalesced_method_suffixes: typing.ClassVar[tuple[str, ...]] = (
+        ".get",
+        ".list",
+        ".fields",
+    )
+    # Повторные попытки методов, не изменяющих данные
+    _read_retry_policy: typing.ClassVar[RetryPolicy] = RetryPolicy()
+    # Методы изменения данных повторяются только после QUERY_LIMIT_EXCEEDED
+    _write_retry_policy: typing.ClassVar[RetryPolicy] = RetryPolicy(
+        retry_errors=False,
+    )
+    # Политики отдельных методов API, заменяющие политики по умолчанию
+    _retry_policies: typing.ClassVar[dict[str, RetryPolicy]] = {}
+    # Выполняющиеся вызовы методов чтения, общие для всех репозиториев
+    _in_flight_calls: typing.ClassVar[
+        dict[tuple[int, str, str, bool], _SharedCall]
+    ] = {}
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        bitrix: Bitrix,
+        entity_cache: EntityCache | None = None,
+        metadata_cache: MetadataCache | None = None,
+        replica: ReplicaStorage | None = None,
+        rate_limiter: AdaptiveRateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+    ):
         """Инициализация миксина.
 
         :param bitrix: Клиент для работы с API Bitrix24
+        :param entity_cache: Кэш сущностей (если не указан - кэширование отключено)
+        :param metadata_cache: Кэш метаданных (категории, стадии, поля)
+        :param replica: Локальная реплика для чтения списков (опционально)
+        :param rate_limiter: Общий ограничитель частоты запросов (опционально)
+        :param circuit_breaker: Общий выключатель запросов при недоступности
+                                Bitrix24 (опционально)
         """
         self._bitrix = bitrix
+        self._entity_cache = entity_cache
+        self._metadata_cache = metadata_cache
+        self._replica = replica
+        self._rate_limiter = rate_limiter
+        self._circuit_breaker = circuit_breaker
+
+        if entity_cache is not None and self._cache_ttl is not None:
+            entity_cache.set_ttl(self._entity_type, self._cache_ttl)
+
+    async def _call(
+        self,
+        method: str,
+        items: dict[str, typing.Any] | None = None,
+        *,
+        raw: bool = False,
+        priority: CallPriority | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ) -> typing.Any:
+        """Вызов метода API Bitrix24.
+
+        Если вызов выполняется в пределах срока (`deadline`), ожидание
+        разрешения, повторные попытки и сам запрос отменяются при его
+        истечении, а срок помечается как сокративший результат.
+
+        :param method: Метод API
+        :param items: Параметры вызова
+        :param raw: Вернуть ответ API целиком, а не только поле result
+        :param priority: Класс приоритета запроса (по умолчанию определяется
+                         по `call_priority` и методу)
+        :param retry_policy: Политика повторных попыток (по умолчанию
+                             определяется методом, см. `get_retry_policy`)
+        :returns: Ответ API
+        :raises DeadlineExceededError: Если срок истек до получения ответа
+        """
+        current_deadline = get_deadline()
+        if current_deadline is None or current_deadline.remaining == float("inf"):
+            return await self._call_shared(
+                method,
+                items,
+                raw=raw,
+                priority=priority,
+                retry_policy=retry_policy,
+            )
+
+        remaining = current_deadline.remaining
+        if remaining > 0:
+            try:
+                async with asyncio.timeout(remaining):
+                    return await self._call_shared(
+                        method,
+                        items,
+                        raw=raw,
+                        priority=priority,
+                        retry_policy=retry_policy,
+                    )
+            except TimeoutError:
+                if not current_deadline.expired:
+                    raise
+
+        current_deadline.mark_truncated()
+        msg = f"Истек срок выполнения, вызов {method} отменен"
+        raise DeadlineExceededError(msg)
+
+    async def _call_shared(
+        self,
+        method: str,
+        items: dict[str, typing.Any] | None = None,
+        *,
+        raw: bool = False,
+        priority: CallPriority | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ) -> typing.Any:
+        """Вызов метода API с объединением одинаковых вызовов чтения.
+
+        Одновременные вызовы одного и того же метода чтения с одинаковыми
+        параметрами выполняются одним запросом, результат которого получают
+        все вызвавшие. Результат общий, поэтому изменять его нельзя.
+        Ожидающий, у которого истек срок, перестает ждать, но запрос
+        продолжается для остальных; когда перестает ждать последний,
+        запрос отменяется.
+
+        :param method: Метод API
+        :param items: Параметры вызова
+        :param raw: Вернуть ответ API целиком, а не только поле result
+        :param priority: Класс приоритета запроса
+        :param retry_policy: Политика повторных попыток
+        :returns: Ответ API
+        """
+        if priority is None:
+            priority = resolve_call_priority(method)
+
+        if not method.endswith(self._coalesced_method_suffixes):
+            return await self._send_call(
+                method,
+                items,
+                raw=raw,
+                priority=priority,
+                retry_policy=retry_policy,
+            )
+
+        key = (
+            id(self._bitrix),
+            method,
+            json.dumps(items, sort_keys=True, default=str, ensure_ascii=False),
+            raw,
+        )
+        shared = self._in_flight_calls.get(key)
+        if shared is None:
+            shared = _SharedCall(
+                asyncio.ensure_future(
+                    self._send_call(
+                        method,
+                        items,
+                        raw=raw,
+                        priority=priority,
+                        retry_policy=retry_policy,
+                    ),
+                ),
+            )
+            self._in_flight_calls[key] = shared
+            shared.task.add_done_callback(
+                lambda future: self._forget_call(key, future),
+            )
+
+        shared.waiters += 1
+        try:
+            return await asyncio.shield(shared.task)
+        finally:
+            shared.waiters -= 1
+            if not shared.waiters and not shared.task.done():
+                if self._in_flight_calls.get(key) is shared:
+                    del self._in_flight_calls[key]
+                shared.task.cancel()
+
+    async def _send_call(
+        self,
+        method: str,
+        items: dict[str, typing.Any] | None = None,
+        *,
+        raw: bool = False,
+        priority: CallPriority = CallPriority.INTERACTIVE,
+        retry_policy: RetryPolicy | None = None,
+    ) -> typing.Any:
+        """Отправка запроса к API Bitrix24 с повторными попытками.
+
+        Запрос повторяется по политике метода (`get_retry_policy`) после
+        QUERY_LIMIT_EXCEEDED, а если политика разрешает - и после сетевых
+        ошибок и таймаутов. Когда попытки или время исчерпаны, возвращается
+        последний ответ или выбрасывается последнее исключение.
+
+        :param method: Метод API
+        :param items: Параметры вызова
+        :param raw: Вернуть ответ API целиком, а не только поле result
+        :param priority: Класс приоритета запроса
+        :param retry_policy: Политика повторных попыток (по умолчанию
+                             политика метода)
+        :returns: Ответ API
+        """
+        policy = retry_policy or self.get_retry_policy(method)
+        started_at = time.monotonic()
+        attempt = 0
+
+        while True:
+            attempt += 1
+            try:
+                response = await self._send_attempt(
+                    method,
+                    items,
+                    raw=raw,
+                    priority=priority,
+                )
+            except Exception as e:
+                limit_exceeded = is_query_limit_exceeded(e)
+                if not limit_exceeded and not (
+                    policy.retry_errors and is_retryable_error(e)
+                ):
+                    raise
+                delay = policy.get_delay(attempt, limit_exceeded)
+                if not policy.can_retry(
+                    attempt,
+                    time.monotonic() - started_at,
+                    delay,
+                ):
+                    raise
+                reason = str(e) or type(e).__name__
+            else:
+                if not is_query_limit_exceeded(response):
+                    return response
+                delay = policy.get_delay(attempt, limit_exceeded=True)
+                if not policy.can_retry(
+                    attempt,
+                    time.monotonic() - started_at,
+                    delay,
+                ):
+                    return response
+                reason = QUERY_LIMIT_EXCEEDED
+
+            logger.warning(
+                f"Вызов {method} не удался ({reason}), "
+                f"повтор через {delay:.2f} с (попытка {attempt + 1} "
+                f"из {policy.max_attempts})",
+            )
+            await asyncio.sleep(delay)
+
+    def get_retry_policy(self, method: str) -> RetryPolicy:
+        """Получение политики повторных попыток для метода API.
+
+        :param method: Метод API
+        :returns: Политика из `_retry_policies`, а если ее нет - политика
+                  чтения для методов `_coalesced_method_suffixes`
+                  и политика изменения для остальных
+        """
+        policy = self._retry_policies.get(method)
+        if policy is not None:
+            return policy
+        if method.endswith(self._coalesced_method_suffixes):
+            return self._read_retry_policy
+        return self._write_retry_policy
+
+    async def _send_attempt(
+        self,
+        method: str,
+        items: dict[str, typing.Any] | None = None,
+        *,
+        raw: bool = False,
+        priority: CallPriority = CallPriority.INTERACTIVE,
+    ) -> typing.Any:
+        """Одна попытка запроса к API Bitrix24.
+
+        Если задан выключатель, запрос к недоступному Bitrix24 сразу
+        завершается `CircuitOpenError`. Если задан ограничитель частоты,
+        запрос ожидает разрешения в очереди своего класса приоритета,
+        а ответ используется для подстройки частоты.
+
+        :param method: Метод API
+        :param items: Параметры вызова
+        :param raw: Вернуть ответ API целиком, а не только поле result
+        :param priority: Класс приоритета запроса
+        :returns: Ответ API
+        :raises CircuitOpenError: Если выключатель разомкнут
+        """
+        if self._circuit_breaker is None:
+            return await self._send_limited(
+                method,
+                items,
+                raw=raw,
+                priority=priority,
+            )
+
+        with self._circuit_breaker.guard(method):
+            return await self._send_limited(
+                method,
+                items,
+                raw=raw,
+                priority=priority,
+            )
+
+    async def _send_limited(
+        self,
+        method: str,
+        items: dict[str, typing.Any] | None = None,
+        *,
+        raw: bool = False,
+        priority: CallPriority = CallPriority.INTERACTIVE,
+    ) -> typing.Any:
+        """Запрос к API Bitrix24 с учетом ограничителя частоты.
+
+        :param method: Метод API
+        :param items: Параметры вызова
+        :param raw: Вернуть ответ API целиком, а не только поле result
+        :param priority: Класс приоритета запроса
+        :returns: Ответ API
+        """
+        if self._rate_limiter is None:
+            return await self._request(method, items, raw=raw)
+
+        await self._rate_limiter.acquire(method, priority)
+        try:
+            response = await self._request(method, items, raw=raw)
+        except Exception as e:
+            if is_query_limit_exceeded(e):
+                self._rate_limiter.on_limit_exceeded()
+            raise
+
+        if is_query_limit_exceeded(response):
+            self._rate_limiter.on_limit_exceeded()
+        else:
+            self._rate_limiter.observe(method, response)
+        return response
+
+    async def _request(
+        self,
+        method: str,
+        items: dict[str, typing.Any] | None = None,
+        *,
+        raw: bool = False,
+    ) -> typing.Any:
+        """Выполнение запроса клиентом Bitrix24.
+
+        :param method: Метод API
+        :param items: Параметры вызова
+        :param raw: Вернуть ответ API целиком, а не только поле result
+        :returns: Ответ API
+        """
+        if items is None:
+            return await self._bitrix.call(method, raw=raw)
+        return await self._bitrix.call(method, items, raw=raw)
+
+    @classmethod
+    def _forget_call(
+        cls,
+        key: tuple[int, str, str, bool],
+        future: asyncio.Future[typing.Any],
+    ) -> None:
+        """Удаление завершенного вызова из списка выполняющихся.
+
+        Исключение помечается полученным, чтобы оно не логировалось
+        повторно, если все ожидавшие вызов были отменены.
+
+        :param key: Ключ вызова
+        :param future: Завершенный вызов
+        """
+        shared = cls._in_flight_calls.get(key)
+        if shared is not None and shared.task is future:
+            del cls._in_flight_calls[key]
+        if not future.cancelled():
+            future.exception()
+
+    def _replica_ready(self, entity_type: str | None = None) -> bool:
+        """Проверка, можно ли читать данные из локальной реплики.
+
+        :param entity_type: Тип сущности (по умолчанию - тип репозитория)
+        :returns: True, если реплика подключена и первично загружена
+        """
+        return self._replica is not None and self._replica.is_ready(
+            entity_type or self._entity_type,
+        )
+
+    def _get_cached_entity(self, entity_id: int) -> typing.Any | None:
+        """Получение сущности из кэша.
+
+        Пока Bitrix24 недоступен (выключатель разомкнут), возвращаются
+        и устаревшие записи: они лучше, чем отсутствие ответа.
+
+        :param entity_id: Идентификатор сущности
+        :returns: Сущность из кэша или None
+        """
+        if self._entity_cache is None:
+            return None
+        return self._entity_cache.get(
+            self._entity_type,
+            entity_id,
+            allow_stale=(
+                self._circuit_breaker is not None
+                and self._circuit_breaker.is_open
+            ),
+        )
+
+    def _cache_entity(self, entity_id: int, entity: typing.Any) -> None:
+        """Сохранение сущности в кэш.
+
+        :param entity_id: Идентификатор сущности
+        :param entity: Сущность
+        """
+        if self._entity_cache is not None and entity is not None:
+            self._entity_cache.set(self._entity_type, entity_id, entity)
+
+    async def _get_metadata[R](
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[R]],
+    ) -> R | None:
+        """Получение метаданных через кэш метаданных.
+
+        :param key: Ключ метаданных в пределах типа сущности
+        :param loader: Функция загрузки метаданных из API
+        :returns: Метаданные или None, если загрузить не удалось
+        """
+        if self._metadata_cache is None:
+            return await loader()
+        return await self._metadata_cache.get(
+            f"{self._entity_type}.{key}",
+            loader,
+        )
+
+    def _invalidate_cached_entity(self, entity_id: int) -> None:
+        """Удаление сущности из кэша после ее изменения.
+
+        :param entity_id: Идентификатор сущности
+        """
+        if self._entity_cache is not None:
+            self._entity_cache.invalidate(self._entity_type, entity_id)
 
     @classmethod
     async def _safe_call(  # noqa: PLR0911
@@ -39,7 +500,8 @@ class BaseMixin[T_Result]:
         """Безопасно выполняет асинхронную функцию с обработкой ошибок.
 
         Логирует возникшие исключения и возвращает значение по умолчанию
-        в случае ошибки.
+        в случае ошибки. Кратковременные сбои вызовов API к этому моменту
+        уже повторены в `_send_call`.
 
         :param func: Асинхронная функция для выполнения.
         :param error_context_message: Контекстное сообщение для лога ошибки
@@ -51,6 +513,9 @@ class BaseMixin[T_Result]:
         """
         try:
             return await func(*args, **kwargs)
+        except (CircuitOpenError, DeadlineExceededError) as e:
+            logger.warning(f"{error_context_message}: {e}")
+            return default_value
         except ConnectionError:
             logger.error(f"{error_context_message}: Ошибка соединения.")
             return default_value
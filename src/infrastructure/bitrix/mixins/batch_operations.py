@@ -3,13 +3,46 @@
 Содержит методы для эффективного выполнения множественных запросов к API.
 """
 
+import asyncio
 from collections.abc import Callable
-from typing import Any, cast
+from dataclasses import dataclass, field
+from typing import Any, ClassVar
+
+from fast_bitrix24.utils import http_build_query
 
 from src.infrastructure.bitrix.mixins.base import BaseMixin
+from src.infrastructure.bitrix.rate_limiter import (
+    CallPriority,
+    resolve_call_priority,
+)
+from src.infrastructure.bitrix.retry import RetryPolicy
 from src.infrastructure.logging.logger import logger
 
 
+@dataclass
+class BatchResponse:
+    """Объединенный ответ на пакетный запрос.
+
+    Содержит результаты, ошибки и служебные значения постраничных
+    методов по именам команд из всех отправленных пакетов.
+    """
+
+    result: dict[str, Any] = field(default_factory=dict)
+    errors: dict[str, Any] = field(default_factory=dict)
+    total: dict[str, int] = field(default_factory=dict)
+    next: dict[str, int] = field(default_factory=dict)
+
+    def merge(self, other: "BatchResponse") -> None:
+        """Добавление результатов другого пакета.
+
+        :param other: Ответ на другой пакет команд
+        """
+        self.result.update(other.result)
+        self.errors.update(other.errors)
+        self.total.update(other.total)
+        self.next.update(other.next)
+
+
 class BitrixBatchOperationsMixin(BaseMixin):
     """Миксин для пакетных операций с API Bitrix24.
 
@@ -17,69 +50,164 @@ class BitrixBatchOperationsMixin(BaseMixin):
     множественных запросов к API.
     """
 
+    _batch_method: ClassVar[str] = "batch"
+    _batch_max_commands: ClassVar[int] = 50
+    _batch_concurrency: ClassVar[int] = 4
+
     async def execute_batch(
         self,
         commands: dict[str, tuple[str, dict[str, Any]]],
         error_message: str = "Ошибка при выполнении пакетного запроса",
+        concurrency: int | None = None,
     ) -> dict[str, Any]:
         """Выполнение пакетного запроса.
 
+        Команды разбиваются на пакеты по `_batch_max_commands` штук,
+        которые отправляются параллельно.
+
         :param commands: Словарь команд для выполнения
-        :param halt_on_error: Прерывать выполнение при ошибке
         :param error_message: Сообщение при ошибке
+        :param concurrency: Максимальное число одновременно отправляемых пакетов
         :returns: Словарь результатов
         """
-        try:
-            batch_commands: dict[str, dict[str, Any]] = {}
+        response = await self.execute_batch_detailed(
+            commands,
+            error_message=error_message,
+            concurrency=concurrency,
+        )
+        return response.result
 
-            for name, (method, params) in commands.items():
-                batch_commands[name] = {
-                    "method": method,
-                    "params": params,
-                }
+    async def execute_batch_detailed(
+        self,
+        commands: dict[str, tuple[str, dict[str, Any]]],
+        error_message: str = "Ошибка при выполнении пакетного запроса",
+        concurrency: int | None = None,
+    ) -> BatchResponse:
+        """Выполнение пакетного запроса с сохранением ошибок по командам.
 
-            response = await self._bitrix.call_batch(batch_commands)
+        :param commands: Словарь команд для выполнения
+        :param error_message: Сообщение при ошибке
+        :param concurrency: Максимальное число одновременно отправляемых пакетов
+        :returns: Объединенный ответ по всем пакетам
+        """
+        merged = BatchResponse()
+        if not commands:
+            return merged
 
-            if not response or "result" not in response:
-                logger.warning(f"{error_message}: получен некорректный ответ")
-                return {}
+        names = list(commands)
+        chunk_size = self._batch_max_commands
+        chunks = [
+            {name: commands[name] for name in names[i : i + chunk_size]}
+            for i in range(0, len(names), chunk_size)
+        ]
+        semaphore = asyncio.Semaphore(
+            max(concurrency or self._batch_concurrency, 1),
+        )
 
-            return response["result"] or {}
-        except ValueError as e:
-            logger.error(f"{error_message}: некорректное значение: {e}")
-            return {}
-        except KeyError as e:
-            logger.error(f"{error_message}: отсутствует ключ: {e}")
-            return {}
-        except AttributeError as e:
-            logger.error(f"{error_message}: ошибка атрибута: {e}")
-            return {}
-        except Exception as e:
-            logger.error(f"{error_message}: {e}")
-            return {}
+        async def run_chunk(
+            chunk: dict[str, tuple[str, dict[str, Any]]],
+        ) -> BatchResponse:
+            async with semaphore:
+                return await self._execute_batch_chunk(chunk, error_message)
+
+        for response in await asyncio.gather(
+            *(run_chunk(chunk) for chunk in chunks),
+        ):
+            merged.merge(response)
 
-    async def batch_list(
+        if merged.errors:
+            logger.warning(
+                f"{error_message}: ошибки в {len(merged.errors)} "
+                f"из {len(commands)} команд",
+            )
+
+        return merged
+
+    async def _execute_batch_chunk(
         self,
-        method: str,
-        params: dict[str, Any],
-        error_message: str = "Ошибка при выполнении пакетного запроса списка",
-    ) -> list[dict[str, Any]]:
-        """Получение списка элементов пакетными запросами.
+        commands: dict[str, tuple[str, dict[str, Any]]],
+        error_message: str,
+    ) -> BatchResponse:
+        """Выполнение одного пакета команд (не более `_batch_max_commands`).
 
-        :param method: Метод API для получения списка
-        :param params: Параметры запроса
+        Приоритет и политика повторных попыток пакета определяются
+        входящими в него командами (см. `_get_batch_priority`
+        и `_get_batch_retry_policy`).
+
+        :param commands: Словарь команд для выполнения
         :param error_message: Сообщение при ошибке
-        :returns: Список результатов
+        :returns: Ответ на пакет; при сбое запроса все команды считаются ошибочными
         """
         try:
-            result = await self._bitrix.get_all(
-                method=method,
-                params=params,
+            batch_commands: dict[str, str] = {}
+
+            for name, (method, params) in commands.items():
+                batch_commands[name] = f"{method}?{http_build_query(params)}"
+
+            methods = {method for method, _ in commands.values()}
+            response = await self._call(
+                self._batch_method,
+                {"halt": 0, "cmd": batch_commands},
+                raw=True,
+                priority=self._get_batch_priority(methods),
+                retry_policy=self._get_batch_retry_policy(methods),
+            )
+
+            payload = (
+                response.get("result") if isinstance(response, dict) else None
             )
-            return cast("list[dict[str, Any]]", result) or []
+            if not isinstance(payload, dict):
+                logger.warning(f"{error_message}: получен некорректный ответ")
+                return BatchResponse(
+                    errors=dict.fromkeys(commands, "некорректный ответ"),
+                )
         except Exception as e:
-            logger.error(f"{error_message} через {method}: {e}")
-            return []
+            logger.error(f"{error_message}: {e}")
+            return BatchResponse(errors=dict.fromkeys(commands, str(e)))
+        else:
+            return BatchResponse(
+                result=self._batch_section(payload, "result"),
+                errors=self._batch_section(payload, "result_error"),
+                total=self._batch_section(payload, "result_total"),
+                next=self._batch_section(payload, "result_next"),
+            )
+
+    @staticmethod
+    def _batch_section(payload: dict[str, Any], key: str) -> dict[str, Any]:
+        """Получение раздела ответа batch.
+
+        Пустые разделы Bitrix24 возвращает в виде списка.
+
+        :param payload: Содержимое поля result ответа batch
+        :param key: Имя раздела
+        :returns: Словарь значений по именам команд
+        """
+        section = payload.get(key)
+        return section if isinstance(section, dict) else {}
+
+    @staticmethod
+    def _get_batch_priority(methods: set[str]) -> CallPriority:
+        """Определение приоритета пакета по методам его команд.
+
+        :param methods: Методы API команд пакета
+        :returns: Наименее срочный из приоритетов команд, чтобы пакет
+                  с изменениями не обгонял точечные чтения
+        """
+        return max(resolve_call_priority(method) for method in methods)
+
+    def _get_batch_retry_policy(self, methods: set[str]) -> RetryPolicy:
+        """Определение политики повторных попыток пакета по методам его команд.
+
+        :param methods: Методы API команд пакета
+        :returns: Политика команд, а если они различаются - наиболее
+                  осторожная: пакет с изменяющей командой не повторяется
+                  после сетевых ошибок
+        """
+        policies = {self.get_retry_policy(method) for method in methods}
+        return min(
+            policies,
+            key=lambda policy: (policy.retry_errors, policy.max_attempts),
+        )
 
     async def batch_get_by_ids[T](
         self,
@@ -3,21 +3,40 @@
 Содержит методы для получения данных с учетом пагинации API.
 """
 
-from collections.abc import Callable
-from typing import Any
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from typing import Any, ClassVar
 
-from src.infrastructure.bitrix.mixins.base import BaseMixin
+from src.infrastructure.bitrix.deadline import (
+    DeadlineExceededError,
+    get_deadline,
+)
+from src.infrastructure.bitrix.mixins.batch_operations import (
+    BitrixBatchOperationsMixin,
+)
+from src.infrastructure.bitrix.rate_limiter import CallPriority, call_priority
 from src.infrastructure.logging.logger import logger
 
 
-class BitrixPaginationMixin(BaseMixin):
+class BitrixPaginationMixin(BitrixBatchOperationsMixin):
     """Миксин для работы с пагинацией API Bitrix24.
 
     Предоставляет методы для эффективного получения данных
     с учетом особенностей пагинации конкретных методов API.
+    Для параллельной загрузки страниц использует пакетные операции.
+
+    Первая страница запрашивается с приоритетом вызывающего кода,
+    остальные - с приоритетом массовой выгрузки (`CallPriority.BULK`),
+    чтобы длинные выгрузки не задерживали точечные запросы.
+
+    При истечении срока вызова (`deadline`) загрузка останавливается
+    и возвращаются уже полученные страницы.
     """
 
-    async def paginate[T](  # noqa: PLR0913
+    _page_size: ClassVar[int] = 50
+    _pagination_concurrency: ClassVar[int] = 4
+
+    async def paginate[T](  # noqa: PLR0913, PLR0917
         self,
         method: str,
         params: dict[str, Any],
@@ -26,9 +45,15 @@ class BitrixPaginationMixin(BaseMixin):
         page_size: int | None = None,
         max_items: int | None = None,
         start_param_name: str = "start",
+        parallel: bool = False,
+        use_batch: bool = True,
     ) -> list[T]:
         """Получение данных с учетом пагинации.
 
+        В параллельном режиме первая страница сообщает общее количество
+        элементов (`total`), после чего остальные страницы запрашиваются
+        одновременно и собираются в исходном порядке.
+
         :param method: Метод API для вызова
         :param params: Параметры запроса
         :param process_page: Функция для обработки каждой страницы результатов
@@ -36,10 +61,13 @@ class BitrixPaginationMixin(BaseMixin):
         :param page_size: Размер страницы (если не указан, используется максимальный)
         :param max_items: Максимальное количество элементов для получения
         :param start_param_name: Имя параметра для начальной позиции
+        :param parallel: Запрашивать страницы после первой параллельно
+        :param use_batch: В параллельном режиме упаковывать страницы в batch,
+                          иначе выполнять ограниченные параллельные вызовы
         :returns: Объединенный список обработанных результатов
         """
         try:
-            actual_page_size = page_size or 50
+            actual_page_size = page_size or self._page_size
 
             all_results: list[T] = []
 
@@ -51,42 +79,416 @@ class BitrixPaginationMixin(BaseMixin):
                 float("inf") if max_items is None else max_items
             )
 
-            while len(all_results) < total_items_to_fetch:
-                response = await self._bitrix.call(method, current_params)
+            if parallel:
+                pages = await self._fetch_pages_concurrently(
+                    method,
+                    current_params,
+                    error_message,
+                    actual_page_size,
+                    total_items_to_fetch,
+                    start_param_name,
+                    use_batch,
+                )
+                for page_items in pages:
+                    all_results.extend(process_page(page_items))
 
-                if not response or "result" not in response:
-                    logger.warning(
-                        f"{error_message}: получен некорректный ответ",
-                    )
-                    break
+                return all_results[:max_items]
 
-                page_items = response["result"]
+            async for page_items in self.iter_pages(
+                method,
+                current_params,
+                error_message,
+                page_size=actual_page_size,
+                start_param_name=start_param_name,
+            ):
+                all_results.extend(process_page(page_items))
 
-                if not page_items:
+                if len(all_results) >= total_items_to_fetch:
                     break
 
-                processed_items = process_page(page_items)
-                all_results.extend(processed_items)
+            return all_results[:max_items]
+        except Exception as e:
+            logger.error(f"{error_message}: ошибка при пагинации: {e}")
+            return []
 
-                if len(page_items) < actual_page_size:
-                    break
+    async def iter_pages(  # noqa: PLR0913
+        self,
+        method: str,
+        params: dict[str, Any],
+        error_message: str,
+        page_size: int | None = None,
+        start_param_name: str = "start",
+        *,
+        strict: bool = False,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Последовательная загрузка страниц по смещению.
+
+        Страницы возвращаются по мере получения, не накапливаясь в памяти.
+
+        :param method: Метод API для вызова
+        :param params: Параметры запроса
+        :param error_message: Сообщение при ошибке
+        :param page_size: Размер страницы (если не указан, используется максимальный)
+        :param start_param_name: Имя параметра для начальной позиции
+        :param strict: Выбрасывать исключение при некорректном ответе,
+                       а не завершать загрузку, как при последней странице
+        :returns: Асинхронный итератор по страницам необработанных данных
+        :raises ValueError: Если при strict получен некорректный ответ
+        """
+        actual_page_size = page_size or self._page_size
+
+        current_params = params.copy()
+        if start_param_name not in current_params:
+            current_params[start_param_name] = 0
+
+        priority: CallPriority | None = None
+
+        while True:
+            try:
+                response = await self._call(
+                    method,
+                    current_params,
+                    raw=True,
+                    priority=priority,
+                )
+            except DeadlineExceededError:
+                if strict:
+                    raise
+                logger.warning(f"{error_message}: загрузка прервана по сроку")
+                return
+            priority = CallPriority.BULK
+
+            if not response or "result" not in response:
+                if strict:
+                    msg = f"{error_message}: получен некорректный ответ"
+                    raise ValueError(msg)
+                logger.warning(f"{error_message}: получен некорректный ответ")
+                return
+
+            page_items = response["result"]
+
+            if not page_items:
+                return
 
-                current_params[start_param_name] += actual_page_size
+            yield page_items
 
-            return all_results[: int(total_items_to_fetch)]
+            if len(page_items) < actual_page_size:
+                return
+
+            current_params[start_param_name] += actual_page_size
+
+    async def _fetch_pages_concurrently(  # noqa: PLR0913, PLR0917
+        self,
+        method: str,
+        params: dict[str, Any],
+        error_message: str,
+        page_size: int,
+        max_items: float,
+        start_param_name: str,
+        use_batch: bool,
+    ) -> list[list[dict[str, Any]]]:
+        """Загрузка страниц списка с параллельными запросами.
+
+        :param method: Метод API для вызова
+        :param params: Параметры запроса с начальной позицией
+        :param error_message: Сообщение при ошибке
+        :param page_size: Размер страницы
+        :param max_items: Максимальное количество элементов для получения
+        :param start_param_name: Имя параметра для начальной позиции
+        :param use_batch: Упаковывать страницы в пакетные запросы
+        :returns: Список страниц в порядке их смещения
+        """
+        response = await self._call(method, params, raw=True)
+
+        if not response or "result" not in response:
+            logger.warning(f"{error_message}: получен некорректный ответ")
+            return []
+
+        first_page: list[dict[str, Any]] = response["result"] or []
+        total = response.get("total")
+        if len(first_page) < page_size or not isinstance(total, int):
+            return [first_page]
+
+        start = int(params[start_param_name])
+        end = (
+            total if max_items == float("inf") else min(total, start + max_items)
+        )
+        offsets = list(range(start + page_size, int(end), page_size))
+        if not offsets:
+            return [first_page]
+
+        with call_priority(CallPriority.BULK):
+            return [
+                first_page,
+                *await self._fetch_remaining_pages(
+                    method,
+                    params,
+                    error_message,
+                    offsets,
+                    start_param_name,
+                    use_batch,
+                ),
+            ]
+
+    async def _fetch_remaining_pages(  # noqa: PLR0913, PLR0917
+        self,
+        method: str,
+        params: dict[str, Any],
+        error_message: str,
+        offsets: list[int],
+        start_param_name: str,
+        use_batch: bool,
+    ) -> list[list[dict[str, Any]]]:
+        """Загрузка страниц после первой по известным смещениям.
+
+        Если срок вызова истек, возвращаются страницы до первой
+        незагруженной, а срок помечается как сокративший результат.
+        Страница, не загруженная по другой причине, прерывает загрузку
+        исключением, чтобы в результате не было пропусков.
+
+        :param method: Метод API для вызова
+        :param params: Параметры запроса
+        :param error_message: Сообщение при ошибке
+        :param offsets: Смещения страниц
+        :param start_param_name: Имя параметра для начальной позиции
+        :param use_batch: Упаковывать страницы в пакетные запросы
+        :returns: Список страниц в порядке их смещения
+        :raises RuntimeError: Если страницу не удалось загрузить до срока
+        """
+        if use_batch:
+            batch = await self.execute_batch_detailed(
+                {
+                    f"page{offset}": (
+                        method,
+                        {**params, start_param_name: offset},
+                    )
+                    for offset in offsets
+                },
+                error_message=error_message,
+            )
+            pages: list[list[dict[str, Any]] | None] = [
+                batch.result.get(f"page{offset}") for offset in offsets
+            ]
+            errors = [batch.errors.get(f"page{offset}") for offset in offsets]
+        else:
+            semaphore = asyncio.Semaphore(self._pagination_concurrency)
+
+            async def fetch_page(offset: int) -> list[dict[str, Any]] | None:
+                try:
+                    async with semaphore:
+                        page_response = await self._call(
+                            method,
+                            {**params, start_param_name: offset},
+                            raw=True,
+                        )
+                except DeadlineExceededError:
+                    return None
+                if not page_response or "result" not in page_response:
+                    return None
+                return page_response["result"] or []
+
+            pages = list(
+                await asyncio.gather(
+                    *(fetch_page(offset) for offset in offsets),
+                ),
+            )
+            errors = ["некорректный ответ"] * len(offsets)
+
+        loaded: list[list[dict[str, Any]]] = []
+        for offset, page, error in zip(offsets, pages, errors, strict=True):
+            if page is not None:
+                loaded.append(page)
+                continue
+
+            current_deadline = get_deadline()
+            if current_deadline is not None and current_deadline.expired:
+                current_deadline.mark_truncated()
+                logger.warning(f"{error_message}: загрузка прервана по сроку")
+                return loaded
+
+            msg = f"{error_message}: страница {offset} не загружена: {error}"
+            raise RuntimeError(msg)
+
+        return loaded
+
+    async def paginate_keyset[T](  # noqa: PLR0913, PLR0917
+        self,
+        method: str,
+        params: dict[str, Any],
+        process_page: Callable[[list[dict[str, Any]]], list[T]],
+        error_message: str,
+        max_items: int | None = None,
+        direction: str = "ASC",
+        id_field: str = "ID",
+        filter_param_name: str = "filter",
+        select_param_name: str = "select",
+        order_param_name: str = "order",
+        start_param_name: str = "start",
+    ) -> list[T]:
+        """Получение данных с пагинацией по ключу (ID-курсору).
+
+        Вместо смещения каждая следующая страница запрашивается с фильтром
+        `>ID` (или `<ID` при убывающем порядке) от последней полученной
+        записи и `start=-1`, при котором Bitrix24 не подсчитывает общее
+        количество записей. Время запроса не растет с номером страницы.
+
+        :param method: Метод API для вызова
+        :param params: Параметры запроса
+        :param process_page: Функция для обработки каждой страницы результатов
+        :param error_message: Сообщение при ошибке
+        :param max_items: Максимальное количество элементов для получения
+        :param direction: Порядок по идентификатору (ASC или DESC)
+        :param id_field: Имя поля идентификатора
+        :param filter_param_name: Имя параметра фильтра
+        :param select_param_name: Имя параметра списка полей
+        :param order_param_name: Имя параметра сортировки
+        :param start_param_name: Имя параметра для начальной позиции
+        :returns: Объединенный список обработанных результатов
+        """
+        try:
+            all_results: list[T] = []
+            total_items_to_fetch = (
+                float("inf") if max_items is None else max_items
+            )
+
+            async for page_items in self.iter_pages_keyset(
+                method,
+                params,
+                error_message,
+                direction=direction,
+                id_field=id_field,
+                filter_param_name=filter_param_name,
+                select_param_name=select_param_name,
+                order_param_name=order_param_name,
+                start_param_name=start_param_name,
+            ):
+                all_results.extend(process_page(page_items))
+
+                if len(all_results) >= total_items_to_fetch:
+                    break
+
+            return all_results[:max_items]
         except Exception as e:
-            logger.error(f"{error_message}: ошибка при пагинации: {e}")
+            logger.error(f"{error_message}: ошибка при пагинации по ключу: {e}")
             return []
 
+    async def iter_pages_keyset(  # noqa: PLR0913, PLR0917
+        self,
+        method: str,
+        params: dict[str, Any],
+        error_message: str,
+        direction: str = "ASC",
+        id_field: str = "ID",
+        filter_param_name: str = "filter",
+        select_param_name: str = "select",
+        order_param_name: str = "order",
+        start_param_name: str = "start",
+        *,
+        strict: bool = False,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Загрузка страниц по ключу (ID-курсору) по мере получения.
+
+        :param method: Метод API для вызова
+        :param params: Параметры запроса
+        :param error_message: Сообщение при ошибке
+        :param direction: Порядок по идентификатору (ASC или DESC)
+        :param id_field: Имя поля идентификатора
+        :param filter_param_name: Имя параметра фильтра
+        :param select_param_name: Имя параметра списка полей
+        :param order_param_name: Имя параметра сортировки
+        :param start_param_name: Имя параметра для начальной позиции
+        :param strict: Выбрасывать исключение при некорректном ответе,
+                       а не завершать загрузку, как при последней странице
+        :returns: Асинхронный итератор по страницам необработанных данных
+        :raises ValueError: Если при strict получен некорректный ответ
+        """
+        descending = direction.upper() == "DESC"
+        cursor_key = f"{'<' if descending else '>'}{id_field}"
+        base_filter = dict(params.get(filter_param_name) or {})
+
+        current_params = {
+            **params,
+            order_param_name: {id_field: "DESC" if descending else "ASC"},
+            start_param_name: -1,
+        }
+        select = current_params.get(select_param_name)
+        if select and id_field not in select and "*" not in select:
+            current_params[select_param_name] = [id_field, *select]
+
+        last_id: int | None = None
+        priority: CallPriority | None = None
+
+        while True:
+            page_filter = dict(base_filter)
+            if last_id is not None:
+                page_filter[cursor_key] = last_id
+            current_params[filter_param_name] = page_filter
+
+            try:
+                response = await self._call(
+                    method,
+                    current_params,
+                    raw=True,
+                    priority=priority,
+                )
+            except DeadlineExceededError:
+                if strict:
+                    raise
+                logger.warning(f"{error_message}: загрузка прервана по сроку")
+                return
+            priority = CallPriority.BULK
+
+            if not response or "result" not in response:
+                if strict:
+                    msg = f"{error_message}: получен некорректный ответ"
+                    raise ValueError(msg)
+                logger.warning(f"{error_message}: получен некорректный ответ")
+                return
+
+            page_items = response["result"]
+
+            if not page_items:
+                return
+
+            yield page_items
+
+            if len(page_items) < self._page_size:
+                return
+
+            last_id = int(page_items[-1][id_field])
+
+    @staticmethod
+    def keyset_direction(
+        order: dict[str, str] | None,
+        id_field: str = "ID",
+    ) -> str | None:
+        """Определение порядка для пагинации по ключу.
+
+        Пагинация по ключу возможна, только если сортировка не задана
+        или задана исключительно по идентификатору.
+
+        :param order: Параметры сортировки
+        :param id_field: Имя поля идентификатора
+        :returns: ASC или DESC, либо None, если пагинация по ключу невозможна
+        """
+        if not order:
+            return "ASC"
+        if set(order) != {id_field}:
+            return None
+        direction = str(order[id_field]).upper()
+        return direction if direction in {"ASC", "DESC"} else None
+
     async def get_all[T](  # noqa: PLR0913
         self,
         method: str,
         params: dict[str, Any],
         processor: Callable[[dict[str, Any]], T | None],
         error_message: str,
+        *,
         use_pagination: bool = True,
         page_size: int = 50,
         max_items: int | None = None,
+        parallel: bool = False,
     ) -> list[T]:
         """Получение всех элементов с использованием пагинации или без нее.
 
@@ -97,6 +499,7 @@ class BitrixPaginationMixin(BaseMixin):
         :param use_pagination: Использовать пагинацию
         :param page_size: Размер страницы (при использовании пагинации)
         :param max_items: Максимальное количество элементов для получения
+        :param parallel: Запрашивать страницы параллельно
         :returns: Список обработанных элементов
         """
         try:
@@ -112,8 +515,9 @@ class BitrixPaginationMixin(BaseMixin):
                     error_message=error_message,
                     page_size=page_size,
                     max_items=max_items,
+                    parallel=parallel,
                 )
-            response = await self._bitrix.call(method, params)
+            response = await self._call(method, params, raw=True)
 
             if not response or "result" not in response:
                 logger.warning(
@@ -4,17 +4,24 @@
 особенностей разных типов сущностей.
 """
 
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any, ClassVar
 
 from src.domain.entities.base_entity import BitrixEntity
-from src.infrastructure.bitrix.mixins.base import BaseMixin
+from src.domain.entities.lazy_entity import LazyEntity
+from src.infrastructure.bitrix.mixins.pagination import BitrixPaginationMixin
 from src.infrastructure.logging.logger import logger
+from src.infrastructure.replica.storage import UnsupportedFilterError
 
 
-class BitrixReadMixin[T: BitrixEntity](BaseMixin):
+class BitrixReadMixin[T: BitrixEntity](BitrixPaginationMixin):
     """Миксин для операций чтения данных из Bitrix24 API.
 
     Предоставляет методы для получения сущностей и их списков.
+    Списки длиннее одной страницы загружаются через пагинацию,
+    полные выгрузки (`limit=-1`) с первой записи при сортировке по ID -
+    по ключу.
+    При подключенной локальной реплике списки читаются из нее.
     """
 
     _bitrix_list_method: ClassVar[str]
@@ -28,12 +35,19 @@ class BitrixReadMixin[T: BitrixEntity](BaseMixin):
     _order_param_name: ClassVar[str] = "order"
     _start_param_name: ClassVar[str] = "start"
 
+    _default_order: ClassVar[dict[str, str] | None] = None
+
     async def get_by_id(self, entity_id: int) -> T | None:
         """Получение сущности по идентификатору.
 
+        Найденная сущность сохраняется в кэш, если он подключен.
+
         :param entity_id: Идентификатор сущности
         :return: Объект сущности или None, если сущность не найдена
         """
+        if cached := self._get_cached_entity(entity_id):
+            return cached
+
         error_message = (
             f"Ошибка при получении {self._format_entity_name(self._entity_factory)} "
             f"с ID={entity_id}"
@@ -41,7 +55,7 @@ class BitrixReadMixin[T: BitrixEntity](BaseMixin):
 
         try:
             response = await self._safe_call(
-                self._bitrix.call,
+                self._call,
                 error_message,
                 None,
                 self._bitrix_get_method,
@@ -57,26 +71,36 @@ class BitrixReadMixin[T: BitrixEntity](BaseMixin):
             if not result:
                 return None
 
-            return await self._process_entity(result)
+            entity = await self._process_entity(result)
+            self._cache_entity(entity_id, entity)
         except Exception as e:
             logger.error(f"{error_message}: {e}")
             return None
+        else:
+            return entity
 
-    async def list_entities(
+    async def list_entities(  # noqa: PLR0913, PLR0917
         self,
         filter_params: dict[str, Any] | None = None,
         select_fields: list[str] | None = None,
         order: dict[str, str] | None = None,
         start: int = 0,
         limit: int = 50,
+        extra_fields: list[str] | None = None,
+        *,
+        use_replica: bool = True,
     ) -> list[T]:
         """Получение списка сущностей с возможностью фильтрации.
 
         :param filter_params: Параметры фильтрации
-        :param select_fields: Список полей для выбора
+        :param select_fields: Список полей для выбора (по умолчанию - только
+                              поля, используемые сущностью)
         :param order: Параметры сортировки
         :param start: Начальная позиция выборки
         :param limit: Максимальное количество возвращаемых записей
+        :param extra_fields: Дополнительные поля, которые нужно выбрать
+                             и вернуть в `additional_fields`
+        :param use_replica: Читать из локальной реплики, если она загружена
         :return: Список сущностей
         """
         error_message = (
@@ -85,49 +109,461 @@ class BitrixReadMixin[T: BitrixEntity](BaseMixin):
         )
 
         try:
-            params: dict[str, Any] = {
-                self._start_param_name: start,
-            }
+            params = self._build_list_params(
+                filter_params,
+                select_fields,
+                order,
+                start,
+                extra_fields,
+            )
 
-            if filter_params:
-                params[self._filter_param_name] = filter_params
+            results = await self._fetch_list_items(
+                params,
+                limit,
+                error_message,
+                use_replica=use_replica,
+            )
 
-            if select_fields:
-                params[self._select_param_name] = select_fields
-            else:
-                params[self._select_param_name] = ["*", "UF_*"]
+            entities = await self._process_page(results, extra_fields)
+        except Exception as e:
+            logger.error(f"{error_message}: {e}")
+            return []
+        else:
+            return entities
 
-            if order:
-                params[self._order_param_name] = order
+    async def iter_entities(
+        self,
+        filter_params: dict[str, Any] | None = None,
+        select_fields: list[str] | None = None,
+        order: dict[str, str] | None = None,
+        limit: int = -1,
+        extra_fields: list[str] | None = None,
+    ) -> AsyncIterator[T]:
+        """Потоковое получение сущностей по мере загрузки страниц.
 
-            b_results: dict[str, list[dict[str, Any]]] = await self._safe_call(
-                self._bitrix.call,
-                error_message,
-                {},
-                self._bitrix_list_method,
-                items=params,
-                raw=True,
+        В отличие от `list_entities` не накапливает результат целиком,
+        поэтому пиковое потребление памяти не зависит от размера выборки.
+
+        :param filter_params: Параметры фильтрации
+        :param select_fields: Список полей для выбора
+        :param order: Параметры сортировки
+        :param limit: Максимальное количество записей (-1 - все записи)
+        :param extra_fields: Дополнительные поля для `additional_fields`
+        :return: Асинхронный итератор по сущностям
+        """
+        async for page in self.iter_entity_pages(
+            filter_params,
+            select_fields,
+            order,
+            limit,
+            extra_fields=extra_fields,
+        ):
+            for entity in page:
+                yield entity
+
+    async def iter_entity_rows(
+        self,
+        filter_params: dict[str, Any] | None = None,
+        select_fields: list[str] | None = None,
+        order: dict[str, str] | None = None,
+        limit: int = -1,
+        extra_fields: list[str] | None = None,
+    ) -> AsyncIterator[LazyEntity[T]]:
+        """Потоковое получение сущностей в виде ленивых оберток.
+
+        В отличие от `iter_entities` записи не преобразуются в объекты
+        сущностей: поля преобразуются только при обращении к ним.
+
+        :param filter_params: Параметры фильтрации
+        :param select_fields: Список полей для выбора
+        :param order: Параметры сортировки
+        :param limit: Максимальное количество записей (-1 - все записи)
+        :param extra_fields: Дополнительные поля для `additional_fields`
+        :return: Асинхронный итератор по ленивым сущностям
+        """
+        async for page in self.iter_entity_pages(
+            filter_params,
+            select_fields,
+            order,
+            limit,
+            process_page=lambda items: self._process_lazy_page(
+                items,
+                extra_fields,
+            ),
+            extra_fields=extra_fields,
+        ):
+            for row in page:
+                yield row
+
+    async def iter_entity_pages(  # noqa: PLR0913, PLR0917
+        self,
+        filter_params: dict[str, Any] | None = None,
+        select_fields: list[str] | None = None,
+        order: dict[str, str] | None = None,
+        limit: int = -1,
+        process_page: Callable[[list[dict[str, Any]]], Awaitable[list[T]]]
+        | None = None,
+        extra_fields: list[str] | None = None,
+    ) -> AsyncIterator[list[T]]:
+        """Постраничное потоковое получение сущностей.
+
+        При сортировке по ID страницы загружаются по ключу, иначе по смещению.
+        Если подключена загруженная локальная реплика, записи читаются из нее.
+
+        :param filter_params: Параметры фильтрации
+        :param select_fields: Список полей для выбора
+        :param order: Параметры сортировки
+        :param limit: Максимальное количество записей (-1 - все записи)
+        :param process_page: Функция преобразования страницы в сущности
+                             (по умолчанию `_process_page`)
+        :param extra_fields: Дополнительные поля для `additional_fields`
+        :return: Асинхронный итератор по страницам сущностей
+        """
+        error_message = (
+            f"Ошибка при потоковом получении сущностей "
+            f"{self._format_entity_name(self._entity_factory)}"
+        )
+        if process_page is None:
+
+            async def process_page(items: list[dict[str, Any]]) -> list[T]:
+                return await self._process_page(items, extra_fields)
+
+        try:
+            params = self._build_list_params(
+                filter_params,
+                select_fields,
+                order,
+                extra_fields=extra_fields,
             )
-            results = b_results.get("result", [])[:limit]
 
-            results = results[:limit]
+            pages = self._iter_replica_pages(params, limit)
+            if pages is None:
+                pages = self._iter_list_pages(params, error_message)
 
-            entities: list[T] = []
+            remaining = float("inf") if limit == -1 else limit
 
-            for result in results:
-                entity = await self._process_entity(result)
-                if entity:
-                    entities.append(entity)
+            async for page_items in pages:
+                entities = await process_page(page_items)
+                if len(entities) >= remaining:
+                    yield entities[: int(remaining)]
+                    return
 
+                remaining -= len(entities)
+                yield entities
         except Exception as e:
             logger.error(f"{error_message}: {e}")
-            return []
+
+    def iter_raw_pages(
+        self,
+        filter_params: dict[str, Any] | None = None,
+        select_fields: list[str] | None = None,
+        order: dict[str, str] | None = None,
+        extra_fields: list[str] | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Постраничная загрузка необработанных записей из API.
+
+        В отличие от `iter_entity_pages` всегда обращается к API
+        (не к локальной реплике) и не перехватывает ошибки: некорректный
+        ответ API прерывает загрузку исключением, чтобы неполный список
+        не был принят за полный.
+
+        :param filter_params: Параметры фильтрации
+        :param select_fields: Список полей для выбора
+        :param order: Параметры сортировки
+        :param extra_fields: Дополнительные поля для выбора
+        :return: Асинхронный итератор по страницам записей
+        """
+        params = self._build_list_params(
+            filter_params,
+            select_fields,
+            order,
+            extra_fields=extra_fields,
+        )
+        return self._iter_list_pages(
+            params,
+            f"Ошибка при загрузке сущностей "
+            f"{self._format_entity_name(self._entity_factory)}",
+            strict=True,
+        )
+
+    async def iter_id_pages(
+        self,
+        filter_params: dict[str, Any] | None = None,
+    ) -> AsyncIterator[list[int]]:
+        """Постраничная загрузка идентификаторов сущностей из API.
+
+        Запрашивается только поле ID с пагинацией по ключу, поэтому
+        идентификаторы возвращаются в порядке возрастания.
+
+        :param filter_params: Параметры фильтрации
+        :return: Асинхронный итератор по страницам идентификаторов
+        :raises ValueError: Если получен некорректный ответ API
+        """
+        async for page in self.iter_raw_pages(
+            filter_params,
+            select_fields=[self._id_param_name],
+            order={self._id_param_name: "ASC"},
+        ):
+            yield [int(item[self._id_param_name]) for item in page]
+
+    def _iter_list_pages(
+        self,
+        params: dict[str, Any],
+        error_message: str,
+        *,
+        strict: bool = False,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Выбор способа постраничной загрузки списка из API.
+
+        :param params: Параметры запроса списка
+        :param error_message: Сообщение при ошибке
+        :param strict: Выбрасывать исключение при некорректном ответе
+        :return: Асинхронный итератор по страницам записей
+        """
+        keyset_direction = self._get_keyset_direction(params)
+
+        if keyset_direction:
+            return self.iter_pages_keyset(
+                self._bitrix_list_method,
+                params,
+                error_message,
+                direction=keyset_direction,
+                id_field=self._id_param_name,
+                filter_param_name=self._filter_param_name,
+                select_param_name=self._select_param_name,
+                order_param_name=self._order_param_name,
+                start_param_name=self._start_param_name,
+                strict=strict,
+            )
+
+        return self.iter_pages(
+            self._bitrix_list_method,
+            params,
+            error_message,
+            start_param_name=self._start_param_name,
+            strict=strict,
+        )
+
+    def _get_keyset_direction(self, params: dict[str, Any]) -> str | None:
+        """Определение порядка для пагинации списка по ключу.
+
+        Курсор по ключу начинает выборку с первой записи, поэтому
+        при ненулевой начальной позиции список загружается по смещению.
+
+        :param params: Параметры запроса списка
+        :return: ASC или DESC, либо None, если пагинация по ключу невозможна
+        """
+        if params.get(self._start_param_name):
+            return None
+        return self.keyset_direction(
+            params.get(self._order_param_name),
+            self._id_param_name,
+        )
+
+    async def _search_replica(
+        self,
+        index_name: str,
+        query: str,
+        limit: int,
+    ) -> list[T] | None:
+        """Поиск сущностей по индексу локальной реплики.
+
+        :param index_name: Имя поискового индекса
+        :param query: Поисковый запрос
+        :param limit: Максимальное количество результатов
+        :return: Сущности по убыванию релевантности или None,
+                 если поиск нужно выполнить через API
+        """
+        if self._replica is None or not self._replica.is_search_ready(
+            self._entity_type,
+        ):
+            return None
+
+        try:
+            items = await self._replica.search(
+                self._entity_type,
+                index_name,
+                query,
+                limit,
+            )
+        except UnsupportedFilterError as e:
+            logger.debug(f"Поиск будет выполнен через API: {e}")
+            return None
+
+        return await self._process_page(items)
+
+    async def _query_replica(
+        self,
+        params: dict[str, Any],
+        limit: int,
+    ) -> list[dict[str, Any]] | None:
+        """Выборка записей списка из локальной реплики.
+
+        :param params: Параметры запроса списка
+        :param limit: Максимальное количество записей (-1 - все записи)
+        :return: Записи или None, если запрос нужно выполнить через API
+        """
+        if self._replica is None or not self._replica_ready():
+            return None
+
+        try:
+            return await self._replica.query(
+                self._entity_type,
+                params.get(self._filter_param_name),
+                params.get(self._order_param_name),
+                params.get(self._start_param_name, 0),
+                limit,
+            )
+        except UnsupportedFilterError as e:
+            logger.debug(f"Запрос будет выполнен через API: {e}")
+            return None
+
+    def _iter_replica_pages(
+        self,
+        params: dict[str, Any],
+        limit: int,
+    ) -> AsyncIterator[list[dict[str, Any]]] | None:
+        """Постраничная выборка записей списка из локальной реплики.
+
+        :param params: Параметры запроса списка
+        :param limit: Максимальное количество записей (-1 - все записи)
+        :return: Асинхронный итератор по страницам записей или None,
+                 если запрос нужно выполнить через API
+        """
+        if self._replica is None or not self._replica_ready():
+            return None
+
+        try:
+            return self._replica.query_pages(
+                self._entity_type,
+                params.get(self._filter_param_name),
+                params.get(self._order_param_name),
+                params.get(self._start_param_name, 0),
+                limit,
+                self._page_size,
+            )
+        except UnsupportedFilterError as e:
+            logger.debug(f"Запрос будет выполнен через API: {e}")
+            return None
+
+    def _build_list_params(
+        self,
+        filter_params: dict[str, Any] | None = None,
+        select_fields: list[str] | None = None,
+        order: dict[str, str] | None = None,
+        start: int = 0,
+        extra_fields: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Формирование параметров запроса списка.
+
+        Если поля для выбора не указаны, запрашиваются только поля,
+        которые использует сущность, плюс явно запрошенные дополнительные.
+
+        :param filter_params: Параметры фильтрации
+        :param select_fields: Список полей для выбора
+        :param order: Параметры сортировки
+        :param start: Начальная позиция выборки
+        :param extra_fields: Дополнительные поля для выбора
+        :return: Параметры для метода списка API
+        """
+        params: dict[str, Any] = {
+            self._start_param_name: start,
+        }
+
+        if filter_params:
+            params[self._filter_param_name] = filter_params
+
+        if select_fields:
+            params[self._select_param_name] = [
+                *select_fields,
+                *(f for f in extra_fields or [] if f not in select_fields),
+            ]
         else:
-            return entities
+            params[self._select_param_name] = (
+                self._entity_factory.get_select_fields(extra_fields)
+            )
+
+        order = order or self._default_order
+        if order:
+            params[self._order_param_name] = order
+
+        return params
+
+    async def _fetch_list_items(
+        self,
+        params: dict[str, Any],
+        limit: int,
+        error_message: str,
+        *,
+        use_replica: bool = True,
+    ) -> list[dict[str, Any]]:
+        """Загрузка необработанных записей списка.
+
+        Если подключена загруженная локальная реплика, записи читаются
+        из нее. Иначе одна страница запрашивается одним вызовом, несколько
+        страниц - параллельно по смещению, полная выгрузка с первой записи
+        при сортировке по ID - по ключу.
+
+        :param params: Параметры запроса списка
+        :param limit: Максимальное количество записей (-1 - все записи)
+        :param error_message: Сообщение при ошибке
+        :param use_replica: Читать из локальной реплики, если она загружена
+        :return: Список необработанных записей
+        """
+        if use_replica:
+            replica_items = await self._query_replica(params, limit)
+            if replica_items is not None:
+                return replica_items
+
+        keyset_direction = self._get_keyset_direction(params)
+
+        if limit == -1 and keyset_direction:
+            return await self.paginate_keyset(
+                self._bitrix_list_method,
+                params,
+                process_page=lambda items: items,
+                error_message=error_message,
+                direction=keyset_direction,
+                id_field=self._id_param_name,
+                filter_param_name=self._filter_param_name,
+                select_param_name=self._select_param_name,
+                order_param_name=self._order_param_name,
+                start_param_name=self._start_param_name,
+            )
+
+        if limit > self._page_size or limit == -1:
+            return await self.paginate(
+                self._bitrix_list_method,
+                params,
+                process_page=lambda items: items,
+                error_message=error_message,
+                max_items=None if limit == -1 else limit,
+                start_param_name=self._start_param_name,
+                parallel=True,
+            )
+
+        b_results: dict[str, list[dict[str, Any]]] = await self._safe_call(
+            self._call,
+            error_message,
+            {},
+            self._bitrix_list_method,
+            params,
+            raw=True,
+        )
+        return b_results.get("result", [])[:limit]
 
     async def get_fields(self) -> dict[str, Any]:
         """Получение описания полей сущности.
 
+        Описание полей берется из кэша метаданных, если он подключен.
+
+        :return: Словарь с описанием полей сущности
+        """
+        return await self._get_metadata("fields", self._load_fields) or {}
+
+    async def _load_fields(self) -> dict[str, Any]:
+        """Загрузка описания полей сущности из API.
+
         :return: Словарь с описанием полей сущности
         """
         error_message = (
@@ -136,10 +572,11 @@ class BitrixReadMixin[T: BitrixEntity](BaseMixin):
         )
 
         response = await self._safe_call(
-            self._bitrix.call,
+            self._call,
             error_message,
             None,
             self._bitrix_fields_method,
+            raw=True,
         )
 
         if not response or "result" not in response:
@@ -148,6 +585,65 @@ class BitrixReadMixin[T: BitrixEntity](BaseMixin):
 
         return response.get("result", {})
 
+    async def _process_page(
+        self,
+        items: list[dict[str, Any]],
+        extra_fields: list[str] | None = None,
+    ) -> list[T]:
+        """Преобразование страницы данных из API в сущности.
+
+        :param items: Необработанные записи страницы
+        :param extra_fields: Дополнительные поля для `additional_fields`
+        :return: Список успешно обработанных сущностей
+        """
+        entities: list[T] = []
+
+        for item in items:
+            entity = await self._process_entity(item)
+            if entity:
+                if extra_fields:
+                    entity.additional_fields = (
+                        self._entity_factory.pick_additional_fields(
+                            item,
+                            extra_fields,
+                        )
+                    )
+                entities.append(entity)
+
+        return entities
+
+    async def _process_lazy_page(
+        self,
+        items: list[dict[str, Any]],
+        extra_fields: list[str] | None = None,
+    ) -> list[LazyEntity[T]]:
+        """Преобразование страницы данных из API в ленивые сущности.
+
+        :param items: Необработанные записи страницы
+        :param extra_fields: Дополнительные поля для `additional_fields`
+        :return: Список ленивых сущностей
+        """
+        rows: list[LazyEntity[T]] = []
+
+        for item in items:
+            values: dict[str, Any] = {}
+            if extra_fields:
+                values["additional_fields"] = (
+                    self._entity_factory.pick_additional_fields(
+                        item,
+                        extra_fields,
+                    )
+                )
+            try:
+                rows.append(LazyEntity(self._entity_factory, item, **values))
+            except ValueError as e:
+                logger.error(
+                    f"Ошибка при обработке сущности "
+                    f"{self._format_entity_name(self._entity_factory)}: {e}",
+                )
+
+        return rows
+
     async def _process_entity(self, data: dict[str, Any]) -> T | None:
         """Обработка данных сущности из API.
 
@@ -43,7 +43,7 @@ class BitrixRelationshipMixin(BaseMixin):
             )
 
         response = await self._safe_call(
-            self._bitrix.call,
+            self._call,
             error_message,
             {},
             method=method,
@@ -80,7 +80,7 @@ class BitrixRelationshipMixin(BaseMixin):
             )
 
         response = await self._safe_call(
-            self._bitrix.call,
+            self._call,
             error_message,
             {},
             method=method,
@@ -113,7 +113,7 @@ class BitrixRelationshipMixin(BaseMixin):
             )
 
         response = await self._safe_call(
-            self._bitrix.call,
+            self._call,
             error_message,
             {},
             method=method,
@@ -14,8 +14,11 @@ class BitrixWriteMixin[T: BitrixEntity](BaseMixin):
     """Миксин для операций записи данных в Bitrix24 API.
 
     Предоставляет методы для создания, обновления и удаления сущностей.
+    Обновление и удаление сбрасывают сущность в кэше и обновляют
+    ее в локальной реплике.
     """
 
+    _bitrix_get_method: ClassVar[str]
     _bitrix_create_method: ClassVar[str]
     _bitrix_update_method: ClassVar[str]
     _bitrix_delete_method: ClassVar[str]
@@ -39,7 +42,7 @@ class BitrixWriteMixin[T: BitrixEntity](BaseMixin):
             fields = entity.to_bitrix()
 
             response = await self._safe_call(
-                self._bitrix.call,
+                self._call,
                 error_message,
                 None,
                 self._bitrix_create_method,
@@ -86,7 +89,7 @@ class BitrixWriteMixin[T: BitrixEntity](BaseMixin):
             fields = entity.to_bitrix()
 
             response = await self._safe_call(
-                self._bitrix.call,
+                self._call,
                 error_message,
                 None,
                 self._bitrix_update_method,
@@ -95,6 +98,8 @@ class BitrixWriteMixin[T: BitrixEntity](BaseMixin):
                     self._fields_param_name: fields,
                 },
             )
+            self._invalidate_cached_entity(entity_id)
+            await self._sync_replica_entity(entity_id)
 
             if not response or "result" not in response:
                 logger.warning(f"{error_message}: получен некорректный ответ")
@@ -123,7 +128,7 @@ class BitrixWriteMixin[T: BitrixEntity](BaseMixin):
 
         try:
             response = await self._safe_call(
-                self._bitrix.call,
+                self._call,
                 error_message,
                 None,
                 self._bitrix_update_method,
@@ -132,6 +137,8 @@ class BitrixWriteMixin[T: BitrixEntity](BaseMixin):
                     self._fields_param_name: fields,
                 },
             )
+            self._invalidate_cached_entity(entity_id)
+            await self._sync_replica_entity(entity_id)
 
             if not response or "result" not in response:
                 logger.warning(f"{error_message}: получен некорректный ответ")
@@ -155,12 +162,14 @@ class BitrixWriteMixin[T: BitrixEntity](BaseMixin):
 
         try:
             response = await self._safe_call(
-                self._bitrix.call,
+                self._call,
                 error_message,
                 None,
                 self._bitrix_delete_method,
                 {self._id_param_name: entity_id},
             )
+            self._invalidate_cached_entity(entity_id)
+            await self._sync_replica_entity(entity_id, deleted=True)
 
             if not response or "result" not in response:
                 logger.warning(f"{error_message}: получен некорректный ответ")
@@ -170,3 +179,39 @@ class BitrixWriteMixin[T: BitrixEntity](BaseMixin):
         except Exception as e:
             logger.error(f"{error_message}: {e}")
             return False
+
+    async def _sync_replica_entity(
+        self,
+        entity_id: int,
+        *,
+        deleted: bool = False,
+    ) -> None:
+        """Обновление сущности в локальной реплике после ее изменения.
+
+        Сущность перечитывается из API, чтобы реплика не ждала
+        следующей синхронизации.
+
+        :param entity_id: Идентификатор сущности
+        :param deleted: Сущность удалена
+        """
+        if self._replica is None or not self._replica_ready():
+            return
+
+        try:
+            if deleted:
+                await self._replica.delete(self._entity_type, [entity_id])
+                return
+
+            response = await self._call(
+                self._bitrix_get_method,
+                {self._id_param_name: entity_id},
+                raw=True,
+            )
+            if data := (response or {}).get("result"):
+                await self._replica.upsert(self._entity_type, [data])
+        except Exception as e:
+            logger.warning(
+                f"Не удалось обновить сущность "
+                f"{self._format_entity_name(self._entity_factory)} "
+                f"с ID={entity_id} в локальной реплике: {e}",
+            )
@@ -0,0 +1,299 @@
+"""Модуль с ограничением частоты запросов к API Bitrix24.
+
+Bitrix24 ограничивает интенсивность запросов по схеме leaky bucket
+(на обычных тарифах - 2 запроса в секунду с запасом 50 запросов)
+и суммарное время выполнения запросов каждого метода (`operating`,
+480 секунд за 10 минут). Превышение первого лимита приводит к ошибке
+QUERY_LIMIT_EXCEEDED (HTTP 503), второго - к блокировке метода.
+
+Запросы, ожидающие разрешения, распределяются по классам приоритета,
+чтобы точечные запросы не ждали за сотнями страниц массовой выгрузки.
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from http import HTTPStatus
+from typing import Any, ClassVar
+
+from aiohttp import ClientResponseError
+
+from src.infrastructure.bitrix.retry import iter_error_chain
+from src.infrastructure.logging.logger import logger
+
+QUERY_LIMIT_EXCEEDED = "QUERY_LIMIT_EXCEEDED"
+WRITE_METHOD_SUFFIXES = (".add", ".update", ".delete", ".set")
+
+
+class CallPriority(IntEnum):
+    """Класс приоритета запроса к API Bitrix24."""
+
+    # Точечные чтения, которых ждет пользователь
+    INTERACTIVE = 0
+    # Изменение данных
+    WRITE = 1
+    # Постраничные выгрузки и синхронизация
+    BULK = 2
+
+
+_call_priority: ContextVar[CallPriority | None] = ContextVar(
+    "bitrix_call_priority",
+    default=None,
+)
+
+
+@contextmanager
+def call_priority(priority: CallPriority) -> Iterator[None]:
+    """Установка приоритета для всех запросов внутри блока.
+
+    Приоритет передается и в задачи, созданные внутри блока.
+
+    :param priority: Класс приоритета
+    """
+    token = _call_priority.set(priority)
+    try:
+        yield
+    finally:
+        _call_priority.reset(token)
+
+
+def resolve_call_priority(method: str) -> CallPriority:
+    """Определение приоритета запроса.
+
+    :param method: Метод API
+    :return: Приоритет, установленный `call_priority`, а если его нет -
+             WRITE для методов изменения и INTERACTIVE для остальных
+    """
+    priority = _call_priority.get()
+    if priority is not None:
+        return priority
+    if method.endswith(WRITE_METHOD_SUFFIXES):
+        return CallPriority.WRITE
+    return CallPriority.INTERACTIVE
+
+
+def is_query_limit_exceeded(error: Any) -> bool:
+    """Проверка, вызвана ли ошибка превышением лимита запросов.
+
+    Клиент fast_bitrix24 получает ответ с QUERY_LIMIT_EXCEEDED как
+    ошибку HTTP 503, не читая тело ответа, и передает ее причиной
+    (`__cause__`) своих исключений, поэтому превышение лимита
+    определяется и по коду ответа в цепочке причин.
+
+    :param error: Исключение или ответ API
+    :return: True, если Bitrix24 вернул QUERY_LIMIT_EXCEEDED
+    """
+    if isinstance(error, dict):
+        return error.get("error") == QUERY_LIMIT_EXCEEDED
+    if not isinstance(error, BaseException):
+        return QUERY_LIMIT_EXCEEDED in str(error)
+    return any(
+        QUERY_LIMIT_EXCEEDED in str(cause)
+        or (
+            isinstance(cause, ClientResponseError)
+            and cause.status == HTTPStatus.SERVICE_UNAVAILABLE
+        )
+        for cause in iter_error_chain(error)
+    )
+
+
+class AdaptiveRateLimiter:
+    """Адаптивный ограничитель частоты запросов (token bucket).
+
+    Один экземпляр используется всеми репозиториями процесса, поэтому
+    запросы разных клиентов Bitrix24 расходуют общий лимит. Частота
+    подстраивается по обратной связи от API: при QUERY_LIMIT_EXCEEDED
+    и при приближении `time.operating` метода к лимиту снижается вдвое,
+    после успешных ответов постепенно возвращается к максимальной.
+    Метод, исчерпавший лимит времени выполнения, приостанавливается
+    до `time.operating_reset_at`.
+
+    Когда разрешений не хватает, запросы встают в очереди своих классов
+    приоритета. Очереди обслуживаются пропорционально весам (stride
+    scheduling): при постоянной нагрузке на каждые 16 точечных запросов
+    приходится один запрос выгрузки, так что выгрузка не останавливается
+    полностью. Внутри класса запросы обслуживаются в порядке очереди.
+    """
+
+    # Доля лимита времени выполнения, после которой частота снижается
+    _operating_slowdown_share: ClassVar[float] = 0.8
+    # Прирост частоты (запросов в секунду) после каждого успешного ответа
+    _rate_increase_step: ClassVar[float] = 0.05
+    # Частота снижается не чаще раза за интервал: одновременные ответы
+    # про одну перегрузку учитываются однократно
+    _decrease_interval: ClassVar[float] = 1.0
+    _priority_weights: ClassVar[dict[CallPriority, float]] = {
+        CallPriority.INTERACTIVE: 16.0,
+        CallPriority.WRITE: 4.0,
+        CallPriority.BULK: 1.0,
+    }
+
+    def __init__(
+        self,
+        rate: float = 2.0,
+        burst: int = 50,
+        min_rate: float = 0.2,
+        operating_limit: float = 480.0,
+    ):
+        """Инициализация ограничителя.
+
+        :param rate: Максимальная частота запросов в секунду
+        :param burst: Количество запросов, которое можно выполнить без ожидания
+        :param min_rate: Минимальная частота запросов в секунду
+        :param operating_limit: Лимит времени выполнения метода в секундах
+        """
+        self._max_rate = rate
+        self._min_rate = min(min_rate, rate)
+        self._rate = rate
+        self._burst = max(burst, 1)
+        self._operating_limit = operating_limit
+        self._tokens = float(self._burst)
+        self._updated_at = time.monotonic()
+        self._decreased_at = float("-inf")
+        self._method_paused_until: dict[str, float] = {}
+        self._queues: dict[CallPriority, deque[asyncio.Future[None]]] = {
+            priority: deque() for priority in CallPriority
+        }
+        self._passes = dict.fromkeys(CallPriority, 0.0)
+        self._virtual_time = 0.0
+        self._dispatcher: asyncio.Task[None] | None = None
+
+    @property
+    def rate(self) -> float:
+        """Текущая частота запросов в секунду."""
+        return self._rate
+
+    async def acquire(
+        self,
+        method: str,
+        priority: CallPriority = CallPriority.INTERACTIVE,
+    ) -> None:
+        """Ожидание разрешения на запрос.
+
+        :param method: Метод API
+        :param priority: Класс приоритета запроса
+        """
+        paused_for = self._method_paused_until.get(method, 0.0) - time.monotonic()
+        if paused_for > 0:
+            await asyncio.sleep(paused_for)
+
+        if not any(self._queues.values()):
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+
+        queue = self._queues[priority]
+        if not queue:
+            # Простаивавший класс не накапливает право на внеочередные запросы
+            self._passes[priority] = max(
+                self._passes[priority],
+                self._virtual_time,
+            )
+
+        waiter = asyncio.get_running_loop().create_future()
+        queue.append(waiter)
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+        await waiter
+
+    def observe(self, method: str, response: Any) -> None:
+        """Учет ответа API для подстройки частоты запросов.
+
+        :param method: Метод API
+        :param response: Ответ API (время выполнения есть только в полном ответе)
+        """
+        timing = response.get("time") if isinstance(response, dict) else None
+        if not isinstance(timing, dict) or not timing.get("operating"):
+            self._increase_rate()
+            return
+
+        share = float(timing["operating"]) / self._operating_limit
+        if share < self._operating_slowdown_share:
+            self._increase_rate()
+            return
+
+        self._decrease_rate()
+        reset_at = timing.get("operating_reset_at")
+        if share >= 1 and reset_at:
+            paused_for = float(reset_at) - time.time()
+            if paused_for > 0:
+                self._method_paused_until[method] = time.monotonic() + paused_for
+                logger.warning(
+                    f"Метод {method} исчерпал лимит времени выполнения, "
+                    f"запросы приостановлены на {paused_for:.0f} с",
+                )
+
+    def on_limit_exceeded(self) -> None:
+        """Учет ошибки QUERY_LIMIT_EXCEEDED."""
+        self._tokens = 0.0
+        self._updated_at = time.monotonic()
+        self._decrease_rate()
+        logger.warning(
+            f"Превышен лимит запросов Bitrix24, частота снижена "
+            f"до {self._rate:.2f} запросов в секунду",
+        )
+
+    async def _dispatch(self) -> None:
+        """Выдача разрешений ожидающим запросам по мере пополнения запаса."""
+        while (priority := self._next_priority()) is not None:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                continue
+
+            self._tokens -= 1
+            self._virtual_time = self._passes[priority]
+            self._passes[priority] += 1 / self._priority_weights[priority]
+            self._queues[priority].popleft().set_result(None)
+
+    def _next_priority(self) -> CallPriority | None:
+        """Выбор класса приоритета, который получит следующее разрешение.
+
+        :return: Класс с наименьшим пройденным путем среди непустых
+                 или None, если ожидающих запросов нет
+        """
+        candidates: list[CallPriority] = []
+        for priority, queue in self._queues.items():
+            # Отмененные запросы разрешений не получают
+            while queue and queue[0].done():
+                queue.popleft()
+            if queue:
+                candidates.append(priority)
+
+        if not candidates:
+            return None
+        return min(
+            candidates,
+            key=lambda priority: (self._passes[priority], priority),
+        )
+
+    def _refill(self) -> None:
+        """Пополнение запаса запросов за прошедшее время."""
+        now = time.monotonic()
+        self._tokens = min(
+            self._burst,
+            self._tokens + (now - self._updated_at) * self._rate,
+        )
+        self._updated_at = now
+
+    def _increase_rate(self) -> None:
+        """Постепенное увеличение частоты до максимальной."""
+        if self._rate < self._max_rate:
+            self._refill()
+            self._rate = min(self._max_rate, self._rate + self._rate_increase_step)
+
+    def _decrease_rate(self) -> None:
+        """Снижение частоты вдвое, но не ниже минимальной."""
+        now = time.monotonic()
+        if now - self._decreased_at < self._decrease_interval:
+            return
+
+        self._refill()
+        self._rate = max(self._min_rate, self._rate / 2)
+        self._decreased_at = now
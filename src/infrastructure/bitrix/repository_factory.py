@@ -2,7 +2,10 @@
 Предоставляет единую точку доступа к экземплярам репозиториев.
 """
 
+import asyncio
+
 from src.domain.interfaces.base_repository import BitrixRepository
+from src.infrastructure.logging.logger import logger
 
 
 class BitrixRepositoryFactory:
@@ -37,3 +40,26 @@ class BitrixRepositoryFactory:
                 return repository
         msg = f"Неизвестный тип сущности: {entity_type}"
         raise ValueError(msg)
+
+    async def warm_up_metadata(self) -> None:
+        """Предварительная загрузка метаданных всех репозиториев в кэш.
+
+        Ошибки загрузки логируются и не прерывают запуск сервера.
+        """
+        results = await asyncio.gather(
+            *(
+                repository.warm_up_metadata()
+                for repository in self._repository_classes
+            ),
+            return_exceptions=True,
+        )
+        for repository, result in zip(
+            self._repository_classes,
+            results,
+            strict=True,
+        ):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Ошибка при загрузке метаданных "
+                    f"{repository._entity_type}: {result}",  # noqa: SLF001
+                )
@@ -0,0 +1,114 @@
+"""Модуль с политикой повторных попыток вызовов API Bitrix24.
+
+Кратковременные сетевые сбои и превышение лимита запросов не должны
+превращаться в ответ «не найдено»: запрос повторяется с экспоненциально
+растущей паузой со случайной составляющей (full jitter), пока не исчерпаны
+попытки или общее время на вызов.
+
+Клиент fast_bitrix24 сам повторяет запрос после сетевых ошибок и ответов
+5XX и выбрасывает исключение, только исчерпав собственные попытки, поэтому
+ошибки классифицируются по всей цепочке причин (`iter_error_chain`).
+"""
+
+import random
+from collections.abc import Iterator
+from dataclasses import dataclass
+from http import HTTPStatus
+
+from aiohttp import ClientConnectionError, ClientPayloadError, ClientResponseError
+from fast_bitrix24.srh import ServerError
+
+# Ошибки, после которых повтор идемпотентного запроса безопасен
+# (ServerError - ответ 5XX в исключениях клиента fast_bitrix24)
+RETRYABLE_ERRORS: tuple[type[Exception], ...] = (
+    ConnectionError,
+    TimeoutError,
+    ClientConnectionError,
+    ClientPayloadError,
+    ServerError,
+)
+
+
+def iter_error_chain(error: BaseException) -> Iterator[BaseException]:
+    """Обход исключения и его причин (`__cause__`).
+
+    Клиент fast_bitrix24 сам повторяет запросы после сетевых ошибок
+    и ответов 5XX, а исчерпав попытки, выбрасывает RuntimeError, исходная
+    ошибка которого доступна только как причина.
+
+    :param error: Исключение
+    :return: Итератор по исключению и цепочке его причин
+    """
+    seen: set[int] = set()
+    current: BaseException | None = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        yield current
+        current = current.__cause__
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """Проверка, является ли ошибка кратковременным сбоем запроса.
+
+    :param error: Исключение
+    :return: True, если исключение или одна из его причин - сетевая
+             ошибка, таймаут или ответ 5XX
+    """
+    for cause in iter_error_chain(error):
+        if isinstance(cause, ClientResponseError):
+            return cause.status >= HTTPStatus.INTERNAL_SERVER_ERROR
+        if isinstance(cause, RETRYABLE_ERRORS):
+            return True
+    return False
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Политика повторных попыток вызова метода API.
+
+    QUERY_LIMIT_EXCEEDED повторяется для любых методов: Bitrix24
+    отклоняет такой запрос до выполнения. Сетевые ошибки повторяются,
+    только если `retry_errors` - для методов, не изменяющих данные,
+    так как запрос мог быть выполнен до обрыва соединения.
+    """
+
+    # Максимальное количество попыток, включая первую
+    max_attempts: int = 4
+    # Пауза перед первым повтором в секундах, удваивается после каждой попытки
+    base_delay: float = 0.5
+    # Максимальная пауза между попытками в секундах
+    max_delay: float = 8.0
+    # Общее время на вызов, включая все повторы, в секундах
+    deadline: float = 20.0
+    # Минимальная пауза после QUERY_LIMIT_EXCEEDED в секундах
+    limit_exceeded_delay: float = 1.0
+    # Повторять запрос после сетевых ошибок и таймаутов
+    retry_errors: bool = True
+
+    def get_delay(self, attempt: int, limit_exceeded: bool = False) -> float:
+        """Пауза перед следующей попыткой.
+
+        :param attempt: Номер неудавшейся попытки, начиная с 1
+        :param limit_exceeded: Попытка завершилась QUERY_LIMIT_EXCEEDED
+        :return: Пауза в секундах
+        """
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        delay = random.uniform(0, ceiling)  # noqa: S311
+        if limit_exceeded:
+            return max(delay, self.limit_exceeded_delay)
+        return delay
+
+    def can_retry(
+        self,
+        attempt: int,
+        elapsed: float,
+        delay: float,
+    ) -> bool:
+        """Проверка, остались ли попытки и время на повтор.
+
+        :param attempt: Номер неудавшейся попытки, начиная с 1
+        :param elapsed: Время, прошедшее с начала вызова, в секундах
+        :param delay: Пауза перед следующей попыткой в секундах
+        :return: True, если можно выполнить еще одну попытку
+        """
+        return attempt < self.max_attempts and elapsed + delay < self.deadline
@@ -8,52 +8,172 @@ from fast_bitrix24 import Bitrix
 
 from src.application.services.contact import ContactService
 from src.application.services.deal import DealService
-from src.config import SettingsManager
+from src.config import Settings, SettingsManager
 from src.infrastructure.bitrix.bitrix_contact_repository import BitrixContactRepository
 from src.infrastructure.bitrix.bitrix_deal_repository import BitrixDealRepository
+from src.infrastructure.bitrix.cache import EntityCache, MetadataCache
+from src.infrastructure.bitrix.circuit_breaker import CircuitBreaker
+from src.infrastructure.bitrix.rate_limiter import AdaptiveRateLimiter
 from src.infrastructure.bitrix.repository_factory import BitrixRepositoryFactory
 from src.infrastructure.logging.logger import logger
 from src.infrastructure.mcp.server import BitrixMCPServer
+from src.infrastructure.replica import ReplicaStorage, ReplicaSynchronizer
 
 
 class DependencyProvider(Provider):
-    """Главный провайдер зависимостей приложения."""
-    
-    def __init__(self) -> None:
-        super().__init__()
-        self.bitrix_webhook_url = SettingsManager.get().BITRIX_WEBHOOK_URL
+    """Главный провайдер зависимостей приложения.
+
+    Все зависимости создаются контейнером при первом запросе и существуют
+    в одном экземпляре на процесс (`Scope.APP`). Импорт модуля и создание
+    сервера не читают настройки и не создают клиент Bitrix24. Впервые
+    зависимости запрашивает фоновый прогрев кэша метаданных после запуска
+    сервера или первый вызов инструмента; без `BITRIX_WEBHOOK_URL` прогрев
+    завершается ошибкой в логе, а вызовы инструментов - ошибкой настройки.
+    """
+
+    @provide(scope=Scope.APP)
+    def provide_settings(self) -> Settings:
+        """Предоставляет настройки приложения."""
+        return SettingsManager.get()
 
     @provide(scope=Scope.APP)
-    def provide_bitrix_webhook_url(self) -> str:
+    def provide_bitrix_webhook_url(self, settings: Settings) -> str:
         """Предоставляет URL вебхука Bitrix."""
-        return self.bitrix_webhook_url
-    
+        return settings.BITRIX_WEBHOOK_URL
+
     @provide(scope=Scope.APP)
-    def provide_repository_factory(self) -> BitrixRepositoryFactory:
+    def provide_entity_cache(self, settings: Settings) -> EntityCache:
+        """Предоставляет кэш сущностей."""
+        return EntityCache(
+            max_size=settings.ENTITY_CACHE_SIZE,
+            default_ttl=settings.ENTITY_CACHE_TTL,
+        )
+
+    @provide(scope=Scope.APP)
+    def provide_metadata_cache(self, settings: Settings) -> MetadataCache:
+        """Предоставляет кэш метаданных."""
+        return MetadataCache(ttl=settings.METADATA_CACHE_TTL)
+
+    @provide(scope=Scope.APP)
+    def provide_rate_limiter(self, settings: Settings) -> AdaptiveRateLimiter:
+        """Предоставляет ограничитель частоты запросов.
+
+        Один ограничитель на процесс: лимит Bitrix24 общий для всех клиентов.
+        """
+        return AdaptiveRateLimiter(
+            rate=settings.BITRIX_RATE_LIMIT,
+            burst=settings.BITRIX_RATE_BURST,
+        )
+
+    @provide(scope=Scope.APP)
+    def provide_circuit_breaker(self, settings: Settings) -> CircuitBreaker:
+        """Предоставляет автоматический выключатель запросов к Bitrix24."""
+        return CircuitBreaker(
+            failure_threshold=settings.BITRIX_CIRCUIT_FAILURE_THRESHOLD,
+            open_timeout=settings.BITRIX_CIRCUIT_OPEN_TIMEOUT,
+        )
+
+    @provide(scope=Scope.APP)
+    def provide_replica_storage(
+        self,
+        settings: Settings,
+    ) -> ReplicaStorage | None:
+        """Предоставляет локальную реплику (None, если она не настроена)."""
+        if not settings.REPLICA_PATH:
+            return None
+        return ReplicaStorage(settings.REPLICA_PATH)
+
+    @provide(scope=Scope.APP)
+    def provide_repository_factory(  # noqa: PLR0913, PLR0917
+        self,
+        bitrix_webhook_url: str,
+        entity_cache: EntityCache,
+        metadata_cache: MetadataCache,
+        replica_storage: ReplicaStorage | None,
+        rate_limiter: AdaptiveRateLimiter,
+        circuit_breaker: CircuitBreaker,
+    ) -> BitrixRepositoryFactory:
         """Создание фабрики репозиториев Bitrix24.
 
+        :param bitrix_webhook_url: URL вебхука Bitrix24
+        :param entity_cache: Кэш сущностей
+        :param metadata_cache: Кэш метаданных
+        :param replica_storage: Локальная реплика или None
+        :param rate_limiter: Ограничитель частоты запросов
+        :param circuit_breaker: Автоматический выключатель запросов
         :return: Экземпляр фабрики репозиториев
         """
-        bitrix_client = Bitrix(self.bitrix_webhook_url)
+        # Частоту запросов регулирует общий AdaptiveRateLimiter, учитывающий
+        # приоритеты, поэтому ограничение частоты самого клиента
+        # не задерживает запросы. Ограничение времени выполнения методов
+        # клиент применяет, только когда оно исчерпано; AdaptiveRateLimiter
+        # снижает частоту раньше
+        bitrix_client = Bitrix(
+            bitrix_webhook_url,
+            requests_per_second=float("inf"),
+        )
         logger.info("Инициализация фабрики репозиториев Bitrix24")
-        contact_repository = BitrixContactRepository(bitrix_client)
+        contact_repository = BitrixContactRepository(
+            bitrix_client,
+            entity_cache,
+            metadata_cache,
+            replica_storage,
+            rate_limiter,
+            circuit_breaker,
+        )
         return BitrixRepositoryFactory(
             [
                 contact_repository,
-                BitrixDealRepository(bitrix_client, contact_repository),
+                BitrixDealRepository(
+                    bitrix_client,
+                    contact_repository,
+                    entity_cache,
+                    metadata_cache,
+                    replica_storage,
+                    rate_limiter,
+                    circuit_breaker,
+                ),
             ],
         )
-    
+
+    @provide(scope=Scope.APP)
+    def provide_replica_synchronizer(
+        self,
+        settings: Settings,
+        repository_factory: BitrixRepositoryFactory,
+        replica_storage: ReplicaStorage | None,
+        entity_cache: EntityCache,
+    ) -> ReplicaSynchronizer:
+        """Создание синхронизации локальной реплики.
+
+        :param settings: Настройки приложения
+        :param repository_factory: Фабрика репозиториев
+        :param replica_storage: Локальная реплика или None
+        :param entity_cache: Кэш сущностей
+        :return: Экземпляр синхронизации
+        :raises ValueError: Если локальная реплика не настроена
+        """
+        if replica_storage is None:
+            msg = "Локальная реплика не настроена (REPLICA_PATH)"
+            raise ValueError(msg)
+        return ReplicaSynchronizer(
+            replica_storage,
+            repository_factory,
+            settings.REPLICA_SYNC_INTERVAL,
+            settings.REPLICA_RECONCILE_INTERVAL,
+            entity_cache,
+        )
+
     @provide(scope=Scope.APP)
     def provide_mcp_server(self) -> BitrixMCPServer:
         """Предоставляет сервер MCP."""
         return BitrixMCPServer()
-    
+
     @provide(scope=Scope.APP)
     def provide_contact_service(self, repository_factory: BitrixRepositoryFactory) -> ContactService:
         """Предоставляет сервис для работы с контактами."""
         return ContactService(repository_factory)
-    
+
     @provide(scope=Scope.APP)
     def provide_deal_service(self, repository_factory: BitrixRepositoryFactory) -> DealService:
         """Предоставляет сервис для работы со сделками."""
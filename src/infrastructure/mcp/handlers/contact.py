@@ -4,20 +4,17 @@
 """
 
 import json
+from typing import Any
 
+from src.application.services.contact import ContactService
+from src.config import SettingsManager
+from src.container import container
 from src.domain.entities.contact import Contact
+from src.infrastructure.bitrix.deadline import deadline
 from src.infrastructure.logging.logger import logger
+from src.infrastructure.mcp.serialization import dumps
 from src.infrastructure.mcp.server import BitrixMCPServer
 
-# Создаем экземпляр сервиса контактов
-# В реальном приложении эти зависимости должны предоставляться через DI контейнер
-from src.infrastructure.ioc import provider
-
-# Получаем зависимости напрямую из провайдера
-bitrix_webhook_url = provider.provide_bitrix_webhook_url()
-repository_factory = provider.provide_repository_factory()
-contact_service = provider.provide_contact_service(repository_factory)
-
 
 def register_contact_handlers(mcp_server: BitrixMCPServer) -> None:
     """Регистрация обработчиков для работы с контактами.
@@ -59,10 +56,17 @@ async def get_contact(
     :param contact_id: Идентификатор контакта
     :return: JSON-строка с данными контакта или сообщение об ошибке
     """
-    contact = await contact_service.get_contact_by_id(contact_id)
+    with deadline(
+        SettingsManager.get().get_tool_deadline("get_contact"),
+    ) as budget:
+        contact = await _get_contact_service().get_contact_by_id(contact_id)
+    if not contact and budget.truncated:
+        return json.dumps(
+            {"error": f"Истек срок получения контакта с ID={contact_id}"},
+        )
     if not contact:
         return json.dumps({"error": f"Контакт с ID={contact_id} не найден"})
-    return contact.to_str_json()
+    return dumps(contact)
 
 
 async def search_contacts(
@@ -73,14 +77,14 @@ async def search_contacts(
     """Поиск контактов (инструмент).
 
     :param query: Поисковый запрос
-    :param search_type: Тип поиска (name, phone, email)
+    :param search_type: Тип поиска (name, phone, email, fuzzy)
     :param limit: Максимальное количество результатов
     :return: JSON-строка с результатами поиска
     """
-    if search_type not in ["name", "phone", "email"]:
+    if search_type not in ["name", "phone", "email", "fuzzy"]:
         return json.dumps(
             {
-                "error": "Недопустимый тип поиска. Используйте: name, phone или email",
+                "error": "Недопустимый тип поиска. Используйте: name, phone, email или fuzzy",
             },
         )
 
@@ -91,27 +95,39 @@ async def search_contacts(
             },
         )
 
-    contacts = await contact_service.search_contacts(query, search_type, limit)
+    with deadline(
+        SettingsManager.get().get_tool_deadline("search_contacts"),
+    ) as budget:
+        contacts = await _get_contact_service().search_contacts(
+            query,
+            search_type,
+            limit,
+        )
 
-    result = {
+    result: dict[str, Any] = {
         "query": query,
         "search_type": search_type,
         "total": len(contacts),
-        "contacts": [json.loads(contact.to_str_json()) for contact in contacts],
+        "contacts": contacts,
     }
+    if budget.truncated:
+        result["truncated"] = True
 
-    return json.dumps(result)
+    return dumps(result)
 
 
 async def list_contacts(
     limit: int = 50,
     company_id: int | None = None,
+    extra_fields: list[str] | None = None,
 ) -> str:
     """Получение списка контактов (инструмент).
 
     :param limit: Максимальное количество результатов
     :param company_id: Идентификатор компании для фильтрации (опционально)
-    :return: JSON-строка со списком контактов
+    :param extra_fields: Дополнительные поля контакта (например, UF_CRM_*)
+    :return: JSON-строка со списком контактов (с признаком truncated, если
+             не все контакты успели загрузиться)
     """
     if limit != -1 and limit <= 0:
         return json.dumps(
@@ -120,19 +136,31 @@ async def list_contacts(
             },
         )
 
-    contacts = await contact_service.list_contacts(limit, company_id)
+    with deadline(
+        SettingsManager.get().get_tool_deadline("list_contacts"),
+    ) as budget:
+        contacts = [
+            contact
+            async for contact in _get_contact_service().iter_contact_rows(
+                limit,
+                company_id,
+                extra_fields,
+            )
+        ]
 
     filter_info = {}
     if company_id:
         filter_info["company_id"] = company_id
 
-    result = {
+    result: dict[str, Any] = {
         "total": len(contacts),
         "filters": filter_info,
-        "contacts": [json.loads(contact.to_str_json()) for contact in contacts],
+        "contacts": contacts,
     }
+    if budget.truncated:
+        result["truncated"] = True
 
-    return json.dumps(result)
+    return dumps(result)
 
 
 async def get_contact_resource(
@@ -147,7 +175,7 @@ async def get_contact_resource(
         contact_id_int = int(contact_id)
     except ValueError:
         return f"Некорректный ID контакта: {contact_id}"
-    contact = await contact_service.get_contact_by_id(contact_id_int)
+    contact = await _get_contact_service().get_contact_by_id(contact_id_int)
 
     if not contact:
         return f"Контакт с ID={contact_id} не найден"
@@ -172,3 +200,14 @@ def _format_contact_for_display(contact: Contact) -> str:
     ]
 
     return "\n".join(lines)
+
+
+def _get_contact_service() -> ContactService:
+    """Получение сервиса контактов из контейнера зависимостей.
+
+    Сервис (и клиент Bitrix24) создается при первом вызове инструмента,
+    а не при импорте модуля, и используется всеми обработчиками.
+
+    :return: Сервис контактов
+    """
+    return container.get(ContactService)
@@ -6,17 +6,15 @@
 import json
 from typing import Any
 
+from src.application.services.deal import DealService
+from src.config import SettingsManager
+from src.container import container
 from src.domain.entities.deal import Deal
+from src.infrastructure.bitrix.deadline import deadline
 from src.infrastructure.logging.logger import logger
+from src.infrastructure.mcp.serialization import dumps
 from src.infrastructure.mcp.server import BitrixMCPServer
 
-# Получаем зависимости напрямую из провайдера
-from src.infrastructure.ioc import provider
-
-# Создаем зависимости напрямую
-repository_factory = provider.provide_repository_factory()
-deal_service = provider.provide_deal_service(repository_factory)
-
 
 def register_deal_handlers(mcp_server: BitrixMCPServer) -> None:
     """Регистрация обработчиков для работы со сделками.
@@ -35,6 +33,12 @@ def register_deal_handlers(mcp_server: BitrixMCPServer) -> None:
         description="Получение списка сделок с возможностью фильтрации",
     )
 
+    mcp_server.add_tool(
+        search_deals,
+        name="search_deals",
+        description="Нечеткий поиск сделок по названию",
+    )
+
     mcp_server.add_tool(
         update_deal_stage,
         name="update_deal_stage",
@@ -64,17 +68,26 @@ async def get_deal(
     :param deal_id: Идентификатор сделки
     :return: JSON-строка с данными сделки или сообщение об ошибке
     """
-    deal = await deal_service.get_deal_by_id(deal_id)
+    with deadline(
+        SettingsManager.get().get_tool_deadline("get_deal"),
+    ) as budget:
+        deal = await _get_deal_service().get_deal_by_id(deal_id)
+    if not deal and budget.truncated:
+        return json.dumps(
+            {"error": f"Истек срок получения сделки с ID={deal_id}"},
+        )
     if not deal:
         return json.dumps({"error": f"Сделка с ID={deal_id} не найдена"})
-    return deal.to_str_json()
+    return dumps(deal)
 
 
-async def list_deals(
+async def list_deals(  # noqa: PLR0913, PLR0917
     active_only: bool = False,
     contact_id: int | None = None,
     company_id: int | None = None,
     limit: int = -1,
+    with_contacts: bool = True,
+    extra_fields: list[str] | None = None,
 ) -> str:
     """Получение списка сделок (инструмент).
 
@@ -82,7 +95,10 @@ async def list_deals(
     :param contact_id: Идентификатор контакта для фильтрации (опционально)
     :param company_id: Идентификатор компании для фильтрации (опционально)
     :param limit: Максимальное количество результатов. По дефолту -1 (получить все сделки)
-    :return: JSON-строка со списком сделок
+    :param with_contacts: Загружать идентификаторы связанных контактов
+    :param extra_fields: Дополнительные поля сделки (например, UF_CRM_*)
+    :return: JSON-строка со списком сделок (с признаком truncated, если
+             не все сделки успели загрузиться)
     """
     if limit != -1 and limit <= 0:
         return json.dumps(
@@ -91,12 +107,20 @@ async def list_deals(
             },
         )
 
-    deals = await deal_service.list_deals(
-        active_only,
-        contact_id,
-        company_id,
-        limit,
-    )
+    with deadline(
+        SettingsManager.get().get_tool_deadline("list_deals"),
+    ) as budget:
+        deals = [
+            deal
+            async for deal in _get_deal_service().iter_deal_rows(
+                active_only,
+                contact_id,
+                company_id,
+                limit,
+                with_contacts,
+                extra_fields,
+            )
+        ]
 
     filter_info: dict[str, Any] = {"active_only": active_only}
 
@@ -106,13 +130,48 @@ async def list_deals(
     if company_id:
         filter_info["company_id"] = company_id
 
-    result = {
+    result: dict[str, Any] = {
         "total": len(deals),
         "filters": filter_info,
-        "deals": [json.loads(deal.to_str_json()) for deal in deals],
+        "deals": deals,
     }
+    if budget.truncated:
+        result["truncated"] = True
 
-    return json.dumps(result)
+    return dumps(result)
+
+
+async def search_deals(
+    query: str,
+    limit: int = 10,
+) -> str:
+    """Нечеткий поиск сделок по названию (инструмент).
+
+    :param query: Поисковый запрос (допускаются опечатки и часть названия)
+    :param limit: Максимальное количество результатов
+    :return: JSON-строка с результатами поиска
+    """
+    if limit != -1 and limit <= 0:
+        return json.dumps(
+            {
+                "error": "Недопустимое значение limit. Используйте -1 (все элементы) или значение больше 0",
+            },
+        )
+
+    with deadline(
+        SettingsManager.get().get_tool_deadline("search_deals"),
+    ) as budget:
+        deals = await _get_deal_service().search_deals(query, limit)
+
+    result: dict[str, Any] = {
+        "query": query,
+        "total": len(deals),
+        "deals": deals,
+    }
+    if budget.truncated:
+        result["truncated"] = True
+
+    return dumps(result)
 
 
 async def update_deal_stage(
@@ -125,7 +184,7 @@ async def update_deal_stage(
     :param stage_id: Идентификатор новой стадии
     :return: JSON-строка с результатом операции
     """
-    success = await deal_service.update_deal_stage(deal_id, stage_id)
+    success = await _get_deal_service().update_deal_stage(deal_id, stage_id)
 
     result = {
         "success": success,
@@ -135,7 +194,7 @@ async def update_deal_stage(
         ),
     }
 
-    return json.dumps(result)
+    return dumps(result)
 
 
 async def get_deal_resource(
@@ -148,7 +207,7 @@ async def get_deal_resource(
     """
     try:
         deal_id_int = int(deal_id)
-        deal = await deal_service.get_deal_by_id(deal_id_int)
+        deal = await _get_deal_service().get_deal_by_id(deal_id_int)
 
         if not deal:
             return f"Сделка с ID={deal_id} не найдена"
@@ -163,20 +222,29 @@ async def get_active_deals_resource() -> str:
 
     :return: Строковое представление списка сделок
     """
-    deals = await deal_service.list_deals(active_only=True)
-
-    if not deals:
+    lines: list[str] = []
+    count = 0
+
+    with deadline(
+        SettingsManager.get().get_tool_deadline("deals://active"),
+    ) as budget:
+        async for deal in _get_deal_service().iter_deal_rows(
+            active_only=True,
+            with_contacts=False,
+        ):
+            count += 1
+            lines.append(f"{count}. {deal.title} (ID: {deal.id})")
+            lines.append(f"   Стадия: {deal.stage_id}")
+            lines.append(f"   Сумма: {deal.opportunity} {deal.currency_id}")
+            lines.append("")
+
+    if not count:
         return "Активные сделки не найдены"
 
-    lines = [f"Активные сделки ({len(deals)}):"]
-
-    for i, deal in enumerate(deals, 1):
-        lines.append(f"{i}. {deal.title} (ID: {deal.id})")
-        lines.append(f"   Стадия: {deal.stage_id}")
-        lines.append(f"   Сумма: {deal.opportunity} {deal.currency_id}")
-        lines.append("")
+    if budget.truncated:
+        lines.append("Список неполон: истек срок загрузки")
 
-    return "\n".join(lines)
+    return "\n".join([f"Активные сделки ({count}):", *lines])
 
 
 def _format_deal_for_display(deal: Deal) -> str:
@@ -204,3 +272,14 @@ def _format_deal_for_display(deal: Deal) -> str:
         lines.append("Связанные контакты: Отсутствуют")
 
     return "\n".join(lines)
+
+
+def _get_deal_service() -> DealService:
+    """Получение сервиса сделок из контейнера зависимостей.
+
+    Сервис (и клиент Bitrix24) создается при первом вызове инструмента,
+    а не при импорте модуля, и используется всеми обработчиками.
+
+    :return: Сервис сделок
+    """
+    return container.get(DealService)
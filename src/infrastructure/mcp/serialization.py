@@ -0,0 +1,60 @@
+"""Модуль с сериализацией ответов инструментов MCP в JSON.
+
+Ответ, содержащий сущности, сериализуется за один проход: сущности
+(dataclass) кодируются непосредственно при записи JSON, без промежуточного
+`asdict`, строки JSON и ее повторного разбора. Ленивые сущности
+(`LazyEntity`) сериализуются напрямую из записей API. Если установлен
+`orjson`, он используется вместо стандартного модуля `json`.
+"""
+
+import json
+from dataclasses import fields, is_dataclass
+from functools import cache
+from typing import Any
+
+from src.domain.entities.lazy_entity import LazyEntity
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson необязателен
+    orjson = None
+
+
+@cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    """Имена полей dataclass.
+
+    :param cls: Класс dataclass
+    :return: Имена полей в порядке объявления
+    """
+    return tuple(field.name for field in fields(cls))
+
+
+def to_plain(value: Any) -> dict[str, Any]:
+    """Преобразование dataclass в словарь без копирования вложенных значений.
+
+    В отличие от `dataclasses.asdict` вложенные dataclass не
+    преобразуются: при сериализации они кодируются тем же способом.
+
+    :param value: Экземпляр dataclass (например, сущность Bitrix24)
+                  или ленивая сущность
+    :return: Словарь значений полей
+    :raises TypeError: Если значение не является экземпляром dataclass
+    """
+    if isinstance(value, LazyEntity):
+        return value.to_dict()
+    if not is_dataclass(value) or isinstance(value, type):
+        msg = f"Объект типа {type(value).__name__} не сериализуется в JSON"
+        raise TypeError(msg)
+    return {name: getattr(value, name) for name in _field_names(type(value))}
+
+
+def dumps(data: Any) -> str:
+    """Сериализация ответа инструмента в JSON.
+
+    :param data: Данные ответа; могут содержать сущности Bitrix24
+    :return: JSON-строка (символы вне ASCII не экранируются)
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=to_plain).decode()
+    return json.dumps(data, default=to_plain, ensure_ascii=False)
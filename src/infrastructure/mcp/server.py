@@ -4,6 +4,7 @@
 """
 
 from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
 
 from mcp.server.fastmcp import FastMCP
 
@@ -15,11 +16,17 @@ class BitrixMCPServer:
     Предоставляет общую функциональность для работы с Model Context Protocol.
     """
 
-    def __init__(self, server_name: str = "Bitrix24 MCP Server"):
+    def __init__(
+        self,
+        server_name: str = "Bitrix24 MCP Server",
+        lifespan: Callable[[FastMCP], AbstractAsyncContextManager[None]]
+        | None = None,
+    ):
         """Инициализация MCP сервера.
         :param server_name: Название сервера.
+        :param lifespan: Контекст жизненного цикла сервера (опционально).
         """
-        self._server = FastMCP(server_name)
+        self._server = FastMCP(server_name, lifespan=lifespan)
         logger.info(f"Создан MCP сервер: {server_name}")
 
     def add_tool(
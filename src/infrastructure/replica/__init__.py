@@ -0,0 +1,31 @@
+"""Пакет локальной реплики данных Bitrix24.
+
+Реплика хранит сделки, контакты и связи между ними в SQLite,
+чтобы списки и поиск выполнялись без обращения к API.
+Поиск по имени, телефону, email и нечеткий поиск выполняются
+по индексам в памяти процесса.
+"""
+
+from src.infrastructure.replica.search import (
+    LookupIndex,
+    SearchIndex,
+    TokenIndex,
+    TrigramIndex,
+)
+from src.infrastructure.replica.storage import (
+    ReplicaStorage,
+    SyncState,
+    UnsupportedFilterError,
+)
+from src.infrastructure.replica.sync import ReplicaSynchronizer
+
+__all__ = [
+    "LookupIndex",
+    "ReplicaStorage",
+    "ReplicaSynchronizer",
+    "SearchIndex",
+    "SyncState",
+    "TokenIndex",
+    "TrigramIndex",
+    "UnsupportedFilterError",
+]
@@ -0,0 +1,487 @@
+"""Модуль с поисковыми индексами локальной реплики.
+
+Индексы хранятся в памяти процесса: при запуске заполняются
+из реплики, а затем обновляются при каждом сохранении и удалении
+записей, поэтому поиск выполняется без обращения к API и к SQLite.
+"""
+
+import bisect
+import heapq
+import math
+import re
+import sys
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import Any, ClassVar
+
+from src.domain.bitrix_types import BitrixMultiField
+
+# Код страны для номеров, записанных без него (8 912 ..., 912 ...)
+DEFAULT_PHONE_COUNTRY_CODE = "7"
+NATIONAL_PHONE_LENGTH = 10
+# E.164 допускает не более 15 цифр, короче 8 - не телефонный номер
+E164_MIN_DIGITS = 8
+E164_MAX_DIGITS = 15
+
+
+def fold_text(value: Any) -> str:
+    """Приведение текста к виду для сравнения без учета регистра и ё.
+
+    :param value: Исходное значение
+    :return: Нормализованная строка
+    """
+    return str(value).casefold().replace("ё", "е")
+
+
+def normalize_phone(value: Any) -> str | None:
+    """Приведение номера телефона к формату E.164.
+
+    Номера без кода страны (10 цифр) и с национальным префиксом 8
+    (11 цифр) считаются номерами страны по умолчанию.
+
+    :param value: Номер телефона в произвольном формате
+    :return: Номер вида +79120000000 или None, если это не номер телефона
+    """
+    text = str(value).strip()
+    digits = "".join(char for char in text if char.isdigit())
+
+    if not text.startswith("+"):
+        if digits.startswith("00"):
+            digits = digits[2:]
+        elif len(digits) == NATIONAL_PHONE_LENGTH + 1 and digits.startswith("8"):
+            digits = DEFAULT_PHONE_COUNTRY_CODE + digits[1:]
+        elif len(digits) == NATIONAL_PHONE_LENGTH:
+            digits = DEFAULT_PHONE_COUNTRY_CODE + digits
+
+    if not E164_MIN_DIGITS <= len(digits) <= E164_MAX_DIGITS:
+        return None
+    return f"+{digits}"
+
+
+def normalize_email(value: Any) -> str | None:
+    """Приведение email к нижнему регистру без пробелов по краям.
+
+    :param value: Email в произвольном регистре
+    :return: Нормализованный email или None, если это не email
+    """
+    email = str(value).strip().lower()
+    return email if "@" in email else None
+
+
+def rank(scores: dict[int, float], limit: int) -> list[int]:
+    """Выбор лучших записей по оценке релевантности.
+
+    При равной оценке выше запись с меньшим идентификатором.
+
+    :param scores: Оценки по идентификаторам записей
+    :param limit: Максимальное количество результатов (-1 - все)
+    :return: Идентификаторы записей по убыванию оценки
+    """
+    entries = scores.items()
+    if limit < 0:
+        ranked = sorted(entries, key=lambda entry: (-entry[1], entry[0]))
+    else:
+        ranked = heapq.nsmallest(
+            limit,
+            entries,
+            key=lambda entry: (-entry[1], entry[0]),
+        )
+    return [entity_id for entity_id, _ in ranked]
+
+
+class SearchIndex(ABC):
+    """Базовый класс поискового индекса по записям одного типа сущности.
+
+    Методы индекса не потокобезопасны, синхронизацию обеспечивает
+    хранилище реплики.
+    """
+
+    @property
+    @abstractmethod
+    def fields(self) -> tuple[str, ...]:
+        """Поля записи, которые использует индекс."""
+
+    @abstractmethod
+    def add(self, entity_id: int, item: dict[str, Any]) -> None:
+        """Добавление или замена записи в индексе.
+
+        :param entity_id: Идентификатор записи
+        :param item: Запись в формате API Bitrix24
+        """
+
+    @abstractmethod
+    def remove(self, entity_id: int) -> None:
+        """Удаление записи из индекса.
+
+        :param entity_id: Идентификатор записи
+        """
+
+    def prepare(self) -> None:  # noqa: B027
+        """Подготовка индекса к поиску после массовой загрузки."""
+
+    @abstractmethod
+    def search(self, query: str, limit: int = 10) -> list[int]:
+        """Поиск записей.
+
+        :param query: Поисковый запрос
+        :param limit: Максимальное количество результатов (-1 - все)
+        :return: Идентификаторы найденных записей по убыванию релевантности
+        """
+
+
+class TokenIndex(SearchIndex):
+    """Инвертированный индекс по словам текстовых полей.
+
+    Каждое слово запроса должно совпасть со словом записи целиком
+    или с его началом. Полное совпадение ценится выше совпадения
+    по началу, а более длинное совпадение по началу - выше короткого.
+    """
+
+    _token_pattern: ClassVar[re.Pattern[str]] = re.compile(r"\w+")
+
+    def __init__(self, fields: tuple[str, ...]):
+        """Инициализация индекса.
+
+        :param fields: Индексируемые текстовые поля
+        """
+        self._fields = fields
+        self._postings: dict[str, set[int]] = {}
+        self._document_tokens: dict[int, frozenset[str]] = {}
+        # Упорядоченный словарь для поиска по началу слова;
+        # строится при первом поиске, чтобы массовая загрузка
+        # не вставляла слова в середину списка по одному
+        self._sorted_tokens: list[str] | None = None
+
+    def __len__(self) -> int:
+        """Количество проиндексированных записей."""
+        return len(self._document_tokens)
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        """Индексируемые текстовые поля."""
+        return self._fields
+
+    @classmethod
+    def tokenize(cls, value: Any) -> list[str]:
+        """Разбиение текста на нормализованные слова.
+
+        :param value: Исходный текст
+        :return: Список слов
+        """
+        return cls._token_pattern.findall(fold_text(value))
+
+    def add(self, entity_id: int, item: dict[str, Any]) -> None:
+        """Добавление или замена записи в индексе.
+
+        :param entity_id: Идентификатор записи
+        :param item: Запись в формате API Bitrix24
+        """
+        self.remove(entity_id)
+
+        tokens = frozenset(
+            token
+            for field_name in self._fields
+            for token in self.tokenize(item.get(field_name) or "")
+        )
+        if not tokens:
+            return
+
+        self._document_tokens[entity_id] = tokens
+        for token in tokens:
+            entity_ids = self._postings.get(token)
+            if entity_ids is None:
+                entity_ids = self._postings[token] = set()
+                if self._sorted_tokens is not None:
+                    bisect.insort(self._sorted_tokens, token)
+            entity_ids.add(entity_id)
+
+    def remove(self, entity_id: int) -> None:
+        """Удаление записи из индекса.
+
+        :param entity_id: Идентификатор записи
+        """
+        for token in self._document_tokens.pop(entity_id, ()):
+            entity_ids = self._postings[token]
+            entity_ids.discard(entity_id)
+            if entity_ids:
+                continue
+
+            del self._postings[token]
+            if self._sorted_tokens is not None:
+                del self._sorted_tokens[
+                    bisect.bisect_left(self._sorted_tokens, token)
+                ]
+
+    def prepare(self) -> None:
+        """Подготовка индекса к поиску после массовой загрузки."""
+        self._get_sorted_tokens()
+
+    def search(self, query: str, limit: int = 10) -> list[int]:
+        """Поиск записей по словам и началам слов.
+
+        :param query: Поисковый запрос
+        :param limit: Максимальное количество результатов (-1 - все)
+        :return: Идентификаторы найденных записей по убыванию релевантности
+        """
+        words = set(self.tokenize(query))
+        if not words or limit == 0:
+            return []
+
+        scores: dict[int, float] | None = None
+        # Длинные слова обычно избирательнее и дают меньше кандидатов
+        for word in sorted(words, key=len, reverse=True):
+            word_scores = self._match(word, scores)
+            if scores is not None:
+                word_scores = {
+                    entity_id: scores[entity_id] + score
+                    for entity_id, score in word_scores.items()
+                }
+            scores = word_scores
+            if not scores:
+                return []
+
+        return rank(scores or {}, limit)
+
+    def _match(
+        self,
+        word: str,
+        candidates: dict[int, float] | None,
+    ) -> dict[int, float]:
+        """Поиск записей, содержащих слово или слово с таким началом.
+
+        :param word: Нормализованное слово запроса
+        :param candidates: Записи, среди которых выполняется поиск
+                           (None - среди всех записей)
+        :return: Оценка совпадения по идентификаторам записей
+        """
+        tokens = self._get_sorted_tokens()
+        matches: dict[int, float] = {}
+
+        position = bisect.bisect_left(tokens, word)
+        while position < len(tokens) and tokens[position].startswith(word):
+            token = tokens[position]
+            position += 1
+
+            score = len(word) / len(token)
+            entity_ids = self._postings[token]
+            if candidates is not None:
+                entity_ids = candidates.keys() & entity_ids
+
+            for entity_id in entity_ids:
+                if score > matches.get(entity_id, 0.0):
+                    matches[entity_id] = score
+
+        return matches
+
+    def _get_sorted_tokens(self) -> list[str]:
+        """Получение упорядоченного словаря индекса.
+
+        :return: Слова индекса в порядке возрастания
+        """
+        if self._sorted_tokens is None:
+            self._sorted_tokens = sorted(self._postings)
+        return self._sorted_tokens
+
+
+class LookupIndex(SearchIndex):
+    """Хэш-индекс по нормализованным значениям мультиполя.
+
+    Значения мультиполя (PHONE, EMAIL) и поисковый запрос приводятся
+    к одному виду, поэтому, например, "+7 (912) 000-00-00"
+    и "89120000000" находят одну и ту же запись.
+    """
+
+    def __init__(
+        self,
+        field_name: str,
+        normalizer: Callable[[Any], str | None],
+    ):
+        """Инициализация индекса.
+
+        :param field_name: Индексируемое мультиполе
+        :param normalizer: Функция нормализации значения
+        """
+        self._field_name = field_name
+        self._normalizer = normalizer
+        self._entries: dict[str, set[int]] = {}
+        self._document_keys: dict[int, frozenset[str]] = {}
+
+    def __len__(self) -> int:
+        """Количество проиндексированных записей."""
+        return len(self._document_keys)
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        """Индексируемое мультиполе."""
+        return (self._field_name,)
+
+    def add(self, entity_id: int, item: dict[str, Any]) -> None:
+        """Добавление или замена записи в индексе.
+
+        :param entity_id: Идентификатор записи
+        :param item: Запись в формате API Bitrix24
+        """
+        self.remove(entity_id)
+
+        values = item.get(self._field_name) or []
+        keys = frozenset(
+            key
+            for value in values
+            if isinstance(value, dict)
+            and (
+                key := self._normalizer(BitrixMultiField.from_bitrix(value).value)
+            )
+        )
+        if not keys:
+            return
+
+        self._document_keys[entity_id] = keys
+        for key in keys:
+            self._entries.setdefault(key, set()).add(entity_id)
+
+    def remove(self, entity_id: int) -> None:
+        """Удаление записи из индекса.
+
+        :param entity_id: Идентификатор записи
+        """
+        for key in self._document_keys.pop(entity_id, ()):
+            entity_ids = self._entries[key]
+            entity_ids.discard(entity_id)
+            if not entity_ids:
+                del self._entries[key]
+
+    def search(self, query: str, limit: int = 10) -> list[int]:
+        """Поиск записей с точно совпадающим нормализованным значением.
+
+        :param query: Значение для поиска
+        :param limit: Максимальное количество результатов (-1 - все)
+        :return: Идентификаторы найденных записей по возрастанию
+        """
+        key = self._normalizer(query)
+        if key is None:
+            return []
+        return sorted(self._entries.get(key, ()))[: None if limit < 0 else limit]
+
+
+class TrigramIndex(SearchIndex):
+    """Индекс нечеткого поиска по триграммам текста записи.
+
+    Находит записи с опечатками и по части текста. Оценка записи -
+    среднее доли триграмм запроса, найденных в записи, и сходства
+    по Жаккару; записи, в которых найдено меньше `_min_similarity`
+    триграмм запроса, отбрасываются.
+
+    Чтобы не сравнивать запрос со всеми записями, кандидаты берутся
+    только из списков самых редких триграмм запроса (префиксный фильтр):
+    запись с достаточным числом общих триграмм обязательно содержит
+    хотя бы одну из них.
+    """
+
+    _min_similarity: ClassVar[float] = 0.5
+
+    def __init__(
+        self,
+        fields: tuple[str, ...],
+        text_getter: Callable[[dict[str, Any]], str],
+    ):
+        """Инициализация индекса.
+
+        :param fields: Поля записи, из которых строится текст
+        :param text_getter: Функция получения текста из записи
+        """
+        self._fields = fields
+        self._text_getter = text_getter
+        self._postings: dict[str, set[int]] = {}
+        self._document_trigrams: dict[int, frozenset[str]] = {}
+
+    def __len__(self) -> int:
+        """Количество проиндексированных записей."""
+        return len(self._document_trigrams)
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        """Поля записи, из которых строится текст."""
+        return self._fields
+
+    @staticmethod
+    def trigrams(value: Any) -> frozenset[str]:
+        """Разбиение текста на триграммы слов.
+
+        Слова дополняются пробелами (два в начале, один в конце),
+        чтобы совпадение начала слова ценилось выше.
+
+        :param value: Исходный текст
+        :return: Множество триграмм
+        """
+        return frozenset(
+            padded[position : position + 3]
+            for word in TokenIndex.tokenize(value)
+            for padded in (f"  {word} ",)
+            for position in range(len(padded) - 2)
+        )
+
+    def add(self, entity_id: int, item: dict[str, Any]) -> None:
+        """Добавление или замена записи в индексе.
+
+        :param entity_id: Идентификатор записи
+        :param item: Запись в формате API Bitrix24
+        """
+        self.remove(entity_id)
+
+        # Одинаковые триграммы разных записей хранятся одной строкой
+        trigrams = frozenset(
+            sys.intern(trigram)
+            for trigram in self.trigrams(self._text_getter(item) or "")
+        )
+        if not trigrams:
+            return
+
+        self._document_trigrams[entity_id] = trigrams
+        for trigram in trigrams:
+            self._postings.setdefault(trigram, set()).add(entity_id)
+
+    def remove(self, entity_id: int) -> None:
+        """Удаление записи из индекса.
+
+        :param entity_id: Идентификатор записи
+        """
+        for trigram in self._document_trigrams.pop(entity_id, ()):
+            entity_ids = self._postings[trigram]
+            entity_ids.discard(entity_id)
+            if not entity_ids:
+                del self._postings[trigram]
+
+    def search(self, query: str, limit: int = 10) -> list[int]:
+        """Поиск записей, похожих на запрос.
+
+        :param query: Поисковый запрос
+        :param limit: Максимальное количество результатов (-1 - все)
+        :return: Идентификаторы найденных записей по убыванию сходства
+        """
+        query_trigrams = self.trigrams(query)
+        if not query_trigrams or limit == 0:
+            return []
+
+        required = math.ceil(self._min_similarity * len(query_trigrams))
+        rare_trigrams = sorted(
+            query_trigrams,
+            key=lambda trigram: len(self._postings.get(trigram, ())),
+        )[: len(query_trigrams) - required + 1]
+        candidates = set().union(
+            *(self._postings.get(trigram, ()) for trigram in rare_trigrams),
+        )
+
+        scores: dict[int, float] = {}
+        for entity_id in candidates:
+            document_trigrams = self._document_trigrams[entity_id]
+            common = len(query_trigrams & document_trigrams)
+            if common < required:
+                continue
+
+            coverage = common / len(query_trigrams)
+            jaccard = common / (
+                len(query_trigrams) + len(document_trigrams) - common
+            )
+            scores[entity_id] = (coverage + jaccard) / 2
+
+        return rank(scores, limit)
@@ -0,0 +1,900 @@
+"""Модуль с локальным хранилищем реплики данных Bitrix24.
+
+Хранит записи сущностей в том виде, в котором их возвращает API
+Bitrix24, в базе SQLite и выполняет по ним запросы с фильтрами
+в синтаксисе методов `crm.*.list`, а также поддерживает в памяти
+поисковые индексы по этим записям.
+"""
+
+import asyncio
+import json
+import re
+import sqlite3
+import threading
+import time
+from array import array
+from collections.abc import AsyncIterator, Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, ClassVar
+
+from src.domain.entities.contact import Contact
+from src.domain.entities.deal import Deal
+from src.infrastructure.replica.search import (
+    LookupIndex,
+    SearchIndex,
+    TokenIndex,
+    TrigramIndex,
+    normalize_email,
+    normalize_phone,
+)
+
+
+class UnsupportedFilterError(ValueError):
+    """Фильтр не может быть выполнен по локальной реплике."""
+
+
+@dataclass(frozen=True, slots=True)
+class SyncState:
+    """Состояние синхронизации типа сущности.
+
+    :param last_modified: Значение DATE_MODIFY, начиная с которого запрашиваются
+                          изменения при следующей синхронизации
+    :param synced_at: Время завершения последней синхронизации (unix time)
+    """
+
+    last_modified: str | None
+    synced_at: float
+
+
+class ReplicaStorage:
+    """Хранилище реплики сущностей Bitrix24 в SQLite.
+
+    Все операции выполняются в отдельном потоке, чтобы не блокировать
+    цикл событий. Соединение одно и защищено блокировкой.
+
+    Поисковые индексы обновляются под той же блокировкой, что и таблицы,
+    поэтому всегда соответствуют сохраненным записям. Поиск по индексу
+    выполняется в цикле событий под отдельной короткой блокировкой.
+    """
+
+    _ignored_filter_keys: ClassVar[frozenset[str]] = frozenset(
+        {"CHECK_PERMISSIONS"},
+    )
+    _multi_fields: ClassVar[frozenset[str]] = frozenset(
+        {"PHONE", "EMAIL", "WEB", "IM"},
+    )
+    _search_fields: ClassVar[dict[str, tuple[str, ...]]] = {
+        "contact": ("NAME", "SECOND_NAME", "LAST_NAME"),
+        "deal": ("TITLE",),
+    }
+    # Ограничение числа параметров одного запроса SQLite
+    _max_query_ids: ClassVar[int] = 500
+    _filter_key_pattern: ClassVar[re.Pattern[str]] = re.compile(
+        r"^(>=|<=|!=|!%|>|<|=|!|%)?([A-Za-z0-9_]+)$",
+    )
+
+    def __init__(self, path: str | Path):
+        """Инициализация хранилища.
+
+        :param path: Путь к файлу базы данных SQLite
+        """
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self._path,
+            check_same_thread=False,
+        )
+        self._connection.row_factory = sqlite3.Row
+        self._connection.create_function(
+            "casefold",
+            1,
+            lambda value: None if value is None else str(value).casefold(),
+            deterministic=True,
+        )
+        self._index_lock = threading.Lock()
+        self._search_indexes: dict[str, dict[str, SearchIndex]] | None = None
+        self._create_schema()
+        self._ready_types = {
+            row["entity_type"]
+            for row in self._connection.execute(
+                "SELECT entity_type FROM sync_state",
+            )
+        }
+
+    def is_ready(self, entity_type: str) -> bool:
+        """Проверка, завершена ли первичная загрузка типа сущности.
+
+        :param entity_type: Тип сущности
+        :return: True, если запросы можно выполнять по реплике
+        """
+        return entity_type in self._ready_types
+
+    def is_search_ready(self, entity_type: str) -> bool:
+        """Проверка, можно ли искать записи типа сущности по индексам.
+
+        :param entity_type: Тип сущности
+        :return: True, если индексы загружены и тип сущности загружен
+        """
+        return self._search_indexes is not None and self.is_ready(entity_type)
+
+    async def load_search_indexes(self) -> None:
+        """Построение поисковых индексов по сохраненным записям."""
+        await self._run(self._build_search_indexes)
+
+    async def search(
+        self,
+        entity_type: str,
+        index_name: str,
+        query: str,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        """Поиск записей по индексу.
+
+        :param entity_type: Тип сущности
+        :param index_name: Имя индекса (name, fuzzy, для контактов
+                           также phone, email)
+        :param query: Поисковый запрос
+        :param limit: Максимальное количество результатов (-1 - все)
+        :return: Записи в формате API Bitrix24 по убыванию релевантности
+        :raises UnsupportedFilterError: Если индекс не загружен
+        """
+        with self._index_lock:
+            index = (self._search_indexes or {}).get(entity_type, {}).get(
+                index_name,
+            )
+            if index is None:
+                msg = f"Индекс {index_name} для {entity_type} не загружен"
+                raise UnsupportedFilterError(msg)
+            entity_ids = index.search(query, limit)
+
+        return await self.get_by_ids(entity_type, entity_ids)
+
+    async def get_by_ids(
+        self,
+        entity_type: str,
+        entity_ids: list[int],
+    ) -> list[dict[str, Any]]:
+        """Получение записей по идентификаторам.
+
+        :param entity_type: Тип сущности
+        :param entity_ids: Идентификаторы записей
+        :return: Найденные записи в порядке переданных идентификаторов
+        """
+        data_by_id: dict[int, str] = {}
+
+        for offset in range(0, len(entity_ids), self._max_query_ids):
+            chunk = entity_ids[offset : offset + self._max_query_ids]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = await self._run(
+                self._fetchall,
+                "SELECT id, data FROM entities "  # noqa: S608
+                f"WHERE entity_type = ? AND id IN ({placeholders})",
+                [entity_type, *chunk],
+            )
+            data_by_id.update((row["id"], row["data"]) for row in rows)
+
+        return [
+            json.loads(data_by_id[entity_id])
+            for entity_id in entity_ids
+            if entity_id in data_by_id
+        ]
+
+    async def upsert(
+        self,
+        entity_type: str,
+        items: list[dict[str, Any]],
+    ) -> None:
+        """Добавление или обновление записей сущностей.
+
+        :param entity_type: Тип сущности
+        :param items: Записи в формате API Bitrix24
+        """
+        items = [item for item in items if str(item.get("ID", "")).isdigit()]
+        rows = [
+            (
+                entity_type,
+                int(item["ID"]),
+                item.get("DATE_MODIFY"),
+                json.dumps(item, ensure_ascii=False),
+            )
+            for item in items
+        ]
+        if rows:
+            await self._run(self._upsert_rows, entity_type, items, rows)
+
+    async def delete(self, entity_type: str, entity_ids: Iterable[int]) -> None:
+        """Удаление записей сущностей с сохранением отметок об удалении.
+
+        :param entity_type: Тип сущности
+        :param entity_ids: Идентификаторы удаляемых записей
+        """
+        rows = [(entity_type, int(entity_id)) for entity_id in entity_ids]
+        if rows:
+            await self._run(self._delete_rows, entity_type, rows)
+
+    async def get_ids(self, entity_type: str) -> array[int]:
+        """Получение идентификаторов всех записей типа сущности.
+
+        :param entity_type: Тип сущности
+        :return: Идентификаторы в порядке возрастания
+        """
+        return await self._run(self._fetch_ids, entity_type)
+
+    async def get_deleted_ids(
+        self,
+        entity_type: str,
+        since: float = 0.0,
+    ) -> list[int]:
+        """Получение идентификаторов удаленных записей.
+
+        :param entity_type: Тип сущности
+        :param since: Время (unix time), начиная с которого учитываются удаления
+        :return: Идентификаторы удаленных записей
+        """
+        rows = await self._run(
+            self._fetchall,
+            "SELECT id FROM tombstones "
+            "WHERE entity_type = ? AND deleted_at >= ? ORDER BY id",
+            [entity_type, since],
+        )
+        return [row["id"] for row in rows]
+
+    async def set_deal_contacts(
+        self,
+        contact_ids_by_deal: dict[int, list[int]],
+    ) -> None:
+        """Замена связей сделок с контактами.
+
+        :param contact_ids_by_deal: Идентификаторы контактов по ID сделки
+        """
+        if contact_ids_by_deal:
+            await self._run(self._replace_deal_contacts, contact_ids_by_deal)
+
+    async def get_deal_contact_ids(
+        self,
+        deal_ids: list[int],
+    ) -> dict[int, list[int]]:
+        """Получение идентификаторов контактов сделок.
+
+        :param deal_ids: Идентификаторы сделок
+        :return: Идентификаторы контактов по ID сделки
+        """
+        contact_ids: dict[int, list[int]] = {
+            deal_id: [] for deal_id in deal_ids
+        }
+        if not contact_ids:
+            return {}
+
+        unique_ids = list(contact_ids)
+        for offset in range(0, len(unique_ids), self._max_query_ids):
+            chunk = unique_ids[offset : offset + self._max_query_ids]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = await self._run(
+                self._fetchall,
+                "SELECT deal_id, contact_id FROM deal_contacts "  # noqa: S608
+                f"WHERE deal_id IN ({placeholders}) "
+                "ORDER BY deal_id, position",
+                chunk,
+            )
+            for row in rows:
+                contact_ids[row["deal_id"]].append(row["contact_id"])
+
+        return contact_ids
+
+    async def query(
+        self,
+        entity_type: str,
+        filter_params: dict[str, Any] | None = None,
+        order: dict[str, str] | None = None,
+        start: int = 0,
+        limit: int = -1,
+    ) -> list[dict[str, Any]]:
+        """Выборка записей сущностей по фильтру в синтаксисе Bitrix24.
+
+        :param entity_type: Тип сущности
+        :param filter_params: Параметры фильтрации
+        :param order: Параметры сортировки
+        :param start: Начальная позиция выборки
+        :param limit: Максимальное количество записей (-1 - все записи)
+        :return: Записи в формате API Bitrix24
+        :raises UnsupportedFilterError: Если фильтр не поддерживается репликой
+        """
+        sql, args = self._build_query(entity_type, filter_params, order)
+        rows = await self._run(
+            self._fetchall,
+            sql,
+            [*args, limit, max(start, 0)],
+        )
+        return [json.loads(row["data"]) for row in rows]
+
+    def query_pages(  # noqa: PLR0913, PLR0917
+        self,
+        entity_type: str,
+        filter_params: dict[str, Any] | None = None,
+        order: dict[str, str] | None = None,
+        start: int = 0,
+        limit: int = -1,
+        page_size: int = 50,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Постраничная выборка записей сущностей по фильтру.
+
+        Фильтр проверяется при вызове, а записи читаются отдельным
+        запросом на каждую страницу, поэтому в памяти одновременно
+        находится не больше одной страницы.
+
+        :param entity_type: Тип сущности
+        :param filter_params: Параметры фильтрации
+        :param order: Параметры сортировки
+        :param start: Начальная позиция выборки
+        :param limit: Максимальное количество записей (-1 - все записи)
+        :param page_size: Количество записей на странице
+        :return: Асинхронный итератор по страницам записей
+        :raises UnsupportedFilterError: Если фильтр не поддерживается репликой
+        """
+        sql, args = self._build_query(entity_type, filter_params, order)
+        return self._iter_query_pages(
+            sql,
+            args,
+            max(start, 0),
+            float("inf") if limit < 0 else limit,
+            max(page_size, 1),
+        )
+
+    async def _iter_query_pages(
+        self,
+        sql: str,
+        args: list[Any],
+        offset: int,
+        remaining: float,
+        page_size: int,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Чтение результата запроса страницами через LIMIT и OFFSET.
+
+        :param sql: SQL-запрос с параметрами LIMIT и OFFSET в конце
+        :param args: Остальные параметры запроса
+        :param offset: Начальная позиция выборки
+        :param remaining: Максимальное количество записей
+        :param page_size: Количество записей на странице
+        :return: Асинхронный итератор по страницам записей
+        """
+        while remaining > 0:
+            size = int(min(page_size, remaining))
+            rows = await self._run(self._fetchall, sql, [*args, size, offset])
+            if rows:
+                yield [json.loads(row["data"]) for row in rows]
+            if len(rows) < size:
+                return
+
+            offset += size
+            remaining -= size
+
+    def _build_query(
+        self,
+        entity_type: str,
+        filter_params: dict[str, Any] | None,
+        order: dict[str, str] | None,
+    ) -> tuple[str, list[Any]]:
+        """Формирование запроса выборки записей.
+
+        :param entity_type: Тип сущности
+        :param filter_params: Параметры фильтрации
+        :param order: Параметры сортировки
+        :return: SQL-запрос с параметрами LIMIT и OFFSET в конце
+                 и остальные параметры запроса
+        :raises UnsupportedFilterError: Если фильтр не поддерживается репликой
+        """
+        where, args = self._build_where(entity_type, filter_params)
+        order_by, order_args = self._build_order(order)
+        sql = (
+            f"SELECT data FROM entities WHERE {where} "  # noqa: S608
+            f"ORDER BY {order_by} LIMIT ? OFFSET ?"
+        )
+        return sql, [*args, *order_args]
+
+    async def get_sync_state(self, entity_type: str) -> SyncState | None:
+        """Получение состояния синхронизации типа сущности.
+
+        :param entity_type: Тип сущности
+        :return: Состояние синхронизации или None, если загрузки не было
+        """
+        rows = await self._run(
+            self._fetchall,
+            "SELECT last_modified, synced_at FROM sync_state "
+            "WHERE entity_type = ?",
+            [entity_type],
+        )
+        if not rows:
+            return None
+        return SyncState(rows[0]["last_modified"], rows[0]["synced_at"])
+
+    async def set_sync_state(
+        self,
+        entity_type: str,
+        last_modified: str | None,
+    ) -> None:
+        """Сохранение состояния синхронизации типа сущности.
+
+        После первого сохранения тип сущности считается готовым
+        к выполнению запросов по реплике.
+
+        :param entity_type: Тип сущности
+        :param last_modified: Значение DATE_MODIFY для следующей синхронизации
+        """
+        await self._run(
+            self._executemany,
+            "INSERT INTO sync_state (entity_type, last_modified, synced_at) "
+            "VALUES (?, ?, ?) "
+            "ON CONFLICT (entity_type) DO UPDATE SET "
+            "last_modified = excluded.last_modified, "
+            "synced_at = excluded.synced_at",
+            [(entity_type, last_modified, time.time())],
+        )
+        self._ready_types.add(entity_type)
+
+    def close(self) -> None:
+        """Закрытие соединения с базой данных."""
+        with self._lock:
+            self._connection.close()
+
+    def _create_schema(self) -> None:
+        """Создание таблиц реплики."""
+        with self._lock, self._connection:
+            self._connection.executescript(
+                """
+                PRAGMA journal_mode = WAL;
+
+                CREATE TABLE IF NOT EXISTS entities (
+                    entity_type TEXT NOT NULL,
+                    id INTEGER NOT NULL,
+                    date_modify TEXT,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (entity_type, id)
+                );
+
+                CREATE TABLE IF NOT EXISTS deal_contacts (
+                    deal_id INTEGER NOT NULL,
+                    contact_id INTEGER NOT NULL,
+                    position INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (deal_id, contact_id)
+                );
+                CREATE INDEX IF NOT EXISTS deal_contacts_contact_id
+                    ON deal_contacts (contact_id);
+
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    entity_type TEXT PRIMARY KEY,
+                    last_modified TEXT,
+                    synced_at REAL NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS tombstones (
+                    entity_type TEXT NOT NULL,
+                    id INTEGER NOT NULL,
+                    deleted_at REAL NOT NULL,
+                    PRIMARY KEY (entity_type, id)
+                );
+                """,
+            )
+
+    @staticmethod
+    async def _run(func: Callable[..., Any], *args: Any) -> Any:
+        """Выполнение операции с базой данных в отдельном потоке.
+
+        :param func: Синхронная функция операции
+        :param args: Аргументы функции
+        :return: Результат функции
+        """
+        return await asyncio.to_thread(func, *args)
+
+    def _executemany(self, sql: str, rows: list[tuple[Any, ...]]) -> None:
+        """Выполнение изменяющего запроса для набора строк в транзакции.
+
+        :param sql: SQL-запрос
+        :param rows: Параметры запроса для каждой строки
+        """
+        with self._lock, self._connection:
+            self._connection.executemany(sql, rows)
+
+    def _fetchall(self, sql: str, args: list[Any]) -> list[sqlite3.Row]:
+        """Выполнение запроса на чтение.
+
+        :param sql: SQL-запрос
+        :param args: Параметры запроса
+        :return: Строки результата
+        """
+        with self._lock:
+            return self._connection.execute(sql, args).fetchall()
+
+    def _upsert_rows(
+        self,
+        entity_type: str,
+        items: list[dict[str, Any]],
+        rows: list[tuple[str, int, str | None, str]],
+    ) -> None:
+        """Сохранение записей сущностей в одной транзакции.
+
+        Отметки об удалении сохраненных записей снимаются
+        (запись могла быть восстановлена из корзины).
+
+        :param entity_type: Тип сущности
+        :param items: Записи в формате API Bitrix24
+        :param rows: Тип сущности, ID, DATE_MODIFY и данные записи
+        """
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT INTO entities (entity_type, id, date_modify, data) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (entity_type, id) DO UPDATE SET "
+                "date_modify = excluded.date_modify, data = excluded.data",
+                rows,
+            )
+            self._connection.executemany(
+                "DELETE FROM tombstones WHERE entity_type = ? AND id = ?",
+                [(row_type, entity_id) for row_type, entity_id, *_ in rows],
+            )
+            self._update_search_indexes(entity_type, items=items)
+
+    def _delete_rows(
+        self,
+        entity_type: str,
+        rows: list[tuple[str, int]],
+    ) -> None:
+        """Удаление записей сущностей в одной транзакции.
+
+        :param entity_type: Тип сущности
+        :param rows: Тип сущности и ID удаляемых записей
+        """
+        deleted_at = time.time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM entities WHERE entity_type = ? AND id = ?",
+                rows,
+            )
+            if entity_type == "deal":
+                self._connection.executemany(
+                    "DELETE FROM deal_contacts WHERE deal_id = ?",
+                    [(entity_id,) for _, entity_id in rows],
+                )
+            self._connection.executemany(
+                "INSERT INTO tombstones (entity_type, id, deleted_at) "
+                "VALUES (?, ?, ?) "
+                "ON CONFLICT (entity_type, id) DO UPDATE SET "
+                "deleted_at = excluded.deleted_at",
+                [(row_type, entity_id, deleted_at) for row_type, entity_id in rows],
+            )
+            self._update_search_indexes(
+                entity_type,
+                deleted_ids=[entity_id for _, entity_id in rows],
+            )
+
+    def _update_search_indexes(
+        self,
+        entity_type: str,
+        items: Iterable[dict[str, Any]] = (),
+        deleted_ids: Iterable[int] = (),
+    ) -> None:
+        """Обновление поисковых индексов типа сущности.
+
+        :param entity_type: Тип сущности
+        :param items: Сохраненные записи
+        :param deleted_ids: Идентификаторы удаленных записей
+        """
+        with self._index_lock:
+            indexes = (self._search_indexes or {}).get(entity_type, {})
+            for index in indexes.values():
+                for entity_id in deleted_ids:
+                    index.remove(entity_id)
+                for item in items:
+                    index.add(int(item["ID"]), item)
+
+    def _create_search_indexes(self) -> dict[str, dict[str, SearchIndex]]:
+        """Создание пустых поисковых индексов.
+
+        :return: Индексы по типу сущности и имени индекса
+        """
+        search_indexes: dict[str, dict[str, SearchIndex]] = {
+            entity_type: {"name": TokenIndex(search_fields)}
+            for entity_type, search_fields in self._search_fields.items()
+        }
+        search_indexes["contact"].update(
+            phone=LookupIndex("PHONE", normalize_phone),
+            email=LookupIndex("EMAIL", normalize_email),
+            fuzzy=TrigramIndex(
+                self._search_fields["contact"],
+                lambda item: Contact.from_bitrix(item).get_full_name(),
+            ),
+        )
+        search_indexes["deal"]["fuzzy"] = TrigramIndex(
+            self._search_fields["deal"],
+            lambda item: Deal.from_bitrix(item).title,
+        )
+        return search_indexes
+
+    def _build_search_indexes(self) -> None:
+        """Заполнение поисковых индексов записями из базы данных.
+
+        Из базы читаются только поля, которые используют индексы.
+        """
+        search_indexes = self._create_search_indexes()
+
+        with self._lock:
+            for entity_type, indexes in search_indexes.items():
+                field_names = sorted(
+                    {
+                        "ID",
+                        *(
+                            field_name
+                            for index in indexes.values()
+                            for field_name in index.fields
+                        ),
+                    },
+                )
+                fields_object = ", ".join(
+                    f"'{field_name}', json_extract(data, '$.{field_name}')"
+                    for field_name in field_names
+                )
+                cursor = self._connection.execute(
+                    f"SELECT id, json_object({fields_object}) AS fields "  # noqa: S608
+                    "FROM entities WHERE entity_type = ?",
+                    [entity_type],
+                )
+                for row in cursor:
+                    # Отсутствующие в записи поля json_object возвращает как null
+                    item = {
+                        key: value
+                        for key, value in json.loads(row["fields"]).items()
+                        if value is not None
+                    }
+                    for index in indexes.values():
+                        index.add(row["id"], item)
+
+                for index in indexes.values():
+                    index.prepare()
+
+            with self._index_lock:
+                self._search_indexes = search_indexes
+
+    def _fetch_ids(self, entity_type: str) -> array[int]:
+        """Чтение идентификаторов записей в компактный массив.
+
+        :param entity_type: Тип сущности
+        :return: Идентификаторы в порядке возрастания
+        """
+        with self._lock:
+            return array(
+                "q",
+                (
+                    row[0]
+                    for row in self._connection.execute(
+                        "SELECT id FROM entities WHERE entity_type = ? "
+                        "ORDER BY id",
+                        [entity_type],
+                    )
+                ),
+            )
+
+    def _replace_deal_contacts(
+        self,
+        contact_ids_by_deal: dict[int, list[int]],
+    ) -> None:
+        """Замена связей сделок с контактами в одной транзакции.
+
+        :param contact_ids_by_deal: Идентификаторы контактов по ID сделки
+        """
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM deal_contacts WHERE deal_id = ?",
+                [(deal_id,) for deal_id in contact_ids_by_deal],
+            )
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO deal_contacts "
+                "(deal_id, contact_id, position) VALUES (?, ?, ?)",
+                [
+                    (deal_id, contact_id, position)
+                    for deal_id, contact_ids in contact_ids_by_deal.items()
+                    for position, contact_id in enumerate(contact_ids)
+                ],
+            )
+
+    def _build_where(
+        self,
+        entity_type: str,
+        filter_params: dict[str, Any] | None,
+    ) -> tuple[str, list[Any]]:
+        """Преобразование фильтра Bitrix24 в условие SQL.
+
+        :param entity_type: Тип сущности
+        :param filter_params: Параметры фильтрации
+        :return: Условие WHERE и его параметры
+        :raises UnsupportedFilterError: Если фильтр не поддерживается репликой
+        """
+        clauses = ["entity_type = ?"]
+        args: list[Any] = [entity_type]
+
+        for key, value in (filter_params or {}).items():
+            if key in self._ignored_filter_keys:
+                continue
+
+            if key == "$SEARCH":
+                clause, clause_args = self._search_clause(entity_type, value)
+            else:
+                match = self._filter_key_pattern.match(key)
+                if not match:
+                    msg = f"Неподдерживаемый фильтр: {key}"
+                    raise UnsupportedFilterError(msg)
+                operator, field_name = match.groups()
+                clause, clause_args = self._field_clause(
+                    entity_type,
+                    field_name.upper(),
+                    operator or "=",
+                    value,
+                )
+
+            clauses.append(clause)
+            args.extend(clause_args)
+
+        return " AND ".join(clauses), args
+
+    def _search_clause(
+        self,
+        entity_type: str,
+        query: Any,
+    ) -> tuple[str, list[Any]]:
+        """Условие для полнотекстового поиска `$SEARCH`.
+
+        Каждое слово запроса должно входить в одно из полей поиска.
+
+        :param entity_type: Тип сущности
+        :param query: Поисковый запрос
+        :return: Условие и его параметры
+        :raises UnsupportedFilterError: Если для сущности не заданы поля поиска
+        """
+        search_fields = self._search_fields.get(entity_type)
+        if not search_fields:
+            msg = f"Поиск по сущности {entity_type} не поддерживается"
+            raise UnsupportedFilterError(msg)
+
+        haystack = " || ' ' || ".join(
+            f"coalesce(json_extract(data, '$.{field_name}'), '')"
+            for field_name in search_fields
+        )
+        words = str(query).casefold().split()
+        if not words:
+            return "1", []
+
+        return (
+            " AND ".join(f"casefold({haystack}) LIKE ? ESCAPE '\\'" for _ in words),
+            [f"%{self._escape_like(word)}%" for word in words],
+        )
+
+    def _field_clause(
+        self,
+        entity_type: str,
+        field_name: str,
+        operator: str,
+        value: Any,
+    ) -> tuple[str, list[Any]]:
+        """Условие для фильтра по полю.
+
+        :param entity_type: Тип сущности
+        :param field_name: Имя поля Bitrix24
+        :param operator: Оператор фильтра Bitrix24
+        :param value: Значение фильтра
+        :return: Условие и его параметры
+        :raises UnsupportedFilterError: Если фильтр не поддерживается репликой
+        """
+        values = value if isinstance(value, list | tuple | set) else [value]
+        negate = operator in {"!", "!="}
+
+        if entity_type == "deal" and field_name == "CONTACT_ID":
+            return self._in_clause(
+                "id",
+                "SELECT deal_id FROM deal_contacts WHERE contact_id IN ({})",
+                [int(v) for v in values],
+                operator,
+            )
+
+        if field_name in self._multi_fields:
+            if operator not in {"=", "!", "!="}:
+                msg = f"Неподдерживаемый оператор {operator} для {field_name}"
+                raise UnsupportedFilterError(msg)
+            placeholders = ", ".join("?" * len(values))
+            clause = (
+                "EXISTS (SELECT 1 FROM json_each(data, ?) AS multi "  # noqa: S608
+                "WHERE json_extract(multi.value, '$.VALUE') "
+                f"IN ({placeholders}))"
+            )
+            return (
+                f"NOT {clause}" if negate else clause,
+                [f"$.{field_name}", *(str(v) for v in values)],
+            )
+
+        column = "id" if field_name == "ID" else "json_extract(data, ?)"
+        column_args = [] if field_name == "ID" else [f"$.{field_name}"]
+
+        if operator in {"%", "!%"}:
+            clause = f"casefold({column}) LIKE ? ESCAPE '\\'"
+            return (
+                f"NOT coalesce({clause}, 0)" if operator == "!%" else clause,
+                [*column_args, f"%{self._escape_like(str(value).casefold())}%"],
+            )
+
+        if operator in {">", ">=", "<", "<="}:
+            if isinstance(value, int | float):
+                column = f"CAST({column} AS REAL)"
+            return f"{column} {operator} ?", [*column_args, value]
+
+        if field_name == "ID":
+            return self._in_clause(
+                "id",
+                "{}",
+                [int(v) for v in values],
+                operator,
+            )
+
+        placeholders = ", ".join("?" * len(values))
+        clause = f"CAST({column} AS TEXT) IN ({placeholders})"
+        if negate:
+            clause = f"coalesce(NOT {clause}, 1)"
+        return clause, [*column_args, *(str(v) for v in values)]
+
+    @staticmethod
+    def _in_clause(
+        column: str,
+        source: str,
+        values: list[int],
+        operator: str,
+    ) -> tuple[str, list[Any]]:
+        """Условие вхождения значения столбца в список.
+
+        :param column: Столбец
+        :param source: Шаблон источника значений с местом для плейсхолдеров
+        :param values: Значения
+        :param operator: Оператор фильтра Bitrix24
+        :return: Условие и его параметры
+        :raises UnsupportedFilterError: Если оператор не поддерживается
+        """
+        if operator not in {"=", "!", "!="}:
+            msg = f"Неподдерживаемый оператор {operator} для {column}"
+            raise UnsupportedFilterError(msg)
+
+        keyword = "NOT IN" if operator in {"!", "!="} else "IN"
+        placeholders = ", ".join("?" * len(values))
+        return f"{column} {keyword} ({source.format(placeholders)})", values
+
+    @staticmethod
+    def _build_order(
+        order: dict[str, str] | None,
+    ) -> tuple[str, list[Any]]:
+        """Преобразование сортировки Bitrix24 в ORDER BY.
+
+        :param order: Параметры сортировки
+        :return: Выражение ORDER BY и его параметры
+        """
+        expressions: list[str] = []
+        args: list[Any] = []
+
+        for field_name, direction in (order or {}).items():
+            sql_direction = "DESC" if str(direction).upper() == "DESC" else "ASC"
+            if field_name.upper() == "ID":
+                expressions.append(f"id {sql_direction}")
+            else:
+                expressions.append(f"json_extract(data, ?) {sql_direction}")
+                args.append(f"$.{field_name.upper()}")
+
+        if not any(expression.startswith("id ") for expression in expressions):
+            expressions.append("id ASC")
+
+        return ", ".join(expressions), args
+
+    @staticmethod
+    def _escape_like(value: str) -> str:
+        """Экранирование спецсимволов шаблона LIKE.
+
+        :param value: Исходная строка
+        :return: Экранированная строка
+        """
+        return (
+            value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        )
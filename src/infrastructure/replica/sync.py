@@ -0,0 +1,252 @@
+"""Модуль с синхронизацией локальной реплики с Bitrix24.
+
+Содержит первичную загрузку сделок, контактов и связей между ними,
+последующие инкрементальные синхронизации по дате изменения
+и периодическую сверку идентификаторов для обнаружения удалений.
+"""
+
+import asyncio
+import time
+from array import array
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, ClassVar, cast
+
+from src.infrastructure.bitrix.cache import EntityCache
+from src.infrastructure.bitrix.rate_limiter import CallPriority, call_priority
+from src.infrastructure.bitrix.repository_factory import BitrixRepositoryFactory
+from src.infrastructure.logging.logger import logger
+from src.infrastructure.replica.storage import ReplicaStorage
+
+if TYPE_CHECKING:
+    from src.infrastructure.bitrix.bitrix_contact_repository import (
+        BitrixContactRepository,
+    )
+    from src.infrastructure.bitrix.mixins import BitrixReadMixin
+
+
+class ReplicaSynchronizer:
+    """Синхронизация локальной реплики с Bitrix24.
+
+    При первом запуске тип сущности загружается целиком, затем
+    запрашиваются только записи с DATE_MODIFY не раньше начала
+    предыдущей синхронизации (с запасом на расхождение часов сервера
+    и портала). Тип сущности становится доступным для чтения
+    из реплики после завершения первичной загрузки.
+
+    Удаления по DATE_MODIFY не видны, поэтому периодически выполняется
+    сверка: из API загружаются только идентификаторы, и записи,
+    отсутствующие в Bitrix24, удаляются из реплики с отметкой об удалении.
+
+    Все запросы синхронизации и сверки выполняются с приоритетом массовой
+    выгрузки и уступают очередь запросам инструментов.
+    """
+
+    _entity_types: ClassVar[tuple[str, ...]] = ("contact", "deal")
+    # Поля сущности целиком, включая пользовательские: реплика должна
+    # отвечать и на запросы дополнительных полей
+    _replica_fields: ClassVar[list[str]] = ["*", "UF_*"]
+    # Если при сверке отсутствующими оказалась большая доля записей,
+    # вероятнее ошибка доступа или неполный ответ API, чем удаление
+    _max_deleted_share: ClassVar[float] = 0.5
+    # Запас на расхождение часов сервера и портала в секундах
+    _modified_margin: ClassVar[float] = 300.0
+
+    def __init__(
+        self,
+        storage: ReplicaStorage,
+        repository_factory: BitrixRepositoryFactory,
+        interval: float = 300.0,
+        reconcile_interval: float = 900.0,
+        entity_cache: EntityCache | None = None,
+    ):
+        """Инициализация синхронизации.
+
+        :param storage: Хранилище локальной реплики
+        :param repository_factory: Фабрика репозиториев Bitrix24
+        :param interval: Интервал между синхронизациями в секундах
+        :param reconcile_interval: Интервал между сверками удалений в секундах
+        :param entity_cache: Кэш сущностей, из которого удаляются
+                             обнаруженные при сверке записи
+        """
+        self._storage = storage
+        self._repository_factory = repository_factory
+        self._interval = interval
+        self._reconcile_interval = reconcile_interval
+        self._entity_cache = entity_cache
+        self._lock = asyncio.Lock()
+
+    async def run(self) -> None:
+        """Периодическая синхронизация и сверка до отмены задачи.
+
+        Перед первой синхронизацией строятся поисковые индексы по уже
+        сохраненным записям, дальше они обновляются вместе с репликой.
+        Первая сверка выполняется через интервал сверки после запуска,
+        так как первичная загрузка уже содержит только существующие записи.
+        """
+        reconciled_at = time.monotonic()
+
+        try:
+            await self._storage.load_search_indexes()
+        except Exception as e:
+            logger.error(f"Ошибка при построении поисковых индексов реплики: {e}")
+
+        while True:
+            try:
+                await self.sync()
+            except Exception as e:
+                logger.error(f"Ошибка при синхронизации локальной реплики: {e}")
+
+            if time.monotonic() - reconciled_at >= self._reconcile_interval:
+                try:
+                    await self.reconcile()
+                except Exception as e:
+                    logger.error(f"Ошибка при сверке локальной реплики: {e}")
+                reconciled_at = time.monotonic()
+
+            await asyncio.sleep(self._interval)
+
+    async def sync(self) -> None:
+        """Синхронизация всех типов сущностей.
+
+        Одновременно выполняется не более одной синхронизации.
+        """
+        async with self._lock, call_priority(CallPriority.BULK):
+            for entity_type in self._entity_types:
+                await self.sync_entity(entity_type)
+
+    async def sync_entity(self, entity_type: str) -> int:
+        """Синхронизация одного типа сущности.
+
+        Отметка для следующей синхронизации определяется до начала
+        загрузки: страницы обходятся по ID, поэтому записи, измененные
+        во время обхода, могут оказаться на уже загруженных страницах
+        и будут запрошены повторно в следующий раз.
+
+        :param entity_type: Тип сущности
+        :return: Количество загруженных записей
+        """
+        repository = cast(
+            "BitrixReadMixin",
+            self._repository_factory.get_repository(entity_type),
+        )
+        state = await self._storage.get_sync_state(entity_type)
+        last_modified = state.last_modified if state else None
+        next_modified = (
+            datetime.now(UTC) - timedelta(seconds=self._modified_margin)
+        ).isoformat(timespec="seconds")
+
+        filter_params = {}
+        if last_modified:
+            filter_params[">=DATE_MODIFY"] = last_modified
+
+        loaded = 0
+        async for page in repository.iter_raw_pages(
+            filter_params,
+            order={"ID": "ASC"},
+            extra_fields=self._replica_fields,
+        ):
+            await self._storage.upsert(entity_type, page)
+            if entity_type == "deal":
+                await self._sync_deal_contacts(page)
+
+            loaded += len(page)
+
+        await self._storage.set_sync_state(entity_type, next_modified)
+        logger.info(
+            f"Локальная реплика: {entity_type} - "
+            f"{'загружено' if state is None else 'обновлено'} {loaded} записей",
+        )
+        return loaded
+
+    async def reconcile(self) -> None:
+        """Сверка идентификаторов всех загруженных типов сущностей.
+
+        Выполняется под той же блокировкой, что и синхронизация.
+        """
+        async with self._lock, call_priority(CallPriority.BULK):
+            for entity_type in self._entity_types:
+                if self._storage.is_ready(entity_type):
+                    await self.reconcile_entity(entity_type)
+
+    async def reconcile_entity(self, entity_type: str) -> int:
+        """Сверка идентификаторов одного типа сущности с Bitrix24.
+
+        Идентификаторы реплики и API упорядочены по возрастанию, поэтому
+        сравниваются одним проходом без построения множеств: в памяти
+        хранится только массив идентификаторов реплики.
+
+        :param entity_type: Тип сущности
+        :return: Количество удаленных из реплики записей
+        """
+        repository = cast(
+            "BitrixReadMixin",
+            self._repository_factory.get_repository(entity_type),
+        )
+        local_ids = await self._storage.get_ids(entity_type)
+        missing_ids = array("q")
+        position = 0
+
+        async for page in repository.iter_id_pages():
+            for remote_id in page:
+                while (
+                    position < len(local_ids)
+                    and local_ids[position] < remote_id
+                ):
+                    missing_ids.append(local_ids[position])
+                    position += 1
+                if (
+                    position < len(local_ids)
+                    and local_ids[position] == remote_id
+                ):
+                    position += 1
+
+        missing_ids.extend(local_ids[position:])
+
+        if len(missing_ids) > len(local_ids) * self._max_deleted_share:
+            logger.warning(
+                f"Локальная реплика: {entity_type} - сверка пропущена, "
+                f"в Bitrix24 не найдено {len(missing_ids)} "
+                f"из {len(local_ids)} записей",
+            )
+            return 0
+
+        if missing_ids:
+            await self._storage.delete(entity_type, missing_ids)
+            if self._entity_cache is not None:
+                for entity_id in missing_ids:
+                    self._entity_cache.invalidate(entity_type, entity_id)
+
+        logger.info(
+            f"Локальная реплика: {entity_type} - сверено {len(local_ids)} "
+            f"записей, удалено {len(missing_ids)}",
+        )
+        return len(missing_ids)
+
+    async def _sync_deal_contacts(self, deals: list[dict]) -> None:
+        """Загрузка связей страницы сделок с контактами.
+
+        Связи заменяются только у сделок, контакты которых удалось
+        загрузить. Если загрузка не удалась хотя бы для одной сделки,
+        синхронизация прерывается до сохранения отметки, и страница
+        будет запрошена повторно в следующий раз.
+
+        :param deals: Записи сделок
+        :raises RuntimeError: Если контакты части сделок не загружены
+        """
+        contact_repository = cast(
+            "BitrixContactRepository",
+            self._repository_factory.get_repository("contact"),
+        )
+        deal_ids = [
+            int(deal["ID"]) for deal in deals if str(deal.get("ID", "")).isdigit()
+        ]
+        contact_ids = await contact_repository.fetch_deals_contact_ids(deal_ids)
+        await self._storage.set_deal_contacts(contact_ids)
+
+        failed_count = len(set(deal_ids) - contact_ids.keys())
+        if failed_count:
+            msg = (
+                f"Не удалось загрузить контакты {failed_count} "
+                f"из {len(set(deal_ids))} сделок"
+            )
+            raise RuntimeError(msg)
@@ -3,13 +3,72 @@
 Отвечает за конфигурацию и запуск MCP сервера для Bitrix24.
 """
 
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from mcp.server.fastmcp import FastMCP
 
+from src.config import SettingsManager
+from src.container import container
+from src.infrastructure.bitrix.repository_factory import BitrixRepositoryFactory
+from src.infrastructure.logging.logger import logger
 from src.infrastructure.mcp.handlers import (
     register_contact_handlers,
     register_deal_handlers,
 )
 from src.infrastructure.mcp.server import BitrixMCPServer
+from src.infrastructure.replica import ReplicaSynchronizer
+
+
+async def run_background_tasks() -> None:
+    """Прогрев кэша метаданных и синхронизация локальной реплики.
+
+    Категории, стадии и описания полей загружаются в кэш, чтобы
+    инструменты получали их без обращения к API. Если настроена локальная
+    реплика, затем запускается ее периодическая синхронизация.
+
+    Ошибки, в том числе отсутствие настроек подключения к Bitrix24,
+    логируются и не останавливают сервер: метаданные в этом случае
+    загружаются при первом обращении к ним.
+    """
+    try:
+        await container.get(BitrixRepositoryFactory).warm_up_metadata()
+    except Exception as e:
+        logger.error(f"Ошибка при прогреве кэша метаданных: {e}")
+
+    try:
+        synchronizer = (
+            container.get(ReplicaSynchronizer)
+            if SettingsManager.get().REPLICA_PATH
+            else None
+        )
+    except Exception as e:
+        logger.error(f"Ошибка при запуске синхронизации локальной реплики: {e}")
+        return
+
+    if synchronizer is not None:
+        await synchronizer.run()
+
+
+@asynccontextmanager
+async def warm_up_lifespan(_server: FastMCP) -> AsyncIterator[None]:
+    """Жизненный цикл сервера с фоновым прогревом кэша метаданных.
+
+    Прогрев и синхронизация реплики (`run_background_tasks`) выполняются
+    в фоне и не задерживают запуск: сервер сразу начинает обрабатывать
+    запросы, а при остановке фоновая задача отменяется.
+
+    :param _server: Экземпляр MCP сервера
+    """
+    background_task = asyncio.create_task(run_background_tasks())
+    try:
+        yield
+    finally:
+        background_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await background_task
 
 
 def create_mcp_server() -> FastMCP:
@@ -19,7 +78,7 @@ def create_mcp_server() -> FastMCP:
 
     :return: Настроенный экземпляр MCP сервера
     """
-    mcp_server = BitrixMCPServer()
+    mcp_server = BitrixMCPServer(lifespan=warm_up_lifespan)
     register_contact_handlers(mcp_server)
     register_deal_handlers(mcp_server)
     return mcp_server.server
@@ -0,0 +1,189 @@
+"""
+Заглушка портала Bitrix24 для тестов.
+
+Хранит записи списков в памяти и отвечает на вызовы методов списков,
+пакетные запросы и методы с заданными обработчиками так же, как API:
+страницами по 50 записей, с `total` при пагинации по смещению
+и без него при `start=-1`.
+"""
+
+from collections.abc import Callable
+from typing import Any
+from urllib.parse import parse_qsl
+
+PAGE_SIZE = 50
+
+
+class PortalError(Exception):
+    """
+    Ошибка, которую метод возвращает в ответе API.
+    """
+
+
+def parse_query(query: str) -> dict[str, Any]:
+    """
+    Разбор параметров команды пакетного запроса.
+
+    :param query: Строка параметров в формате `http_build_query`
+    :return: Параметры вызова
+    """
+    params: dict[str, Any] = {}
+    for key, value in parse_qsl(query, keep_blank_values=True):
+        path = key.replace(']', '').split('[')
+        node = params
+        for part in path[:-1]:
+            node = node.setdefault(part, {})
+        node[path[-1]] = value
+    return _lists_from_dicts(params)
+
+
+def _lists_from_dicts(value: Any) -> Any:
+    """
+    Преобразование словарей с ключами 0, 1, ... в списки.
+
+    :param value: Разобранное значение
+    :return: Значение со списками
+    """
+    if not isinstance(value, dict):
+        return value
+    items = {key: _lists_from_dicts(item) for key, item in value.items()}
+    if items and all(key.isdigit() for key in items):
+        return [items[key] for key in sorted(items, key=int)]
+    return items
+
+
+class FakePortal:
+    """
+    Портал Bitrix24 в памяти.
+    """
+
+    def __init__(
+        self,
+        records: dict[str, list[dict[str, Any]]] | None = None,
+        handlers: dict[str, Callable[[dict[str, Any]], Any]] | None = None,
+    ):
+        """
+        Инициализация портала.
+
+        :param records: Записи по методам списков (например, crm.contact.list)
+        :param handlers: Обработчики остальных методов, принимающие параметры
+                         вызова и возвращающие result
+        """
+        self.records = records or {}
+        self.handlers = handlers or {}
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+        # Пакеты, содержащие любую из этих команд, завершаются сбоем
+        self.failing_commands: set[str] = set()
+
+    async def call(self, method: str, items: Any = None, raw: bool = False):
+        """
+        Вызов метода API.
+
+        :param method: Метод API
+        :param items: Параметры вызова
+        :param raw: Вернуть ответ API целиком
+        :return: Ответ API
+        """
+        params = dict(items or {})
+        self.calls.append((method, params))
+        if method == 'batch':
+            return self._batch(params['cmd'])
+
+        response = self._respond(method, params)
+        return response if raw else response['result']
+
+    def list_calls(self, method: str) -> list[dict[str, Any]]:
+        """
+        Параметры вызовов метода, в том числе внутри пакетных запросов.
+
+        :param method: Метод API
+        :return: Параметры вызовов в порядке их выполнения
+        """
+        found = []
+        for called, params in self.calls:
+            if called == method:
+                found.append(params)
+            elif called == 'batch':
+                for command in params['cmd'].values():
+                    name, _, query = command.partition('?')
+                    if name == method:
+                        found.append(parse_query(query))
+        return found
+
+    def _respond(self, method: str, params: dict[str, Any]) -> dict[str, Any]:
+        """
+        Ответ на вызов метода.
+
+        :param method: Метод API
+        :param params: Параметры вызова
+        :return: Ответ API целиком
+        :raises PortalError: Если обработчик метода вернул ошибку
+        """
+        if method in self.handlers:
+            return {'result': self.handlers[method](params)}
+        return self._list(self.records[method], params)
+
+    @staticmethod
+    def _list(
+        records: list[dict[str, Any]],
+        params: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        Страница списка с фильтром по ID, сортировкой по ID и смещением.
+
+        :param records: Записи списка
+        :param params: Параметры вызова
+        :return: Ответ API целиком
+        """
+        selected = list(records)
+        for key, value in (params.get('filter') or {}).items():
+            if key == '>ID':
+                selected = [r for r in selected if int(r['ID']) > int(value)]
+            elif key == '<ID':
+                selected = [r for r in selected if int(r['ID']) < int(value)]
+
+        order = params.get('order') or {}
+        if str(order.get('ID', 'ASC')).upper() == 'DESC':
+            selected.reverse()
+
+        start = int(params.get('start', 0))
+        offset = max(start, 0)
+        response: dict[str, Any] = {
+            'result': selected[offset : offset + PAGE_SIZE],
+        }
+        if start != -1:
+            response['total'] = len(selected)
+        return response
+
+    def _batch(self, commands: dict[str, str]) -> dict[str, Any]:
+        """
+        Ответ на пакетный запрос.
+
+        :param commands: Команды пакета по именам
+        :return: Ответ API целиком
+        :raises ConnectionError: Если пакет содержит команду из `failing_commands`
+        """
+        if self.failing_commands & commands.keys():
+            raise ConnectionError('batch failed')
+
+        result: dict[str, Any] = {}
+        errors: dict[str, Any] = {}
+        totals: dict[str, int] = {}
+        for name, command in commands.items():
+            method, _, query = command.partition('?')
+            try:
+                response = self._respond(method, parse_query(query))
+            except PortalError as e:
+                errors[name] = {'error': 'ERROR', 'error_description': str(e)}
+                continue
+            result[name] = response['result']
+            if 'total' in response:
+                totals[name] = response['total']
+        return {
+            'result': {
+                'result': result,
+                'result_error': errors,
+                'result_total': totals,
+                'result_next': {},
+            },
+        }
@@ -0,0 +1,141 @@
+"""
+Тесты пакетных запросов к API Bitrix24.
+"""
+
+import asyncio
+from typing import Any
+
+from portal import FakePortal, PortalError
+
+from src.infrastructure.bitrix.bitrix_contact_repository import (
+    BitrixContactRepository,
+)
+from src.infrastructure.bitrix.retry import RetryPolicy
+
+
+class CountingPortal(FakePortal):
+    """
+    Портал, считающий одновременно выполняемые пакетные запросы.
+    """
+
+    def __init__(self, **kwargs: Any):
+        """
+        Инициализация портала.
+
+        :param kwargs: Записи и обработчики портала
+        """
+        super().__init__(**kwargs)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def call(self, method: str, items: Any = None, raw: bool = False):
+        """
+        Вызов метода API.
+
+        :param method: Метод API
+        :param items: Параметры вызова
+        :param raw: Вернуть ответ API целиком
+        :return: Ответ API
+        """
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return await super().call(method, items, raw)
+        finally:
+            self.in_flight -= 1
+
+
+def get_contact(params: dict[str, Any]) -> dict[str, str]:
+    """
+    Обработчик crm.contact.get: контакт 13 не существует.
+
+    :param params: Параметры вызова
+    :return: Контакт
+    :raises PortalError: Если контакт не найден
+    """
+    if params['ID'] == '13':
+        msg = 'Not found'
+        raise PortalError(msg)
+    return {'ID': params['ID']}
+
+
+def make_repository() -> tuple[BitrixContactRepository, CountingPortal]:
+    """
+    Репозиторий контактов без повторных попыток.
+
+    :return: Репозиторий и портал
+    """
+    portal = CountingPortal(handlers={'crm.contact.get': get_contact})
+    repository = BitrixContactRepository(portal)
+    repository._read_retry_policy = RetryPolicy(max_attempts=1)
+    return repository, portal
+
+
+def contact_commands(count: int) -> dict[str, tuple[str, dict[str, Any]]]:
+    """
+    Команды получения контактов с ID от 1 до count.
+
+    :param count: Количество команд
+    :return: Команды пакета по именам
+    """
+    return {
+        f'c{i}': ('crm.contact.get', {'ID': i}) for i in range(1, count + 1)
+    }
+
+
+def test_commands_are_split_and_merged() -> None:
+    """
+    Команды делятся на пакеты по 50, ответы объединяются по именам,
+    ошибки отдельных команд сохраняются.
+    """
+    repository, portal = make_repository()
+
+    response = asyncio.run(repository.execute_batch_detailed(contact_commands(120)))
+
+    batches = [params['cmd'] for method, params in portal.calls if method == 'batch']
+    assert [len(commands) for commands in batches] == [50, 50, 20]
+    assert set(response.result) == {f'c{i}' for i in range(1, 121)} - {'c13'}
+    assert response.result['c120'] == {'ID': '120'}
+    assert set(response.errors) == {'c13'}
+
+
+def test_failed_chunk_marks_only_its_commands() -> None:
+    """
+    Сбой одного пакета переносит в ошибки только его команды.
+    """
+    repository, portal = make_repository()
+    portal.failing_commands = {'c60'}
+
+    response = asyncio.run(repository.execute_batch_detailed(contact_commands(120)))
+
+    assert set(response.errors) == {'c13'} | {f'c{i}' for i in range(51, 101)}
+    assert set(response.result) == (
+        {f'c{i}' for i in range(1, 121)} - set(response.errors)
+    )
+
+
+def test_chunks_are_sent_with_limited_concurrency() -> None:
+    """
+    Одновременно отправляется не больше заданного числа пакетов.
+    """
+    repository, portal = make_repository()
+
+    asyncio.run(
+        repository.execute_batch_detailed(contact_commands(300), concurrency=2),
+    )
+
+    assert portal.max_in_flight == 2
+
+
+def test_empty_sections_are_read_as_dicts() -> None:
+    """
+    Пустые разделы ответа batch приходят списками и читаются как словари.
+    """
+    payload = {'result': [], 'result_error': [], 'result_total': {'c1': 3}}
+
+    assert BitrixContactRepository._batch_section(payload, 'result') == {}
+    assert BitrixContactRepository._batch_section(payload, 'result_error') == {}
+    assert BitrixContactRepository._batch_section(payload, 'result_total') == {
+        'c1': 3,
+    }
@@ -0,0 +1,162 @@
+"""
+Тесты объединения одинаковых одновременных вызовов чтения.
+"""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from src.infrastructure.bitrix.bitrix_contact_repository import (
+    BitrixContactRepository,
+)
+from src.infrastructure.bitrix.deadline import DeadlineExceededError, deadline
+
+
+class GatedBitrix:
+    """
+    Заглушка клиента Bitrix24, отвечающая после открытия шлюза.
+    """
+
+    def __init__(self):
+        """
+        Инициализация заглушки.
+        """
+        self.gate = asyncio.Event()
+        self.calls: list[tuple[str, Any]] = []
+        self.cancelled = 0
+
+    async def call(self, method: str, items: Any = None, raw: bool = False):
+        """
+        Вызов метода API, ожидающий открытия шлюза.
+
+        :param method: Метод API
+        :param items: Параметры вызова
+        :param raw: Вернуть ответ API целиком
+        :return: Ответ API
+        """
+        self.calls.append((method, items))
+        try:
+            await self.gate.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        result = {'ID': str(items['ID'])}
+        return {'result': result} if raw else result
+
+
+async def call_with_deadline(
+    repository: BitrixContactRepository,
+    timeout: float,
+) -> Any:
+    """
+    Вызов чтения в пределах срока.
+
+    :param repository: Репозиторий
+    :param timeout: Срок в секундах
+    :return: Ответ API
+    """
+    with deadline(timeout):
+        return await repository._call('crm.contact.get', {'ID': 1})
+
+
+def test_identical_reads_share_one_request() -> None:
+    """
+    Одинаковые одновременные чтения выполняются одним запросом.
+    """
+
+    async def scenario() -> tuple[list[Any], GatedBitrix]:
+        bitrix = GatedBitrix()
+        repository = BitrixContactRepository(bitrix)
+        calls = [
+            asyncio.create_task(repository._call('crm.contact.get', {'ID': 1}))
+            for _ in range(3)
+        ]
+        other = asyncio.create_task(
+            repository._call('crm.contact.get', {'ID': 2}),
+        )
+        await asyncio.sleep(0)
+        bitrix.gate.set()
+        return [*await asyncio.gather(*calls), await other], bitrix
+
+    results, bitrix = asyncio.run(scenario())
+
+    assert results == [{'ID': '1'}] * 3 + [{'ID': '2'}]
+    assert len(bitrix.calls) == 2
+
+
+def test_writes_are_not_coalesced() -> None:
+    """
+    Вызовы изменения выполняются каждый своим запросом.
+    """
+
+    async def scenario() -> GatedBitrix:
+        bitrix = GatedBitrix()
+        repository = BitrixContactRepository(bitrix)
+        calls = [
+            asyncio.create_task(
+                repository._call('crm.contact.update', {'ID': 1}),
+            )
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        bitrix.gate.set()
+        await asyncio.gather(*calls)
+        return bitrix
+
+    assert len(asyncio.run(scenario()).calls) == 2
+
+
+def test_request_continues_while_a_waiter_remains() -> None:
+    """
+    Истечение срока одного ожидающего не отменяет общий запрос.
+    """
+
+    async def scenario() -> tuple[Any, GatedBitrix]:
+        bitrix = GatedBitrix()
+        repository = BitrixContactRepository(bitrix)
+        short = asyncio.create_task(call_with_deadline(repository, 0.01))
+        long = asyncio.create_task(call_with_deadline(repository, 5))
+
+        with pytest.raises(DeadlineExceededError):
+            await short
+        bitrix.gate.set()
+        return await long, bitrix
+
+    result, bitrix = asyncio.run(scenario())
+
+    assert result == {'ID': '1'}
+    assert len(bitrix.calls) == 1
+    assert bitrix.cancelled == 0
+
+
+def test_request_is_cancelled_when_last_waiter_leaves() -> None:
+    """
+    Когда перестает ждать последний, запрос отменяется, а следующий
+    одинаковый вызов выполняет новый запрос.
+    """
+
+    async def scenario() -> tuple[Any, GatedBitrix]:
+        bitrix = GatedBitrix()
+        repository = BitrixContactRepository(bitrix)
+        waiters = [
+            asyncio.create_task(call_with_deadline(repository, 0.01))
+            for _ in range(2)
+        ]
+        for waiter in waiters:
+            with pytest.raises(DeadlineExceededError):
+                await waiter
+        await asyncio.sleep(0)
+
+        assert bitrix.cancelled == 1
+        assert not repository._in_flight_calls
+
+        again = asyncio.create_task(repository._call('crm.contact.get', {'ID': 1}))
+        await asyncio.sleep(0)
+        bitrix.gate.set()
+        return await again, bitrix
+
+    result, bitrix = asyncio.run(scenario())
+
+    assert result == {'ID': '1'}
+    assert len(bitrix.calls) == 2
@@ -0,0 +1,203 @@
+"""
+Тесты сроков выполнения вызовов инструментов.
+"""
+
+import asyncio
+from typing import Any
+
+from portal import FakePortal
+
+from src.infrastructure.bitrix.bitrix_contact_repository import (
+    BitrixContactRepository,
+)
+from src.infrastructure.bitrix.cache import MetadataCache
+from src.infrastructure.bitrix.deadline import deadline, get_deadline
+from src.infrastructure.bitrix.rate_limiter import (
+    CallPriority,
+    call_priority,
+    resolve_call_priority,
+)
+from src.infrastructure.bitrix.retry import RetryPolicy
+
+
+class SlowPortal(FakePortal):
+    """
+    Портал, отвечающий на вызовы одного метода с задержкой.
+    """
+
+    def __init__(
+        self,
+        delay: float,
+        slow_method: str = 'batch',
+        **kwargs: Any,
+    ):
+        """
+        Инициализация портала.
+
+        :param delay: Задержка ответа в секундах
+        :param slow_method: Метод, ответ на который задерживается
+        :param kwargs: Записи и обработчики портала
+        """
+        super().__init__(**kwargs)
+        self.delay = delay
+        self.slow_method = slow_method
+
+    async def call(self, method: str, items: Any = None, raw: bool = False):
+        """
+        Вызов метода API.
+
+        :param method: Метод API
+        :param items: Параметры вызова
+        :param raw: Вернуть ответ API целиком
+        :return: Ответ API
+        """
+        if method == self.slow_method:
+            await asyncio.sleep(self.delay)
+        return await super().call(method, items, raw)
+
+
+def paginate_contacts(
+    portal: FakePortal,
+    timeout: float | None,
+) -> tuple[list[dict[str, Any]], bool]:
+    """
+    Параллельная загрузка списка контактов в пределах срока.
+
+    :param portal: Портал
+    :param timeout: Срок в секундах
+    :return: Загруженные записи и признак сокращения результата
+    """
+    repository = BitrixContactRepository(portal)
+    repository._read_retry_policy = RetryPolicy(max_attempts=1)
+
+    async def load() -> tuple[list[dict[str, Any]], bool]:
+        with deadline(timeout) as budget:
+            items = await repository.paginate(
+                'crm.contact.list',
+                {},
+                lambda page: page,
+                'Ошибка при загрузке контактов',
+                parallel=True,
+            )
+        return items, budget.truncated
+
+    return asyncio.run(load())
+
+
+def contact_records(count: int) -> dict[str, list[dict[str, Any]]]:
+    """
+    Записи контактов с идентификаторами от 1 до count.
+
+    :param count: Количество записей
+    :return: Записи по методу списка
+    """
+    return {'crm.contact.list': [{'ID': str(i)} for i in range(1, count + 1)]}
+
+
+def test_expired_deadline_returns_loaded_pages() -> None:
+    """
+    По истечении срока возвращаются загруженные страницы,
+    а срок помечается как сокративший результат.
+    """
+    portal = SlowPortal(1.0, records=contact_records(200))
+
+    items, truncated = paginate_contacts(portal, timeout=0.1)
+
+    assert [item['ID'] for item in items] == [str(i) for i in range(1, 51)]
+    assert truncated
+
+
+def test_complete_list_is_not_marked_truncated() -> None:
+    """
+    Список, загруженный до срока, не помечается как сокращенный.
+    """
+    portal = SlowPortal(0, records=contact_records(200))
+
+    items, truncated = paginate_contacts(portal, timeout=5)
+
+    assert len(items) == 200
+    assert not truncated
+
+
+def test_failed_page_is_not_passed_off_as_truncation() -> None:
+    """
+    Страница, не загруженная по другой причине до истечения срока,
+    не дает неполного результата.
+    """
+    portal = SlowPortal(0, records=contact_records(200))
+    portal.failing_commands = {'page100'}
+
+    items, truncated = paginate_contacts(portal, timeout=5)
+
+    assert items == []
+    assert not truncated
+
+
+def test_nested_deadline_marks_outer_truncated() -> None:
+    """
+    Отметка о сокращении передается внешнему сроку, а вложенный
+    срок не позже внешнего.
+    """
+    with deadline(5) as outer:
+        with deadline(60) as inner:
+            assert inner.expires_at == outer.expires_at
+            inner.mark_truncated()
+
+    assert outer.truncated
+
+
+def test_metadata_refresh_runs_without_caller_context() -> None:
+    """
+    Фоновое обновление метаданных не наследует срок и приоритет
+    вызывающего кода и выполняется как массовая выгрузка,
+    а первая загрузка - как точечный запрос.
+    """
+    observed: list[tuple[Any, CallPriority]] = []
+
+    async def loader() -> dict[str, str]:
+        observed.append(
+            (get_deadline(), resolve_call_priority('crm.status.list')),
+        )
+        return {'NEW': 'Новая'}
+
+    async def scenario() -> None:
+        cache = MetadataCache(ttl=0)
+        with deadline(5), call_priority(CallPriority.WRITE):
+            await cache.get('stages', loader)
+            await cache.get('stages', loader)
+        await asyncio.sleep(0)
+
+    asyncio.run(scenario())
+
+    assert observed == [
+        (None, CallPriority.INTERACTIVE),
+        (None, CallPriority.BULK),
+    ]
+
+
+def test_metadata_refresh_outlives_caller_deadline() -> None:
+    """
+    Фоновое обновление завершается и после истечения срока
+    вызвавшего его запроса.
+    """
+    versions = iter(range(1, 10))
+    portal = SlowPortal(
+        0.05,
+        slow_method='crm.status.list',
+        handlers={'crm.status.list': lambda params: [next(versions)]},
+    )
+    repository = BitrixContactRepository(portal)
+
+    async def scenario() -> Any:
+        cache = MetadataCache(ttl=0)
+
+        async def loader() -> Any:
+            return await repository._call('crm.status.list', {})
+
+        await cache.get('stages', loader)
+        with deadline(0.01):
+            stale = await cache.get('stages', loader)
+        await asyncio.sleep(0.1)
+        return stale, await cache.get('stages', loader)
+
+    assert asyncio.run(scenario()) == ([1], [2])
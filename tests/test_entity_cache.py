@@ -0,0 +1,138 @@
+"""
+Тесты кэша сущностей Bitrix24.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from portal import FakePortal
+
+from src.infrastructure.bitrix import cache as cache_module
+from src.infrastructure.bitrix.bitrix_contact_repository import (
+    BitrixContactRepository,
+)
+from src.infrastructure.bitrix.cache import EntityCache
+
+
+class Clock:
+    """
+    Управляемые часы вместо `time.monotonic`.
+    """
+
+    def __init__(self):
+        """
+        Инициализация часов.
+        """
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        """
+        Текущее время.
+
+        :return: Время в секундах
+        """
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    """
+    Подмена часов модуля кэша (остальные модули, в том числе asyncio,
+    используют настоящие).
+
+    :param monkeypatch: Фикстура pytest
+    :return: Часы
+    """
+    fake = Clock()
+    monkeypatch.setattr(cache_module, 'time', SimpleNamespace(monotonic=fake))
+    return fake
+
+
+def test_entry_expires_after_ttl(clock: Clock) -> None:
+    """
+    Запись устаревает по TTL своего типа, но доступна как устаревшая.
+    """
+    cache = EntityCache(default_ttl=60, ttl_by_type={'deal': 10})
+    cache.set('deal', 1, {'title': 'A'})
+    cache.set('contact', 1, {'name': 'B'})
+
+    clock.now += 30
+
+    assert cache.get('deal', 1) is None
+    assert cache.get('deal', 1, allow_stale=True) == {'title': 'A'}
+    assert cache.get('contact', 1) == {'name': 'B'}
+
+
+def test_least_recently_used_entry_is_evicted(clock: Clock) -> None:
+    """
+    При переполнении вытесняется запись, к которой дольше не обращались.
+    """
+    cache = EntityCache(max_size=2)
+    cache.set('contact', 1, 'first')
+    cache.set('contact', 2, 'second')
+    cache.get('contact', 1)
+
+    cache.set('contact', 3, 'third')
+
+    assert len(cache) == 2
+    assert cache.get('contact', 2) is None
+    assert cache.get('contact', 1) == 'first'
+    assert cache.get('contact', 3) == 'third'
+
+
+def test_cached_value_is_copied(clock: Clock) -> None:
+    """
+    Изменение полученного объекта не меняет сохраненное значение.
+    """
+    cache = EntityCache()
+    cache.set('contact', 1, {'phones': ['1']})
+
+    cache.get('contact', 1)['phones'].append('2')
+
+    assert cache.get('contact', 1) == {'phones': ['1']}
+
+
+def test_invalidate_and_clear_by_type(clock: Clock) -> None:
+    """
+    Записи удаляются по идентификатору и по типу сущности.
+    """
+    cache = EntityCache()
+    cache.set('contact', 1, 'a')
+    cache.set('contact', 2, 'b')
+    cache.set('deal', 1, 'c')
+
+    cache.invalidate('contact', 1)
+    cache.clear('contact')
+
+    assert cache.get('contact', 1) is None
+    assert cache.get('contact', 2) is None
+    assert cache.get('deal', 1) == 'c'
+
+
+def test_repository_invalidates_entity_on_write(clock: Clock) -> None:
+    """
+    Чтение по ID идет из кэша до изменения сущности.
+    """
+    names = {1: 'Иван'}
+    portal = FakePortal(
+        handlers={
+            'crm.contact.get': lambda params: {
+                'ID': str(params['ID']),
+                'NAME': names[int(params['ID'])],
+            },
+            'crm.contact.update': lambda params: True,
+        },
+    )
+    repository = BitrixContactRepository(portal, entity_cache=EntityCache())
+
+    async def scenario() -> list[str | None]:
+        first = await repository.get_by_id(1)
+        second = await repository.get_by_id(1)
+        names[1] = 'Петр'
+        await repository.update_fields(1, {'NAME': 'Петр'})
+        third = await repository.get_by_id(1)
+        return [first.name, second.name, third.name]
+
+    assert asyncio.run(scenario()) == ['Иван', 'Иван', 'Петр']
+    assert len(portal.list_calls('crm.contact.get')) == 2
@@ -0,0 +1,103 @@
+"""
+Тесты ленивого представления сущностей Bitrix24.
+"""
+
+import json
+from dataclasses import asdict
+from typing import Any
+
+import pytest
+
+from src.domain.entities.contact import Contact
+from src.domain.entities.deal import Deal
+from src.domain.entities.lazy_entity import LazyEntity
+from src.infrastructure.mcp.serialization import dumps
+
+CONTACT = {
+    'ID': '7',
+    'NAME': 'Иван',
+    'LAST_NAME': 'Петров',
+    'COMPANY_ID': '',
+    'ASSIGNED_BY_ID': '1',
+    'DATE_CREATE': '2024-05-01T10:00:00+03:00',
+    'EMAIL': [{'ID': '11', 'VALUE': 'ivan@example.com', 'VALUE_TYPE': 'HOME'}],
+    'PHONE': [
+        {'ID': '12', 'VALUE': '+79001112233', 'VALUE_TYPE': 'MOBILE'},
+        {'ID': '13', 'VALUE': '+74950001122', 'VALUE_TYPE': 'WORK'},
+    ],
+}
+
+DEAL = {
+    'ID': '42',
+    'TITLE': 'Поставка',
+    'STAGE_ID': 'C1:NEW',
+    'COMPANY_ID': '5',
+    'OPPORTUNITY': '1500.50',
+    'CURRENCY_ID': 'RUB',
+    'CATEGORY_ID': '1',
+    'UF_CRM_SOURCE': 'web',
+}
+
+
+@pytest.mark.parametrize(
+    'data',
+    [CONTACT, {'ID': '8'}, {'order0000000000': CONTACT}],
+)
+def test_contact_matches_entity(data: dict[str, Any]) -> None:
+    """
+    Ленивый контакт дает те же значения, что и объект сущности.
+    """
+    lazy = LazyEntity(Contact, data)
+    entity = Contact.from_bitrix(data)
+
+    assert lazy.to_dict() == asdict(entity)
+    assert lazy.materialize() == entity
+    assert lazy.to_bitrix() == entity.to_bitrix()
+    assert lazy.to_str_json() == entity.to_str_json()
+    assert json.loads(dumps([lazy])) == json.loads(dumps([entity]))
+
+
+def test_deal_with_values_from_outside_the_record() -> None:
+    """
+    Значения полей, переданные отдельно от записи, заменяют значения
+    по умолчанию.
+    """
+    additional_fields = {'UF_CRM_SOURCE': 'web'}
+    lazy = LazyEntity(
+        Deal,
+        DEAL,
+        contact_ids=[3, 4],
+        additional_fields=additional_fields,
+    )
+    entity = Deal.from_bitrix(DEAL, contact_ids=[3, 4])
+    entity.additional_fields = additional_fields
+
+    assert lazy.to_dict() == asdict(entity)
+    assert lazy.to_bitrix() == entity.to_bitrix()
+    assert lazy.opportunity == 1500.5
+    assert lazy.category_id == 1
+    assert lazy.is_active() == entity.is_active()
+
+
+def test_fields_are_decoded_on_first_access() -> None:
+    """
+    Поле преобразуется при первом обращении, сериализация
+    не преобразует поля.
+    """
+    lazy = LazyEntity(Contact, CONTACT)
+
+    lazy.to_dict()
+    assert lazy._values == {}
+
+    assert lazy.get_primary_phone() == '+74950001122'
+    assert set(lazy._values) == {'phone'}
+    assert lazy.phone is lazy.phone
+    assert lazy.get_full_name() == 'Петров Иван'
+
+
+def test_record_without_required_field_is_rejected() -> None:
+    """
+    Запись без обязательного поля сущности не принимается.
+    """
+    with pytest.raises(ValueError, match='ID'):
+        LazyEntity(Contact, {'NAME': 'Иван'})
@@ -0,0 +1,80 @@
+"""
+Тесты жизненного цикла MCP сервера.
+"""
+
+import asyncio
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from src.config import SettingsManager
+from src.presentation import mcp as mcp_module
+
+
+class PendingFactory:
+    """
+    Фабрика репозиториев, прогрев которой не завершается сам.
+    """
+
+    def __init__(self):
+        """
+        Инициализация фабрики.
+        """
+        self.started = asyncio.Event()
+        self.cancelled = False
+
+    async def warm_up_metadata(self) -> None:
+        """
+        Прогрев кэша, ожидающий отмены.
+        """
+        self.started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+def test_startup_does_not_wait_for_warm_up(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Сервер запускается, не дожидаясь прогрева, а при остановке
+    прогрев отменяется.
+    """
+    factory = PendingFactory()
+    monkeypatch.setattr(
+        mcp_module,
+        'container',
+        SimpleNamespace(get=lambda dependency: factory),
+    )
+
+    async def scenario() -> None:
+        async with mcp_module.warm_up_lifespan(None):
+            await factory.started.wait()
+
+    asyncio.run(asyncio.wait_for(scenario(), timeout=1))
+
+    assert factory.cancelled
+
+
+def test_startup_without_webhook_url_logs_error(
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """
+    Без URL вебхука сервер запускается, а ошибка прогрева логируется.
+    """
+    monkeypatch.delenv('BITRIX_WEBHOOK_URL', raising=False)
+    monkeypatch.setattr(SettingsManager, '_instance', None)
+
+    async def scenario() -> None:
+        async with mcp_module.warm_up_lifespan(None):
+            for _ in range(10):
+                await asyncio.sleep(0)
+
+    with caplog.at_level(logging.ERROR):
+        asyncio.run(scenario())
+
+    assert 'BITRIX_WEBHOOK_URL' in caplog.text
@@ -0,0 +1,91 @@
+"""
+Тесты пагинации списков Bitrix24.
+"""
+
+import asyncio
+
+from portal import FakePortal
+
+from src.infrastructure.bitrix.bitrix_contact_repository import (
+    BitrixContactRepository,
+)
+
+
+def contact_records(count: int) -> list[dict[str, str]]:
+    """
+    Записи контактов с идентификаторами от 1 до count.
+
+    :param count: Количество записей
+    :return: Записи в формате API
+    """
+    return [{'ID': str(i), 'NAME': f'Контакт {i}'} for i in range(1, count + 1)]
+
+
+def make_repository(count: int) -> tuple[BitrixContactRepository, FakePortal]:
+    """
+    Репозиторий контактов поверх портала в памяти.
+
+    :param count: Количество контактов на портале
+    :return: Репозиторий и портал
+    """
+    portal = FakePortal({'crm.contact.list': contact_records(count)})
+    return BitrixContactRepository(portal), portal
+
+
+def test_full_list_is_loaded_by_key() -> None:
+    """
+    Полная выгрузка с первой записи идет по ключу без подсчета total.
+    """
+    repository, portal = make_repository(120)
+
+    contacts = asyncio.run(repository.list_entities(limit=-1))
+
+    assert [contact.id for contact in contacts] == list(range(1, 121))
+    calls = portal.list_calls('crm.contact.list')
+    assert all(params['start'] == -1 for params in calls)
+    assert [params['filter'].get('>ID') for params in calls] == [None, 50, 100]
+
+
+def test_full_list_from_offset_is_loaded_by_offset() -> None:
+    """
+    Полная выгрузка с ненулевой позиции не начинается с первой записи.
+    """
+    repository, portal = make_repository(120)
+
+    contacts = asyncio.run(repository.list_entities(start=70, limit=-1))
+
+    assert [contact.id for contact in contacts] == list(range(71, 121))
+    calls = portal.list_calls('crm.contact.list')
+    assert all(int(params['start']) >= 70 for params in calls)
+
+
+def test_pages_from_offset_are_loaded_by_offset() -> None:
+    """
+    Постраничная загрузка с ненулевой позиции идет по смещению.
+    """
+    repository, _ = make_repository(120)
+    params = repository._build_list_params(order={'ID': 'ASC'}, start=100)
+
+    async def load() -> list[str]:
+        return [
+            item['ID']
+            async for page in repository._iter_list_pages(params, 'error')
+            for item in page
+        ]
+
+    assert asyncio.run(load()) == [str(i) for i in range(101, 121)]
+
+
+def test_limited_list_keeps_offset_pagination() -> None:
+    """
+    Ограниченный список загружается по смещению.
+    """
+    repository, portal = make_repository(120)
+
+    contacts = asyncio.run(repository.list_entities(limit=60))
+
+    assert [contact.id for contact in contacts] == list(range(1, 61))
+    assert all(
+        params['start'] != -1
+        for params in portal.list_calls('crm.contact.list')
+    )
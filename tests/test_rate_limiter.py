@@ -0,0 +1,285 @@
+"""
+Тесты адаптивного ограничителя частоты запросов.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.infrastructure.bitrix import rate_limiter as rate_limiter_module
+from src.infrastructure.bitrix.rate_limiter import (
+    AdaptiveRateLimiter,
+    CallPriority,
+)
+
+
+class VirtualClock:
+    """
+    Виртуальное время модуля ограничителя: ожидание мгновенно
+    сдвигает часы на время паузы.
+    """
+
+    def __init__(self):
+        """
+        Инициализация часов.
+        """
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        """
+        Текущее время.
+
+        :return: Время в секундах
+        """
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        """
+        Пауза в виртуальном времени.
+
+        :param delay: Длительность паузы в секундах
+        """
+        self.now += max(delay, 0.0)
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> VirtualClock:
+    """
+    Подмена часов и пауз модуля ограничителя.
+
+    :param monkeypatch: Фикстура pytest
+    :return: Часы
+    """
+    fake = VirtualClock()
+    monkeypatch.setattr(
+        rate_limiter_module,
+        'time',
+        SimpleNamespace(monotonic=fake, time=fake),
+    )
+    monkeypatch.setattr(
+        rate_limiter_module,
+        'asyncio',
+        SimpleNamespace(
+            sleep=fake.sleep,
+            get_running_loop=asyncio.get_running_loop,
+            create_task=asyncio.create_task,
+        ),
+    )
+    return fake
+
+
+def grant_times(
+    limiter: AdaptiveRateLimiter,
+    clock: VirtualClock,
+    count: int,
+    method: str = 'crm.deal.list',
+) -> list[float]:
+    """
+    Время получения разрешений на последовательные запросы.
+
+    :param limiter: Ограничитель
+    :param clock: Часы
+    :param count: Количество запросов
+    :param method: Метод API
+    :return: Время от начала для каждого разрешения
+    """
+    started_at = clock.now
+
+    async def acquire_all() -> list[float]:
+        times = []
+        for _ in range(count):
+            await limiter.acquire(method)
+            times.append(round(clock.now - started_at, 6))
+        return times
+
+    return asyncio.run(acquire_all())
+
+
+def test_burst_is_spent_before_waiting(clock: VirtualClock) -> None:
+    """
+    Запас расходуется без ожидания, затем запросы идут с заданной частотой.
+    """
+    limiter = AdaptiveRateLimiter(rate=2.0, burst=3)
+
+    assert grant_times(limiter, clock, 5) == [0, 0, 0, 0.5, 1.0]
+
+
+def test_limit_exceeded_halves_rate_once_per_interval(
+    clock: VirtualClock,
+) -> None:
+    """
+    QUERY_LIMIT_EXCEEDED обнуляет запас и снижает частоту вдвое,
+    одновременные ошибки снижают ее один раз, не ниже минимальной.
+    """
+    limiter = AdaptiveRateLimiter(rate=2.0, burst=10, min_rate=0.4)
+
+    limiter.on_limit_exceeded()
+    limiter.on_limit_exceeded()
+    assert limiter.rate == 1.0
+    assert grant_times(limiter, clock, 2) == [1.0, 2.0]
+
+    for _ in range(3):
+        clock.now += 1.0
+        limiter.on_limit_exceeded()
+    assert limiter.rate == 0.4
+
+
+def test_rate_recovers_after_successful_responses(clock: VirtualClock) -> None:
+    """
+    После успешных ответов частота постепенно возвращается к максимальной.
+    """
+    limiter = AdaptiveRateLimiter(rate=2.0)
+    limiter.on_limit_exceeded()
+
+    for _ in range(10):
+        limiter.observe('crm.deal.list', {'result': []})
+    assert limiter.rate == pytest.approx(1.5)
+
+    for _ in range(100):
+        limiter.observe('crm.deal.list', {'result': []})
+    assert limiter.rate == 2.0
+
+
+def test_operating_time_near_limit_slows_down(clock: VirtualClock) -> None:
+    """
+    Приближение времени выполнения метода к лимиту снижает частоту.
+    """
+    limiter = AdaptiveRateLimiter(rate=2.0, operating_limit=480.0)
+
+    limiter.observe('crm.deal.list', {'time': {'operating': 100}})
+    assert limiter.rate == 2.0
+
+    limiter.observe('crm.deal.list', {'time': {'operating': 400}})
+    assert limiter.rate == 1.0
+
+
+def test_exhausted_method_is_paused_until_reset(clock: VirtualClock) -> None:
+    """
+    Метод, исчерпавший лимит времени выполнения, ждет сброса лимита,
+    остальные методы выполняются без ожидания.
+    """
+    limiter = AdaptiveRateLimiter(rate=2.0, operating_limit=480.0)
+    limiter.observe(
+        'crm.deal.list',
+        {'time': {'operating': 480, 'operating_reset_at': clock.now + 30}},
+    )
+
+    assert grant_times(limiter, clock, 1, 'crm.contact.get') == [0]
+    assert grant_times(limiter, clock, 1, 'crm.deal.list') == [30]
+
+
+async def wait_in_queue(
+    limiter: AdaptiveRateLimiter,
+    priority: CallPriority,
+    name: str,
+    grants: list[str],
+) -> None:
+    """
+    Ожидание разрешения с записью порядка выдачи.
+
+    :param limiter: Ограничитель
+    :param priority: Класс приоритета запроса
+    :param name: Имя запроса
+    :param grants: Имена запросов в порядке получения разрешений
+    """
+    await limiter.acquire('crm.deal.list', priority)
+    grants.append(name)
+
+
+def spawn(
+    limiter: AdaptiveRateLimiter,
+    priority: CallPriority,
+    count: int,
+    grants: list[str],
+) -> list[asyncio.Task[None]]:
+    """
+    Постановка запросов одного класса в очередь.
+
+    :param limiter: Ограничитель
+    :param priority: Класс приоритета запросов
+    :param count: Количество запросов
+    :param grants: Имена запросов в порядке получения разрешений
+    :return: Задачи запросов
+    """
+    return [
+        asyncio.create_task(
+            wait_in_queue(limiter, priority, f'{priority.name[0]}{i}', grants),
+        )
+        for i in range(count)
+    ]
+
+
+def test_classes_are_served_by_weight(clock: VirtualClock) -> None:
+    """
+    Очереди обслуживаются пропорционально весам 16:4:1, внутри
+    класса - в порядке очереди.
+    """
+    grants: list[str] = []
+
+    async def scenario() -> None:
+        limiter = AdaptiveRateLimiter(rate=1.0, burst=1)
+        await limiter.acquire('crm.deal.list')
+        await asyncio.gather(
+            *spawn(limiter, CallPriority.INTERACTIVE, 40, grants),
+            *spawn(limiter, CallPriority.WRITE, 10, grants),
+            *spawn(limiter, CallPriority.BULK, 4, grants),
+        )
+
+    asyncio.run(scenario())
+
+    cycle = grants[grants.index('B1') + 1 : grants.index('B2') + 1]
+    assert [name[0] for name in cycle].count('I') == 16
+    assert [name[0] for name in cycle].count('W') == 4
+    assert [name[0] for name in cycle].count('B') == 1
+    for kind, count in (('I', 40), ('W', 10), ('B', 4)):
+        assert [name for name in grants if name[0] == kind] == [
+            f'{kind}{i}' for i in range(count)
+        ]
+
+
+def test_idle_class_does_not_save_up_grants(clock: VirtualClock) -> None:
+    """
+    Класс, не ожидавший разрешений, не получает их подряд
+    после появления запросов.
+    """
+    grants: list[str] = []
+
+    async def scenario() -> None:
+        limiter = AdaptiveRateLimiter(rate=1.0, burst=1)
+        await limiter.acquire('crm.deal.list')
+        interactive = spawn(limiter, CallPriority.INTERACTIVE, 60, grants)
+        while len(grants) < 40:
+            await asyncio.sleep(0)
+        bulk = spawn(limiter, CallPriority.BULK, 3, grants)
+        await asyncio.gather(*interactive, *bulk)
+
+    asyncio.run(scenario())
+
+    first_bulk = grants.index('B0')
+    assert grants[first_bulk + 1 : first_bulk + 17] == [
+        f'I{i}' for i in range(first_bulk, first_bulk + 16)
+    ]
+
+
+def test_cancelled_waiter_does_not_take_a_grant(clock: VirtualClock) -> None:
+    """
+    Отмененный запрос пропускается и не расходует разрешение.
+    """
+    grants: list[str] = []
+
+    async def scenario() -> float:
+        limiter = AdaptiveRateLimiter(rate=1.0, burst=1)
+        await limiter.acquire('crm.deal.list')
+        started_at = clock.now
+        tasks = spawn(limiter, CallPriority.INTERACTIVE, 3, grants)
+        await asyncio.sleep(0)
+        tasks[1].cancel()
+        await asyncio.gather(tasks[0], tasks[2])
+        return clock.now - started_at
+
+    elapsed = asyncio.run(scenario())
+
+    assert grants == ['I0', 'I2']
+    assert elapsed == pytest.approx(2.0)
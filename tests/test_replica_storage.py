@@ -0,0 +1,189 @@
+"""
+Тесты выборки записей из локальной реплики по фильтрам Bitrix24.
+"""
+
+import asyncio
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.infrastructure.replica.storage import (
+    ReplicaStorage,
+    UnsupportedFilterError,
+)
+
+CONTACTS = [
+    {
+        'ID': '1',
+        'NAME': 'Иван',
+        'LAST_NAME': 'Петров',
+        'TYPE_ID': 'CLIENT',
+        'OPPORTUNITY': 100,
+        'PHONE': [{'VALUE': '+79001112233', 'VALUE_TYPE': 'WORK'}],
+    },
+    {
+        'ID': '2',
+        'NAME': 'Анна',
+        'LAST_NAME': 'Иванова',
+        'TYPE_ID': 'PARTNER',
+        'OPPORTUNITY': 250,
+        'PHONE': [{'VALUE': '+79004445566', 'VALUE_TYPE': 'MOBILE'}],
+    },
+    {
+        'ID': '3',
+        'NAME': 'Петр',
+        'LAST_NAME': 'Сидоров_',
+        'OPPORTUNITY': 50,
+    },
+]
+
+DEALS = [
+    {'ID': '10', 'TITLE': 'Поставка'},
+    {'ID': '11', 'TITLE': 'Монтаж'},
+    {'ID': '12', 'TITLE': 'Сервис'},
+]
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> Iterator[ReplicaStorage]:
+    """
+    Реплика с контактами, сделками и связями между ними.
+
+    :param tmp_path: Временный каталог
+    :return: Хранилище реплики
+    """
+    replica = ReplicaStorage(tmp_path / 'replica.db')
+
+    async def fill() -> None:
+        await replica.upsert('contact', CONTACTS)
+        await replica.upsert('deal', DEALS)
+        await replica.set_deal_contacts({10: [1], 11: [1, 2], 12: []})
+
+    asyncio.run(fill())
+    yield replica
+    replica.close()
+
+
+def query_ids(
+    storage: ReplicaStorage,
+    entity_type: str,
+    filter_params: dict[str, Any],
+) -> list[int]:
+    """
+    Идентификаторы записей, выбранных по фильтру.
+
+    :param storage: Хранилище реплики
+    :param entity_type: Тип сущности
+    :param filter_params: Фильтр в синтаксисе Bitrix24
+    :return: Идентификаторы по возрастанию
+    """
+    items = asyncio.run(storage.query(entity_type, filter_params))
+    return [int(item['ID']) for item in items]
+
+
+@pytest.mark.parametrize(
+    ('filter_params', 'expected'),
+    [
+        ({'TYPE_ID': 'CLIENT'}, [1]),
+        ({'=TYPE_ID': ['CLIENT', 'PARTNER']}, [1, 2]),
+        ({'!TYPE_ID': 'CLIENT'}, [2, 3]),
+        ({'>OPPORTUNITY': 60}, [1, 2]),
+        ({'>=OPPORTUNITY': 100, '<OPPORTUNITY': 250}, [1]),
+        ({'<=OPPORTUNITY': 100}, [1, 3]),
+        ({'%LAST_NAME': 'иванов'}, [2]),
+        ({'%LAST_NAME': 'ов_'}, [3]),
+        ({'!%LAST_NAME': 'петров'}, [2, 3]),
+        ({'ID': [3, 1]}, [1, 3]),
+        ({'!ID': 2}, [1, 3]),
+        ({'>ID': 1}, [2, 3]),
+        ({'CHECK_PERMISSIONS': 'N', 'NAME': 'Анна'}, [2]),
+    ],
+)
+def test_field_filters(
+    storage: ReplicaStorage,
+    filter_params: dict[str, Any],
+    expected: list[int],
+) -> None:
+    """
+    Операторы фильтра по полям переводятся в условия SQL.
+    """
+    assert query_ids(storage, 'contact', filter_params) == expected
+
+
+@pytest.mark.parametrize(
+    ('filter_params', 'expected'),
+    [
+        ({'PHONE': '+79001112233'}, [1]),
+        ({'PHONE': ['+79001112233', '+79004445566']}, [1, 2]),
+        ({'!PHONE': '+79001112233'}, [2, 3]),
+    ],
+)
+def test_multi_field_filters(
+    storage: ReplicaStorage,
+    filter_params: dict[str, Any],
+    expected: list[int],
+) -> None:
+    """
+    Множественные поля сравниваются по любому из значений.
+    """
+    assert query_ids(storage, 'contact', filter_params) == expected
+
+
+@pytest.mark.parametrize(
+    ('filter_params', 'expected'),
+    [
+        ({'CONTACT_ID': 1}, [10, 11]),
+        ({'CONTACT_ID': [2]}, [11]),
+        ({'!CONTACT_ID': 1}, [12]),
+    ],
+)
+def test_deal_contact_filter(
+    storage: ReplicaStorage,
+    filter_params: dict[str, Any],
+    expected: list[int],
+) -> None:
+    """
+    Фильтр сделок по CONTACT_ID использует связи сделок с контактами.
+    """
+    assert query_ids(storage, 'deal', filter_params) == expected
+
+
+def test_search_matches_every_word(storage: ReplicaStorage) -> None:
+    """
+    `$SEARCH` находит записи, в полях которых есть каждое слово запроса.
+    """
+    assert query_ids(storage, 'contact', {'$SEARCH': 'иван петр'}) == [1]
+    assert query_ids(storage, 'deal', {'$SEARCH': 'монт'}) == [11]
+
+
+@pytest.mark.parametrize(
+    ('entity_type', 'filter_params'),
+    [
+        ('contact', {'>PHONE': '1'}),
+        ('contact', {'@ID': [1, 2]}),
+        ('contact', {'UF_CRM_1.VALUE': 1}),
+        ('deal', {'%CONTACT_ID': 1}),
+    ],
+)
+def test_unsupported_filters_are_rejected(
+    storage: ReplicaStorage,
+    entity_type: str,
+    filter_params: dict[str, Any],
+) -> None:
+    """
+    Фильтры, которые реплика не может выполнить, не выполняются частично.
+    """
+    with pytest.raises(UnsupportedFilterError):
+        asyncio.run(storage.query(entity_type, filter_params))
+
+
+def test_ordering_by_field(storage: ReplicaStorage) -> None:
+    """
+    Сортировка по полю дополняется сортировкой по ID.
+    """
+    items = asyncio.run(
+        storage.query('contact', order={'OPPORTUNITY': 'DESC'}),
+    )
+    assert [item['ID'] for item in items] == ['2', '1', '3']
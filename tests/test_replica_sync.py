@@ -0,0 +1,212 @@
+"""
+Тесты синхронизации локальной реплики с Bitrix24.
+"""
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from portal import FakePortal
+
+from src.infrastructure.bitrix.bitrix_contact_repository import (
+    BitrixContactRepository,
+)
+from src.infrastructure.bitrix.bitrix_deal_repository import (
+    BitrixDealRepository,
+)
+from src.infrastructure.bitrix.cache import EntityCache
+from src.infrastructure.bitrix.retry import RetryPolicy
+from src.infrastructure.replica.storage import ReplicaStorage
+from src.infrastructure.replica.sync import ReplicaSynchronizer
+
+
+def make_synchronizer(
+    portal: FakePortal,
+    storage: ReplicaStorage,
+    entity_cache: EntityCache | None = None,
+) -> tuple[ReplicaSynchronizer, BitrixContactRepository]:
+    """
+    Синхронизация реплики поверх портала в памяти.
+
+    :param portal: Портал
+    :param storage: Хранилище реплики
+    :param entity_cache: Кэш сущностей
+    :return: Синхронизация и репозиторий контактов
+    """
+    contacts = BitrixContactRepository(portal)
+    repositories: dict[str, Any] = {
+        'contact': contacts,
+        'deal': BitrixDealRepository(portal, contacts),
+    }
+    factory = SimpleNamespace(get_repository=repositories.__getitem__)
+    return (
+        ReplicaSynchronizer(storage, factory, entity_cache=entity_cache),
+        contacts,
+    )
+
+
+def deal_portal(count: int) -> FakePortal:
+    """
+    Портал со сделками от 1 до count, у каждой сделки один контакт
+    с идентификатором на 1000 больше.
+
+    :param count: Количество сделок
+    :return: Портал
+    """
+    return FakePortal(
+        records={
+            'crm.deal.list': [
+                {'ID': str(i), 'TITLE': f'Сделка {i}'}
+                for i in range(1, count + 1)
+            ],
+        },
+        handlers={
+            'crm.deal.contact.items.get': lambda params: [
+                {'CONTACT_ID': str(int(params['ID']) + 1000)},
+            ],
+        },
+    )
+
+
+def test_failed_contact_batch_keeps_links_and_watermark(tmp_path: Path) -> None:
+    """
+    Сбой пакета с контактами сделок не удаляет сохраненные связи
+    и не сдвигает отметку синхронизации.
+    """
+    storage = ReplicaStorage(tmp_path / 'replica.db')
+    portal = deal_portal(50)
+    synchronizer, contacts = make_synchronizer(portal, storage)
+    contacts._batch_max_commands = 20
+    contacts._read_retry_policy = RetryPolicy(max_attempts=1)
+    deal_ids = list(range(1, 51))
+
+    async def scenario() -> tuple[dict[int, list[int]], Any]:
+        await storage.set_deal_contacts({deal_id: [7] for deal_id in deal_ids})
+        portal.failing_commands = {'deal1'}
+        with pytest.raises(RuntimeError):
+            await synchronizer.sync_entity('deal')
+        return (
+            await storage.get_deal_contact_ids(deal_ids),
+            await storage.get_sync_state('deal'),
+        )
+
+    links, state = asyncio.run(scenario())
+
+    assert state is None
+    assert links == {
+        deal_id: [7] if deal_id <= 20 else [deal_id + 1000]
+        for deal_id in deal_ids
+    }
+    storage.close()
+
+
+def test_next_sync_replaces_links_after_failure(tmp_path: Path) -> None:
+    """
+    Следующая синхронизация загружает связи, не загруженные из-за сбоя.
+    """
+    storage = ReplicaStorage(tmp_path / 'replica.db')
+    portal = deal_portal(50)
+    synchronizer, contacts = make_synchronizer(portal, storage)
+    contacts._batch_max_commands = 20
+    contacts._read_retry_policy = RetryPolicy(max_attempts=1)
+    deal_ids = list(range(1, 51))
+
+    async def scenario() -> dict[int, list[int]]:
+        portal.failing_commands = {'deal1'}
+        with pytest.raises(RuntimeError):
+            await synchronizer.sync_entity('deal')
+        portal.failing_commands.clear()
+        assert await synchronizer.sync_entity('deal') == 50
+        return await storage.get_deal_contact_ids(deal_ids)
+
+    links = asyncio.run(scenario())
+
+    assert storage.is_ready('deal')
+    assert links == {deal_id: [deal_id + 1000] for deal_id in deal_ids}
+    storage.close()
+
+
+def contact_portal(contact_ids: list[int]) -> FakePortal:
+    """
+    Портал с контактами с заданными идентификаторами.
+
+    :param contact_ids: Идентификаторы контактов
+    :return: Портал
+    """
+    return FakePortal(
+        {'crm.contact.list': [{'ID': str(i)} for i in contact_ids]},
+    )
+
+
+def test_reconcile_deletes_missing_records(tmp_path: Path) -> None:
+    """
+    Записи, которых нет в Bitrix24, удаляются из реплики и из кэша.
+    """
+    storage = ReplicaStorage(tmp_path / 'replica.db')
+    remote_ids = [i for i in range(1, 121) if i not in {3, 60, 120}]
+    cache = EntityCache()
+    cache.set('contact', 60, 'stale')
+    synchronizer, _ = make_synchronizer(
+        contact_portal(remote_ids),
+        storage,
+        entity_cache=cache,
+    )
+
+    async def scenario() -> tuple[int, list[int], list[int]]:
+        await storage.upsert(
+            'contact',
+            [{'ID': str(i)} for i in range(1, 121)],
+        )
+        deleted = await synchronizer.reconcile_entity('contact')
+        return (
+            deleted,
+            list(await storage.get_ids('contact')),
+            await storage.get_deleted_ids('contact'),
+        )
+
+    deleted, local_ids, tombstones = asyncio.run(scenario())
+
+    assert deleted == 3
+    assert local_ids == remote_ids
+    assert tombstones == [3, 60, 120]
+    assert cache.get('contact', 60) is None
+    storage.close()
+
+
+def test_reconcile_ignores_records_added_after_sync(tmp_path: Path) -> None:
+    """
+    Записи Bitrix24, которых еще нет в реплике, ничего не удаляют.
+    """
+    storage = ReplicaStorage(tmp_path / 'replica.db')
+    synchronizer, _ = make_synchronizer(contact_portal([1, 2, 5, 8]), storage)
+
+    async def scenario() -> tuple[int, list[int]]:
+        await storage.upsert('contact', [{'ID': '2'}, {'ID': '5'}])
+        deleted = await synchronizer.reconcile_entity('contact')
+        return deleted, list(await storage.get_ids('contact'))
+
+    assert asyncio.run(scenario()) == (0, [2, 5])
+    storage.close()
+
+
+def test_reconcile_skips_suspicious_mass_deletion(tmp_path: Path) -> None:
+    """
+    Если отсутствующими оказалось больше половины записей,
+    сверка ничего не удаляет.
+    """
+    storage = ReplicaStorage(tmp_path / 'replica.db')
+    synchronizer, _ = make_synchronizer(contact_portal([1, 2, 3, 4]), storage)
+
+    async def scenario() -> tuple[int, list[int], list[int]]:
+        await storage.upsert('contact', [{'ID': str(i)} for i in range(1, 11)])
+        deleted = await synchronizer.reconcile_entity('contact')
+        return (
+            deleted,
+            list(await storage.get_ids('contact')),
+            await storage.get_deleted_ids('contact'),
+        )
+
+    assert asyncio.run(scenario()) == (0, list(range(1, 11)), [])
+    storage.close()
@@ -0,0 +1,239 @@
+"""
+Тесты поисковых индексов локальной реплики.
+"""
+
+import math
+
+import pytest
+
+from src.infrastructure.replica.search import (
+    LookupIndex,
+    TokenIndex,
+    TrigramIndex,
+    normalize_email,
+    normalize_phone,
+)
+
+
+def contact(first_name: str, last_name: str = '') -> dict[str, str]:
+    """
+    Запись контакта с именем и фамилией.
+
+    :param first_name: Имя
+    :param last_name: Фамилия
+    :return: Запись в формате API
+    """
+    return {'NAME': first_name, 'LAST_NAME': last_name}
+
+
+def name_index(*names: tuple[str, str]) -> TokenIndex:
+    """
+    Индекс по имени и фамилии с контактами от ID 1.
+
+    :param names: Имена и фамилии контактов
+    :return: Индекс
+    """
+    index = TokenIndex(('NAME', 'LAST_NAME'))
+    for entity_id, (first_name, last_name) in enumerate(names, start=1):
+        index.add(entity_id, contact(first_name, last_name))
+    index.prepare()
+    return index
+
+
+def test_token_index_requires_every_word() -> None:
+    """
+    Каждое слово запроса должно совпасть со словом или началом слова.
+    """
+    index = name_index(
+        ('Иван', 'Петров'),
+        ('Иван', 'Сидоров'),
+        ('Петр', 'Иванов'),
+    )
+
+    assert index.search('иван петров') == [1]
+    assert index.search('ив сид') == [2]
+    assert index.search('иван кузнецов') == []
+
+
+def test_token_index_ranks_exact_words_first() -> None:
+    """
+    Полное совпадение слова выше совпадения по началу, при равной
+    оценке выше запись с меньшим ID.
+    """
+    index = name_index(
+        ('Иванна', ''),
+        ('Иван', ''),
+        ('Иванович', ''),
+        ('Иван', 'Петров'),
+    )
+
+    assert index.search('иван') == [2, 4, 1, 3]
+    assert index.search('иван', limit=2) == [2, 4]
+
+
+def test_token_index_folds_case_and_yo() -> None:
+    """
+    Регистр и буква ё не влияют на поиск.
+    """
+    index = name_index(('Пётр', 'ФЁДОРОВ'))
+
+    assert index.search('ПЕТР федоров') == [1]
+
+
+def test_token_index_follows_updates() -> None:
+    """
+    Замена и удаление записей после подготовки индекса сразу
+    учитываются в поиске.
+    """
+    index = name_index(('Иван', 'Петров'), ('Анна', 'Смирнова'))
+
+    index.add(1, contact('Игорь', 'Петров'))
+    index.add(3, contact('Аркадий', ''))
+    index.remove(2)
+
+    assert index.search('иван') == []
+    assert index.search('игорь') == [1]
+    assert index.search('ар') == [3]
+    assert index.search('анна') == []
+    assert len(index) == 2
+
+
+@pytest.mark.parametrize(
+    ('value', 'expected'),
+    [
+        ('+7 (912) 000-00-00', '+79120000000'),
+        ('8 912 000 00 00', '+79120000000'),
+        ('9120000000', '+79120000000'),
+        ('0049 30 1234567', '+49301234567'),
+        ('+49 30 1234567', '+49301234567'),
+        ('12-34', None),
+        ('', None),
+    ],
+)
+def test_normalize_phone(value: str, expected: str | None) -> None:
+    """
+    Номера телефонов приводятся к формату E.164.
+    """
+    assert normalize_phone(value) == expected
+
+
+def test_normalize_email() -> None:
+    """
+    Email сравнивается без учета регистра и пробелов по краям.
+    """
+    assert normalize_email(' Ivan@Example.COM ') == 'ivan@example.com'
+    assert normalize_email('нет адреса') is None
+
+
+def phones(*values: str) -> dict[str, list[dict[str, str]]]:
+    """
+    Запись с мультиполем PHONE.
+
+    :param values: Номера телефонов
+    :return: Запись в формате API
+    """
+    return {
+        'PHONE': [{'VALUE': value, 'VALUE_TYPE': 'WORK'} for value in values],
+    }
+
+
+def test_lookup_index_matches_any_phone_format() -> None:
+    """
+    Запись находится по любому написанию любого из ее номеров.
+    """
+    index = LookupIndex('PHONE', normalize_phone)
+    index.add(5, phones('+7 (912) 000-00-00', '8 495 111 22 33'))
+    index.add(2, phones('89120000000'))
+    index.add(7, {'PHONE': [{'VALUE': 'не номер'}]})
+
+    assert index.search('9120000000') == [2, 5]
+    assert index.search('+7 495 111-22-33') == [5]
+    assert index.search('9120000000', limit=1) == [2]
+    assert index.search('не номер') == []
+    assert len(index) == 2
+
+
+def test_lookup_index_follows_updates() -> None:
+    """
+    Замена и удаление записи убирают ее старые значения из индекса.
+    """
+    index = LookupIndex('EMAIL', normalize_email)
+    index.add(1, {'EMAIL': [{'VALUE': 'old@example.com'}]})
+    index.add(2, {'EMAIL': [{'VALUE': 'shared@example.com'}]})
+    index.add(3, {'EMAIL': [{'VALUE': 'Shared@Example.com'}]})
+
+    index.add(1, {'EMAIL': [{'VALUE': 'new@example.com'}]})
+    index.remove(3)
+
+    assert index.search('old@example.com') == []
+    assert index.search('NEW@example.com') == [1]
+    assert index.search('shared@example.com') == [2]
+
+
+def title_index(*titles: str) -> TrigramIndex:
+    """
+    Индекс триграмм по названиям сделок с ID от 1.
+
+    :param titles: Названия сделок
+    :return: Индекс
+    """
+    index = TrigramIndex(('TITLE',), lambda item: item.get('TITLE'))
+    for entity_id, title in enumerate(titles, start=1):
+        index.add(entity_id, {'TITLE': title})
+    return index
+
+
+def test_trigram_index_tolerates_typos() -> None:
+    """
+    Запрос с опечаткой находит запись, более похожие записи выше.
+    """
+    index = title_index(
+        'Поставка оборудования',
+        'Поставка',
+        'Монтаж оборудования',
+        'Сервисное обслуживание',
+    )
+
+    assert index.search('поставко') == [2, 1]
+    assert index.search('оборудованя') == [3, 1]
+    assert index.search('ремонт') == []
+
+
+def test_trigram_index_matches_brute_force() -> None:
+    """
+    Отбор кандидатов по редким триграммам не теряет записи,
+    найденные полным перебором.
+    """
+    titles = [
+        f'{prefix} {suffix}'
+        for prefix in ('Поставка', 'Доставка', 'Установка', 'Постановка')
+        for suffix in ('окон', 'оконных блоков', 'дверей', 'ворот')
+    ]
+    index = title_index(*titles)
+
+    for query in ('поставка окон', 'доставка дверей', 'становка', 'ворота'):
+        query_trigrams = TrigramIndex.trigrams(query)
+        required = math.ceil(
+            TrigramIndex._min_similarity * len(query_trigrams),
+        )
+        expected = {
+            entity_id
+            for entity_id, title in enumerate(titles, start=1)
+            if len(query_trigrams & TrigramIndex.trigrams(title)) >= required
+        }
+        assert set(index.search(query, limit=-1)) == expected
+
+
+def test_trigram_index_follows_updates() -> None:
+    """
+    Замена и удаление записи сразу учитываются в поиске.
+    """
+    index = title_index('Поставка', 'Монтаж')
+
+    index.add(1, {'TITLE': 'Ремонт'})
+    index.remove(2)
+
+    assert index.search('поставка') == []
+    assert index.search('монтаж') == []
+    assert index.search('ремонт') == [1]
+    assert len(index) == 1
@@ -0,0 +1,318 @@
+"""
+Тесты классификации ошибок запросов к API Bitrix24.
+
+Клиент fast_bitrix24 сам повторяет запросы после сетевых ошибок
+и ответов 5XX, а исчерпав попытки, выбрасывает RuntimeError, исходная
+ошибка которого доступна только как причина (`__cause__`). Заглушка
+клиента выбрасывает исключения той же формы.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from aiohttp import ClientConnectorError, ClientResponseError, RequestInfo
+from fast_bitrix24.srh import ServerError
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from src.infrastructure.bitrix.bitrix_contact_repository import (
+    BitrixContactRepository,
+)
+from src.infrastructure.bitrix.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+)
+from src.infrastructure.bitrix.rate_limiter import is_query_limit_exceeded
+from src.infrastructure.bitrix.retry import RetryPolicy, is_retryable_error
+
+WEBHOOK = URL('https://example.bitrix24.ru/rest/1/token/')
+
+
+def exhausted(error: BaseException) -> RuntimeError:
+    """
+    Исключение клиента после исчерпания собственных попыток.
+
+    :param error: Исключение последней попытки
+    :return: RuntimeError с исключением последней попытки в качестве причины
+    """
+    try:
+        try:
+            raise error
+        except BaseException as cause:
+            raise RuntimeError(
+                'All attempts to get data from server exhausted',
+            ) from cause
+    except RuntimeError as wrapped:
+        return wrapped
+
+
+def http_error(status: int) -> ClientResponseError:
+    """
+    Ошибка HTTP, как ее выбрасывает сессия с `raise_for_status`.
+
+    :param status: Код ответа
+    :return: Исключение aiohttp
+    """
+    info = RequestInfo(
+        WEBHOOK,
+        'POST',
+        CIMultiDictProxy(CIMultiDict()),
+        WEBHOOK,
+    )
+    return ClientResponseError(info, (), status=status, message='error')
+
+
+def server_error(status: int) -> ServerError:
+    """
+    Ошибка 5XX, как ее выбрасывает клиент fast_bitrix24.
+
+    :param status: Код ответа
+    :return: ServerError с ошибкой HTTP в качестве причины
+    """
+    try:
+        try:
+            raise http_error(status)
+        except ClientResponseError as cause:
+            raise ServerError('The server returned an error') from cause
+    except ServerError as wrapped:
+        return wrapped
+
+
+def connector_error() -> ClientConnectorError:
+    """
+    Ошибка подключения к порталу.
+
+    :return: Исключение aiohttp
+    """
+    connection_key = SimpleNamespace(host=WEBHOOK.host, port=443, ssl=True)
+    return ClientConnectorError(
+        connection_key,
+        OSError(111, 'Connection refused'),
+    )
+
+
+class StubBitrix:
+    """
+    Заглушка клиента Bitrix24, выбрасывающая заданные исключения.
+    """
+
+    def __init__(self, errors: list[BaseException]):
+        """
+        Инициализация заглушки.
+
+        :param errors: Исключения первых попыток, после них запрос успешен
+        """
+        self.errors = list(errors)
+        self.calls = 0
+
+    async def call(self, method: str, items: Any = None, raw: bool = False):
+        """
+        Вызов метода API.
+
+        :param method: Метод API
+        :param items: Параметры вызова
+        :param raw: Вернуть ответ API целиком
+        :return: Ответ API
+        """
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return {'result': {'ID': '1'}} if raw else {'ID': '1'}
+
+
+def make_repository(
+    errors: list[BaseException],
+    circuit_breaker: CircuitBreaker | None = None,
+) -> BitrixContactRepository:
+    """
+    Создание репозитория с заглушкой клиента и повторами без пауз.
+
+    :param errors: Исключения первых попыток
+    :param circuit_breaker: Выключатель запросов
+    :return: Репозиторий контактов
+    """
+    repository = BitrixContactRepository(
+        StubBitrix(errors),
+        circuit_breaker=circuit_breaker,
+    )
+    repository._read_retry_policy = RetryPolicy(
+        base_delay=0,
+        limit_exceeded_delay=0,
+    )
+    repository._write_retry_policy = RetryPolicy(
+        base_delay=0,
+        limit_exceeded_delay=0,
+        retry_errors=False,
+    )
+    return repository
+
+
+@pytest.mark.parametrize(
+    'error',
+    [
+        exhausted(connector_error()),
+        exhausted(server_error(502)),
+        exhausted(server_error(503)),
+        exhausted(asyncio.TimeoutError()),
+        connector_error(),
+        asyncio.TimeoutError(),
+    ],
+)
+def test_transport_errors_are_retryable(error: BaseException) -> None:
+    """
+    Сетевые ошибки, таймауты и ответы 5XX распознаются по цепочке причин.
+    """
+    assert is_retryable_error(error)
+
+
+@pytest.mark.parametrize(
+    'error',
+    [
+        http_error(400),
+        exhausted(ValueError('bad value')),
+        RuntimeError('All attempts to get data from server exhausted'),
+    ],
+)
+def test_other_errors_are_not_retryable(error: BaseException) -> None:
+    """
+    Ответы портала с ошибкой и ошибки без сетевой причины не повторяются.
+    """
+    assert not is_retryable_error(error)
+
+
+def test_query_limit_exceeded_is_detected_by_status() -> None:
+    """
+    QUERY_LIMIT_EXCEEDED распознается по коду 503 в цепочке причин.
+    """
+    assert is_query_limit_exceeded(exhausted(server_error(503)))
+    assert not is_query_limit_exceeded(exhausted(server_error(500)))
+    assert not is_query_limit_exceeded(exhausted(connector_error()))
+
+
+@pytest.mark.parametrize(
+    'error',
+    [
+        exhausted(connector_error()),
+        exhausted(server_error(500)),
+        exhausted(asyncio.TimeoutError()),
+    ],
+)
+def test_read_call_is_retried_after_transport_error(
+    error: BaseException,
+) -> None:
+    """
+    Вызов чтения повторяется после сбоя и возвращает ответ.
+    """
+    repository = make_repository([error, error])
+
+    result = asyncio.run(repository._call('crm.contact.get', {'ID': 1}))
+
+    assert result == {'ID': '1'}
+    assert repository._bitrix.calls == 3
+
+
+def test_write_call_is_not_retried_after_transport_error() -> None:
+    """
+    Вызов изменения не повторяется: запрос мог быть выполнен.
+    """
+    repository = make_repository([exhausted(connector_error())])
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(repository._call('crm.contact.update', {'ID': 1}))
+
+    assert repository._bitrix.calls == 1
+
+
+def test_write_call_is_retried_after_query_limit_exceeded() -> None:
+    """
+    Вызов изменения повторяется после QUERY_LIMIT_EXCEEDED.
+    """
+    repository = make_repository([exhausted(server_error(503))])
+
+    result = asyncio.run(repository._call('crm.contact.update', {'ID': 1}))
+
+    assert result == {'ID': '1'}
+    assert repository._bitrix.calls == 2
+
+
+def test_call_is_not_retried_after_client_error() -> None:
+    """
+    Ответ 4XX означает ошибку запроса, а не сбой, и не повторяется.
+    """
+    repository = make_repository([http_error(400)])
+
+    with pytest.raises(ClientResponseError):
+        asyncio.run(repository._call('crm.contact.get', {'ID': 1}))
+
+    assert repository._bitrix.calls == 1
+
+
+async def call_repeatedly(
+    repository: BitrixContactRepository,
+    times: int,
+) -> list[type[BaseException]]:
+    """
+    Несколько вызовов изменения, каждый из одной попытки.
+
+    :param repository: Репозиторий
+    :param times: Количество вызовов
+    :return: Типы исключений вызовов
+    """
+    raised = []
+    for _ in range(times):
+        try:
+            await repository._call('crm.contact.update', {'ID': 1})
+        except Exception as e:
+            raised.append(type(e))
+    return raised
+
+
+def test_breaker_opens_after_exhausted_transport_errors() -> None:
+    """
+    Исчерпание попыток клиентом считается неудачным запросом.
+    """
+    breaker = CircuitBreaker(min_calls=5)
+    repository = make_repository(
+        [exhausted(connector_error()) for _ in range(6)],
+        circuit_breaker=breaker,
+    )
+
+    raised = asyncio.run(call_repeatedly(repository, 6))
+
+    assert breaker.is_open
+    assert raised == [RuntimeError] * 5 + [CircuitOpenError]
+    assert repository._bitrix.calls == 5
+
+
+def test_breaker_counts_unclassified_errors_as_failures() -> None:
+    """
+    Исключение без признаков ответа портала считается неудачным запросом.
+    """
+    breaker = CircuitBreaker(min_calls=5)
+    repository = make_repository(
+        [RuntimeError('unexpected') for _ in range(5)],
+        circuit_breaker=breaker,
+    )
+
+    asyncio.run(call_repeatedly(repository, 5))
+
+    assert breaker.is_open
+
+
+def test_breaker_stays_closed_when_portal_answers() -> None:
+    """
+    Ответы портала с ошибкой означают, что портал доступен.
+    """
+    breaker = CircuitBreaker(min_calls=5)
+    repository = make_repository(
+        [http_error(400) for _ in range(3)]
+        + [exhausted(server_error(503)) for _ in range(3)],
+        circuit_breaker=breaker,
+    )
+    repository._write_retry_policy = RetryPolicy(max_attempts=1)
+
+    asyncio.run(call_repeatedly(repository, 6))
+
+    assert not breaker.is_open